@@ -43,7 +43,10 @@ async def _build_app(args: argparse.Namespace):
 def main() -> None:
     args = parse_args()
     app = asyncio.run(_build_app(args))
-    uvicorn.run(app, host=args.host, port=args.port, log_level="info")
+    # Backtests schedule a task, thread hop and heartbeat wait per solve;
+    # "auto" picks uvloop when installed, matching the main app's use_uvloop
+    loop = "auto" if app.state.config.use_uvloop else "asyncio"
+    uvicorn.run(app, host=args.host, port=args.port, log_level="info", loop=loop)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,59 @@
+"""Per-tick energy flow split: instantaneous power × tick interval → Wh buckets."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TickEnergy:
+    """Whole-Wh energy attributed to each accounting flow for one tick."""
+
+    grid_import_wh: int = 0
+    grid_charge_wh: int = 0  # Portion of grid import that went into the battery
+    grid_export_wh: int = 0
+    solar_charge_wh: int = 0
+    self_consumption_wh: int = 0  # Load served by PV/battery instead of grid
+
+
+def split_tick_energy(
+    grid_w: float,
+    solar_w: float,
+    battery_w: float,
+    load_w: float,
+    tick_hours: float,
+) -> TickEnergy:
+    """Split one telemetry reading into accounting energy flows.
+
+    Sign conventions follow Telemetry: grid_w positive = import,
+    battery_w positive = charging.  Pure arithmetic so the per-tick
+    callback only dispatches the non-zero buckets to the engine.
+    """
+    grid_import_wh = 0
+    grid_charge_wh = 0
+    grid_export_wh = 0
+    solar_charge_wh = 0
+    self_consumption_wh = 0
+
+    if grid_w > 0:
+        grid_import_wh = round(grid_w * tick_hours)
+        # Battery charging while importing is attributed to the grid
+        if battery_w > 0:
+            grid_charge_wh = round(min(battery_w, grid_w) * tick_hours)
+    else:
+        if grid_w < 0:
+            grid_export_wh = round(-grid_w * tick_hours)
+        if battery_w > 0 and solar_w > 0:
+            solar_charge_wh = round(min(battery_w, solar_w) * tick_hours)
+        if load_w > 0:
+            self_consumption_wh = round(
+                min(load_w, solar_w + max(0, -battery_w)) * tick_hours
+            )
+
+    return TickEnergy(
+        grid_import_wh=grid_import_wh,
+        grid_charge_wh=grid_charge_wh,
+        grid_export_wh=grid_export_wh,
+        solar_charge_wh=solar_charge_wh,
+        self_consumption_wh=self_consumption_wh,
+    )
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 from power_master.accounting.billing_cycle import BillingCycleManager, BillingCycleSummary
 from power_master.accounting.cost_basis import CostBasisTracker
@@ -59,10 +60,20 @@ class AccountingEngine:
         self._provider_type = config.providers.tariff.type if hasattr(config.providers.tariff, 'type') else "amber"
         # TOU supply charge state: tracks daily supply charge to avoid double-counting in cost reporting
         self._daily_supply_charge_recorded: dict = {}  # {YYYY-MM-DD: cents}
+        # Batched mode: writes staged here and drained by the app's batch writer
+        self._batched = False
+        self._pending_events: list[dict[str, Any]] = []
+        self._pending_kv: dict[str, Any] = {}
 
-    async def init_persistence(self, repo) -> None:
-        """Load persisted accounting state and wire up auto-save."""
+    async def init_persistence(self, repo, batched: bool = False) -> None:
+        """Load persisted accounting state and wire up auto-save.
+
+        When *batched*, events and kv state are staged in memory instead of
+        committed one by one; the owner drains them with drain_staged() and
+        writes them alongside buffered telemetry in a single commit.
+        """
         self._repo = repo
+        self._batched = batched
 
         # Ensure kv_store table exists (handles existing DBs pre-migration)
         await repo.db.execute("""
@@ -130,7 +141,10 @@ class AccountingEngine:
         import asyncio
 
         def _on_wacb_change(state):
-            asyncio.ensure_future(self._save_wacb(state))
+            if self._batched:
+                self._pending_kv[KV_WACB_KEY] = self._wacb_payload(state)
+            else:
+                asyncio.ensure_future(self._save_wacb(state))
 
         self._cost_basis.set_on_change(_on_wacb_change)
 
@@ -139,35 +153,58 @@ class AccountingEngine:
         if self._repo is None:
             return
         try:
-            await self._repo.kv_set(KV_WACB_KEY, {
-                "wacb_cents": state.wacb_cents,
-                "stored_wh": state.stored_wh,
-                "total_charged_wh": state.total_charged_wh,
-                "total_cost_cents": state.total_cost_cents,
-            })
+            await self._repo.kv_set(KV_WACB_KEY, self._wacb_payload(state))
         except Exception:
             logger.warning("Failed to persist WACB state", exc_info=True)
 
+    @staticmethod
+    def _wacb_payload(state) -> dict[str, float]:
+        return {
+            "wacb_cents": state.wacb_cents,
+            "stored_wh": state.stored_wh,
+            "total_charged_wh": state.total_charged_wh,
+            "total_cost_cents": state.total_cost_cents,
+        }
+
+    def _billing_payload(self) -> dict[str, Any] | None:
+        cycle = self._billing.current
+        if cycle is None:
+            return None
+        return {
+            "cycle_start": cycle.cycle_start.isoformat(),
+            "total_import_cost_cents": cycle.total_import_cost_cents,
+            "total_export_revenue_cents": cycle.total_export_revenue_cents,
+            "total_self_consumption_value_cents": cycle.total_self_consumption_value_cents,
+            "total_arbitrage_profit_cents": cycle.total_arbitrage_profit_cents,
+            "total_fixed_costs_cents": cycle.total_fixed_costs_cents,
+            "net_cost_cents": cycle.net_cost_cents,
+        }
+
     async def _save_billing_cycle(self) -> None:
         """Persist current billing cycle totals."""
         if self._repo is None:
             return
-        cycle = self._billing.current
-        if cycle is None:
+        payload = self._billing_payload()
+        if payload is None:
             return
         try:
-            await self._repo.kv_set(KV_BILLING_KEY, {
-                "cycle_start": cycle.cycle_start.isoformat(),
-                "total_import_cost_cents": cycle.total_import_cost_cents,
-                "total_export_revenue_cents": cycle.total_export_revenue_cents,
-                "total_self_consumption_value_cents": cycle.total_self_consumption_value_cents,
-                "total_arbitrage_profit_cents": cycle.total_arbitrage_profit_cents,
-                "total_fixed_costs_cents": cycle.total_fixed_costs_cents,
-                "net_cost_cents": cycle.net_cost_cents,
-            })
+            await self._repo.kv_set(KV_BILLING_KEY, payload)
         except Exception:
             logger.warning("Failed to persist billing cycle", exc_info=True)
 
+    @staticmethod
+    def _event_row(event: AccountingEvent) -> dict[str, Any]:
+        return {
+            "event_type": event.event_type,
+            "started_at": event.timestamp.isoformat(),
+            "energy_wh": event.energy_wh,
+            "cost_cents": event.cost_cents,
+            "rate_cents": int(event.rate_cents),
+            "cost_basis_cents": event.cost_basis_cents,
+            "profit_loss_cents": event.profit_loss_cents,
+            "provider_type": event.provider_type,
+        }
+
     async def _persist_event(self, event: AccountingEvent) -> None:
         """Write an accounting event to the database."""
         if self._repo is None:
@@ -185,6 +222,29 @@ class AccountingEngine:
         except Exception:
             logger.warning("Failed to persist accounting event", exc_info=True)
 
+    async def _persist(self, event: AccountingEvent) -> None:
+        """Persist an event and the billing totals it changed (or stage both)."""
+        if self._batched:
+            self._pending_events.append(self._event_row(event))
+            payload = self._billing_payload()
+            if payload is not None:
+                self._pending_kv[KV_BILLING_KEY] = payload
+            return
+        await self._persist_event(event)
+        await self._save_billing_cycle()
+
+    def drain_staged(self) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Take all staged event rows and kv state for a batched write."""
+        events, kv = self._pending_events, self._pending_kv
+        self._pending_events, self._pending_kv = [], {}
+        return events, kv
+
+    def restore_staged(self, events: list[dict[str, Any]], kv: dict[str, Any]) -> None:
+        """Put back writes from a failed batch without clobbering newer kv state."""
+        self._pending_events[:0] = events
+        for key, value in kv.items():
+            self._pending_kv.setdefault(key, value)
+
     def set_provider_type(self, provider_type: str) -> None:
         """Set the active provider type for subsequent accounting events.
 
@@ -218,8 +278,7 @@ class AccountingEngine:
         cycle = self._billing.get_or_create_cycle()
         self._billing.record_import(event.cost_cents)
 
-        await self._persist_event(event)
-        await self._save_billing_cycle()
+        await self._persist(event)
         return event
 
     def record_grid_charge(self, energy_wh: int, rate_cents: float) -> None:
@@ -242,8 +301,7 @@ class AccountingEngine:
         if event.profit_loss_cents > 0:
             self._billing.record_arbitrage_profit(event.profit_loss_cents)
 
-        await self._persist_event(event)
-        await self._save_billing_cycle()
+        await self._persist(event)
         return event
 
     async def record_self_consumption(self, energy_wh: int, avoided_rate_cents: float) -> AccountingEvent:
@@ -254,8 +312,7 @@ class AccountingEngine:
         cycle = self._billing.get_or_create_cycle()
         self._billing.record_self_consumption(abs(event.cost_cents))
 
-        await self._persist_event(event)
-        await self._save_billing_cycle()
+        await self._persist(event)
         return event
 
     def sync_soc(self, soc: float) -> None:
@@ -66,6 +66,13 @@ class PlanningConfig(BaseModel):
     soc_deviation_tolerance: float = Field(0.05, ge=0.0, le=1.0)
     soc_deviation_cooldown_seconds: int = 300
     solver_timeout_seconds: int = 25
+    # MILP backend: "highs" runs in-process via highspy when it is installed,
+    # otherwise the planner falls back to the bundled CBC
+    solver: Literal["cbc", "highs"] = "cbc"
+    # Rolling horizon: pin SOC in the last N slots of a rebuild to the
+    # previous plan's trajectory (0 = re-optimise the whole horizon).
+    # Storm and SOC-deviation rebuilds always re-optimise everything.
+    fix_tail_slots: int = Field(0, ge=0)
     rebuild_on_forecast_staleness: bool | None = Field(
         default=None,
         description="Rebuild the plan when forecast data is stale (age-based). "
@@ -974,6 +981,9 @@ class MQTTConfig(BaseModel):
     password: str = ""
     topic_prefix: str = "power_master"
     publish_interval_seconds: int = 5
+    # Hold publishes and send each topic's latest value once per interval
+    # (0 = send immediately).  Off by default: values reach the broker late.
+    coalesce_interval_seconds: float = Field(0, ge=0)
     ha_discovery_enabled: bool = True
     ha_discovery_prefix: str = "homeassistant"
 
@@ -1144,6 +1154,7 @@ class LoggingConfig(BaseModel):
     level: str = "INFO"
     format: str = "json"
     file: str = ""
+    asyncio_debug: bool = False  # asyncio debug mode: log callbacks slower than 50ms
 
 
 class DBConfig(BaseModel):
@@ -1232,6 +1243,7 @@ class AppConfig(BaseModel):
 
     setup_completed: bool = False  # Set True after initial setup wizard completes
     auto_update_stable: bool = False  # Automatically update when a stable release is detected
+    use_uvloop: bool = True  # Run on uvloop when installed (takes effect on restart)
     battery: BatteryConfig = BatteryConfig()
     load_profile: LoadProfileConfig = LoadProfileConfig()
     planning: PlanningConfig = PlanningConfig()
@@ -20,6 +20,16 @@ TELEMETRY_BUFFER_MAX_RECORDS = 10
 # Maximum age of telemetry buffer before forced flush in seconds
 TELEMETRY_BUFFER_FLUSH_SECONDS = 30
 
+# ─── Event Loop Health ──────────────────────────────────────────────────────
+# Lag probe sleep in seconds (any overshoot is time the loop was blocked)
+LOOP_LAG_PROBE_SECONDS = 1.0
+
+# Window over which the worst lag is reported (log + MQTT) in seconds
+LOOP_LAG_REPORT_SECONDS = 60
+
+# Worst-lag threshold for a warning log in seconds
+LOOP_LAG_WARN_SECONDS = 0.05
+
 # ─── Database & Persistence ─────────────────────────────────────────────────
 # Interval for storing telemetry to database in seconds
 DB_STORE_INTERVAL_SECONDS = 60
@@ -27,6 +37,9 @@ DB_STORE_INTERVAL_SECONDS = 60
 # Interval for flushing historical data in seconds
 HISTORY_FLUSH_INTERVAL_SECONDS = 1800  # 30 minutes
 
+# Interval for rebuilding the historic load profile from the DB in seconds
+LOAD_PROFILE_REFRESH_SECONDS = 21600  # 6 hours
+
 # ─── Load Management ────────────────────────────────────────────────────────
 # Load polling interval in seconds
 LOAD_POLL_INTERVAL_SECONDS = 30
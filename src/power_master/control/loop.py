@@ -132,7 +132,12 @@ class ControlLoop:
 
         try:
             while not self._stop_event.is_set():
-                await self._tick()
+                try:
+                    await self._tick()
+                except Exception:
+                    # One bad tick must not end dispatch (or, via the task
+                    # group, the rest of the application)
+                    logger.exception("Control loop tick %d failed", self._state.tick_count)
                 # Sleep until the interval elapses, a stop is requested, or an
                 # immediate re-tick is requested (e.g. a schedule change saved
                 # from the UI so it applies without waiting for the next tick).
@@ -16,6 +16,61 @@ def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+_TELEMETRY_INSERT_SQL = """INSERT INTO telemetry
+   (recorded_at, soc, battery_power_w, solar_power_w, grid_power_w,
+    load_power_w, battery_voltage, battery_temp_c, inverter_mode,
+    grid_available, raw_data_json)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Positional layout accepted by store_telemetry_row / store_telemetry_rows:
+# (soc, battery_power_w, solar_power_w, grid_power_w, load_power_w,
+#  battery_voltage, battery_temp_c, inverter_mode, grid_available, raw_data)
+TelemetryRow = tuple[Any, ...]
+
+
+_ACCOUNTING_EVENT_INSERT_SQL = """INSERT INTO accounting_events
+   (event_type, started_at, energy_wh, cost_cents, rate_cents,
+    cost_basis_cents, profit_loss_cents, billing_cycle_id, plan_id, notes, provider_type)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_PLAN_SLOT_INSERT_SQL = """INSERT INTO plan_slots
+   (plan_id, slot_index, slot_start, slot_end, operating_mode,
+    target_power_w, expected_soc, import_rate_cents, export_rate_cents,
+    solar_forecast_w, load_forecast_w, scheduled_loads_json, constraint_flags)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+_KV_UPSERT_SQL = """INSERT INTO kv_store (key, value_json, updated_at)
+   VALUES (?, ?, ?)
+   ON CONFLICT(key) DO UPDATE SET value_json = excluded.value_json,
+                                  updated_at = excluded.updated_at"""
+
+
+def _bind_telemetry_row(recorded_at: str, row: TelemetryRow) -> tuple:
+    """Prefix a timestamp and encode the trailing bool/JSON columns."""
+    (soc, battery_power_w, solar_power_w, grid_power_w, load_power_w,
+     battery_voltage, battery_temp_c, inverter_mode, grid_available, raw_data) = row
+    return (
+        recorded_at, soc, battery_power_w, solar_power_w, grid_power_w,
+        load_power_w, battery_voltage, battery_temp_c, inverter_mode,
+        1 if grid_available else 0,
+        json.dumps(raw_data) if raw_data else None,
+    )
+
+
+def _plan_slot_rows(plan_id: int, slots: list[dict[str, Any]]) -> list[tuple]:
+    return [
+        (
+            plan_id, slot["slot_index"], slot["slot_start"], slot["slot_end"],
+            slot["operating_mode"], slot["target_power_w"], slot["expected_soc"],
+            slot["import_rate_cents"], slot["export_rate_cents"],
+            slot["solar_forecast_w"], slot["load_forecast_w"],
+            json.dumps(slot.get("scheduled_loads")) if slot.get("scheduled_loads") else None,
+            json.dumps(slot.get("constraint_flags")) if slot.get("constraint_flags") else None,
+        )
+        for slot in slots
+    ]
+
+
 class Repository:
     """Centralised data access for all tables."""
 
@@ -45,24 +100,34 @@ class Repository:
         grid_available: bool = True,
         raw_data: dict[str, Any] | None = None,
     ) -> int:
-        now = _now()
+        return await self.store_telemetry_row((
+            soc, battery_power_w, solar_power_w, grid_power_w, load_power_w,
+            battery_voltage, battery_temp_c, inverter_mode, grid_available, raw_data,
+        ))
+
+    async def store_telemetry_row(self, row: TelemetryRow) -> int:
+        """Insert one telemetry row given positionally (see ``TelemetryRow``).
+
+        Hot-path variant of store_telemetry: callers build the tuple straight
+        from a Telemetry object, skipping keyword packing.
+        """
         async with self.db.execute(
-            """INSERT INTO telemetry
-               (recorded_at, soc, battery_power_w, solar_power_w, grid_power_w,
-                load_power_w, battery_voltage, battery_temp_c, inverter_mode,
-                grid_available, raw_data_json)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                now, soc, battery_power_w, solar_power_w, grid_power_w,
-                load_power_w, battery_voltage, battery_temp_c, inverter_mode,
-                1 if grid_available else 0,
-                json.dumps(raw_data) if raw_data else None,
-            ),
+            _TELEMETRY_INSERT_SQL, _bind_telemetry_row(_now(), row),
         ) as cursor:
             row_id = cursor.lastrowid
         await self.db.commit()
         return row_id  # type: ignore[return-value]
 
+    async def store_telemetry_rows(self, rows: list[TelemetryRow]) -> None:
+        """Bulk-insert positional telemetry rows with a single commit."""
+        if not rows:
+            return
+        now = _now()
+        await self.db.executemany(
+            _TELEMETRY_INSERT_SQL, [_bind_telemetry_row(now, r) for r in rows],
+        )
+        await self.db.commit()
+
     async def get_latest_telemetry(self) -> dict[str, Any] | None:
         async with self.db.execute(
             "SELECT * FROM telemetry ORDER BY recorded_at DESC LIMIT 1"
@@ -104,14 +169,7 @@ class Repository:
             )
             for r in records
         ]
-        await self.db.executemany(
-            """INSERT INTO telemetry
-               (recorded_at, soc, battery_power_w, solar_power_w, grid_power_w,
-                load_power_w, battery_voltage, battery_temp_c, inverter_mode,
-                grid_available, raw_data_json)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            rows,
-        )
+        await self.db.executemany(_TELEMETRY_INSERT_SQL, rows)
         await self.db.commit()
 
     # ── Forecast Snapshots ──────────────────────────────────
@@ -361,7 +419,9 @@ class Repository:
         forecast_snapshot_id: int | None = None,
         tariff_schedule_id: int | None = None,
         config_version_id: int | None = None,
+        slots: list[dict[str, Any]] | None = None,
     ) -> int:
+        """Store a plan as the active one; *slots* are inserted in the same commit."""
         now = _now()
         # Mark previous active plans as superseded
         await self.db.execute(
@@ -383,26 +443,15 @@ class Repository:
             ),
         ) as cursor:
             plan_id = cursor.lastrowid
+        if slots:
+            await self.db.executemany(
+                _PLAN_SLOT_INSERT_SQL, _plan_slot_rows(plan_id, slots),  # type: ignore[arg-type]
+            )
         await self.db.commit()
         return plan_id  # type: ignore[return-value]
 
     async def store_plan_slots(self, plan_id: int, slots: list[dict[str, Any]]) -> None:
-        for slot in slots:
-            await self.db.execute(
-                """INSERT INTO plan_slots
-                   (plan_id, slot_index, slot_start, slot_end, operating_mode,
-                    target_power_w, expected_soc, import_rate_cents, export_rate_cents,
-                    solar_forecast_w, load_forecast_w, scheduled_loads_json, constraint_flags)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    plan_id, slot["slot_index"], slot["slot_start"], slot["slot_end"],
-                    slot["operating_mode"], slot["target_power_w"], slot["expected_soc"],
-                    slot["import_rate_cents"], slot["export_rate_cents"],
-                    slot["solar_forecast_w"], slot["load_forecast_w"],
-                    json.dumps(slot.get("scheduled_loads")) if slot.get("scheduled_loads") else None,
-                    json.dumps(slot.get("constraint_flags")) if slot.get("constraint_flags") else None,
-                ),
-            )
+        await self.db.executemany(_PLAN_SLOT_INSERT_SQL, _plan_slot_rows(plan_id, slots))
         await self.db.commit()
 
     async def get_active_plan(self) -> dict[str, Any] | None:
@@ -566,10 +615,7 @@ class Repository:
     ) -> int:
         now = _now()
         async with self.db.execute(
-            """INSERT INTO accounting_events
-               (event_type, started_at, energy_wh, cost_cents, rate_cents,
-                cost_basis_cents, profit_loss_cents, billing_cycle_id, plan_id, notes, provider_type)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            _ACCOUNTING_EVENT_INSERT_SQL,
             (
                 event_type, now, energy_wh, cost_cents, rate_cents,
                 cost_basis_cents, profit_loss_cents, billing_cycle_id, plan_id, notes, provider_type,
@@ -725,6 +771,28 @@ class Repository:
             rows = await cursor.fetchall()
             return [dict(r) for r in rows]
 
+    async def get_historical_values(
+        self,
+        data_types: list[str],
+        start: str,
+        end: str,
+    ) -> dict[str, list[tuple[str, float]]]:
+        """(recorded_at, value) pairs per data type, time-ordered, in one query."""
+        result: dict[str, list[tuple[str, float]]] = {dt: [] for dt in data_types}
+        if not data_types:
+            return result
+        placeholders = ", ".join("?" * len(data_types))
+        async with self.db.execute(
+            f"""SELECT data_type, recorded_at, value FROM historical_data
+                WHERE data_type IN ({placeholders})
+                  AND recorded_at >= ? AND recorded_at <= ?
+                ORDER BY data_type, recorded_at""",
+            [*data_types, start, end],
+        ) as cursor:
+            for data_type, recorded_at, value in await cursor.fetchall():
+                result[data_type].append((recorded_at, value))
+        return result
+
     async def get_latest_historical_value(self, data_type: str) -> float | None:
         """Get the most recent value for a historical data series."""
         async with self.db.execute(
@@ -860,10 +928,48 @@ class Repository:
     async def kv_set(self, key: str, value: Any) -> None:
         """Set a value in the key-value store (upsert)."""
         await self.db.execute(
-            """INSERT INTO kv_store (key, value_json, updated_at)
-               VALUES (?, ?, ?)
-               ON CONFLICT(key) DO UPDATE SET value_json = excluded.value_json,
-                                              updated_at = excluded.updated_at""",
-            (key, json.dumps(value), _now()),
+            _KV_UPSERT_SQL, (key, json.dumps(value), _now()),
         )
         await self.db.commit()
+
+    # ── Batched writes ───────────────────────────────────
+
+    async def store_write_batch(
+        self,
+        telemetry_rows: list[TelemetryRow] | None = None,
+        accounting_events: list[dict[str, Any]] | None = None,
+        kv_items: dict[str, Any] | None = None,
+    ) -> None:
+        """Write buffered telemetry, accounting events and kv state in one commit.
+
+        Accounting event dicts use the store_accounting_event keyword names
+        and may carry their own ``started_at`` timestamp.
+        """
+        if not (telemetry_rows or accounting_events or kv_items):
+            return
+        now = _now()
+        if telemetry_rows:
+            await self.db.executemany(
+                _TELEMETRY_INSERT_SQL,
+                [_bind_telemetry_row(now, r) for r in telemetry_rows],
+            )
+        if accounting_events:
+            await self.db.executemany(
+                _ACCOUNTING_EVENT_INSERT_SQL,
+                [
+                    (
+                        e["event_type"], e.get("started_at") or now, e["energy_wh"],
+                        e.get("cost_cents"), e.get("rate_cents"),
+                        e.get("cost_basis_cents"), e.get("profit_loss_cents"),
+                        e.get("billing_cycle_id"), e.get("plan_id"), e.get("notes"),
+                        e.get("provider_type", "amber"),
+                    )
+                    for e in accounting_events
+                ],
+            )
+        if kv_items:
+            await self.db.executemany(
+                _KV_UPSERT_SQL,
+                [(k, json.dumps(v), now) for k, v in kv_items.items()],
+            )
+        await self.db.commit()
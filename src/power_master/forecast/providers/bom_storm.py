@@ -26,6 +26,7 @@ logger = logging.getLogger(__name__)
 
 # BOM FTP is also accessible via HTTP
 BOM_BASE_URL = "https://www.bom.gov.au/fwo"
+_HEADERS = {"User-Agent": "PowerMaster/1.0 (solar-optimization)"}
 
 # Keywords in precis text that indicate storm risk
 STORM_KEYWORDS = {
@@ -55,12 +56,12 @@ WARNING_PRODUCT_SEVERITY: dict[str, tuple[str, float]] = {
 class BOMStormProvider(StormProvider):
     """BOM XML precis feed + warning product storm alert provider."""
 
-    def __init__(self, config: StormProviderConfig) -> None:
+    def __init__(
+        self, config: StormProviderConfig, client: httpx.AsyncClient | None = None,
+    ) -> None:
         self._config = config
-        self._client = httpx.AsyncClient(
-            timeout=30.0,
-            headers={"User-Agent": "PowerMaster/1.0 (solar-optimization)"},
-        )
+        self._client = client or httpx.AsyncClient(timeout=30.0)
+        self._owns_client = client is None
         self._cached_xml: str | None = None
         self._cached_at: datetime | None = None
         self._warning_cache: dict[str, tuple[str, datetime]] = {}
@@ -269,14 +270,16 @@ class BOMStormProvider(StormProvider):
     async def is_healthy(self) -> bool:
         try:
             resp = await self._client.head(
-                f"{BOM_BASE_URL}/{self._config.state_code}.xml"
+                f"{BOM_BASE_URL}/{self._config.state_code}.xml",
+                headers=_HEADERS,
             )
             return resp.status_code == 200
         except Exception:
             return False
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     async def _fetch_precis_xml(self) -> str:
         """Fetch precis forecast XML, with simple caching (1 hour)."""
@@ -289,7 +292,7 @@ class BOMStormProvider(StormProvider):
             return self._cached_xml
 
         url = f"{BOM_BASE_URL}/{self._config.state_code}.xml"
-        resp = await self._client.get(url)
+        resp = await self._client.get(url, headers=_HEADERS)
         resp.raise_for_status()
         self._cached_xml = resp.text
         self._cached_at = now
@@ -310,7 +313,7 @@ class BOMStormProvider(StormProvider):
 
         url = f"{BOM_BASE_URL}/{product_id}.xml"
         try:
-            resp = await self._client.get(url)
+            resp = await self._client.get(url, headers=_HEADERS)
             if resp.status_code == 404:
                 # No active warning — cache the absence
                 self._warning_cache[product_id] = ("", now)
@@ -22,9 +22,12 @@ BASE_URL = "https://api.forecast.solar"
 class ForecastSolarProvider(SolarProvider):
     """Forecast.Solar API provider."""
 
-    def __init__(self, config: SolarProviderConfig) -> None:
+    def __init__(
+        self, config: SolarProviderConfig, client: httpx.AsyncClient | None = None,
+    ) -> None:
         self._config = config
-        self._client = httpx.AsyncClient(base_url=BASE_URL, timeout=30.0)
+        self._client = client or httpx.AsyncClient(timeout=30.0)
+        self._owns_client = client is None
 
     def _build_path(self) -> str:
         lat = self._config.latitude
@@ -37,7 +40,7 @@ class ForecastSolarProvider(SolarProvider):
 
     async def fetch_forecast(self) -> SolarForecast:
         """Fetch solar forecast from Forecast.Solar estimate endpoint."""
-        resp = await self._client.get(self._build_path())
+        resp = await self._client.get(BASE_URL + self._build_path())
         resp.raise_for_status()
         data = resp.json()
 
@@ -158,10 +161,11 @@ class ForecastSolarProvider(SolarProvider):
 
     async def is_healthy(self) -> bool:
         try:
-            resp = await self._client.head("/")
+            resp = await self._client.head(BASE_URL + "/")
             return resp.status_code < 500
         except Exception:
             return False
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
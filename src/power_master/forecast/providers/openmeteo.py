@@ -23,9 +23,12 @@ HISTORICAL_URL = "https://archive-api.open-meteo.com/v1/archive"
 class OpenMeteoProvider(WeatherProvider):
     """Open-Meteo REST API weather provider."""
 
-    def __init__(self, config: WeatherProviderConfig) -> None:
+    def __init__(
+        self, config: WeatherProviderConfig, client: httpx.AsyncClient | None = None,
+    ) -> None:
         self._config = config
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._client = client or httpx.AsyncClient(timeout=30.0)
+        self._owns_client = client is None
 
     async def fetch_forecast(self, hours: int = 48) -> WeatherForecast:
         """Fetch weather forecast from Open-Meteo."""
@@ -91,7 +94,8 @@ class OpenMeteoProvider(WeatherProvider):
             return False
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     @staticmethod
     def _parse_hourly(data: dict) -> list[WeatherForecastSlot]:
@@ -74,6 +74,12 @@ class LoadPredictor:
         dt_local = dt.astimezone(self._tz) if dt.tzinfo else dt.replace(tzinfo=timezone.utc).astimezone(self._tz)
         return self._profile.get(dt_local.weekday(), dt_local.hour, default_w)
 
+    def predict_local(self, weekday: int, hour: int, default_w: float = 500.0) -> float:
+        """Predict load for a (weekday, hour) already in the predictor's timezone."""
+        if self._profile is None:
+            return default_w
+        return self._profile.get(weekday, hour, default_w)
+
     def predict_range(
         self,
         start: datetime,
@@ -15,10 +15,13 @@ import os
 import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+from power_master.accounting.energy_flows import split_tick_energy
 from power_master.config.manager import ConfigManager
 from power_master.config.schema import AppConfig
 from power_master.control.constants import (
@@ -26,13 +29,30 @@ from power_master.control.constants import (
     DB_STORE_INTERVAL_SECONDS,
     HISTORY_FLUSH_INTERVAL_SECONDS,
     LOAD_POLL_INTERVAL_SECONDS,
+    LOAD_PROFILE_REFRESH_SECONDS,
+    LOOP_LAG_PROBE_SECONDS,
+    LOOP_LAG_REPORT_SECONDS,
+    LOOP_LAG_WARN_SECONDS,
     RECONNECT_INTERVAL_SECONDS,
     TELEMETRY_BUFFER_FLUSH_SECONDS,
     TELEMETRY_BUFFER_MAX_RECORDS,
 )
-from power_master.db.engine import close_db, init_db
+from power_master.db.engine import checkpoint_wal, close_db, init_db
 from power_master.db.repository import Repository
+from power_master.forecast.solar_calibration import apply_calibration
+from power_master.forecast.solar_estimate import build_fallback_forecast, merge_solar_forecasts
 from power_master.logging.structured import setup_logging
+from power_master.optimisation.load_scheduler import schedule_loads
+from power_master.optimisation.solver import (
+    CreditWindowInfo,
+    ExportTier,
+    ExportTierStructure,
+    SolverInputs,
+    previous_soc_from_plan,
+    solve,
+    warm_start_from_plan,
+)
+from power_master.slot_lookup import match_slots
 from power_master.timezone_utils import resolve_timezone
 
 logger = logging.getLogger(__name__)
@@ -55,6 +75,35 @@ def _fit_solar_model_sync(
     )
 
 
+@dataclass(frozen=True)
+class _TickConfig:
+    """Config values read on every telemetry tick, flattened once.
+
+    Rebuilt by Application.reload_config so hot-reloads still apply,
+    while the per-tick callbacks skip nested pydantic attribute walks.
+    """
+
+    tick_hours: float
+    max_grid_import_w: int
+    max_charge_rate_w: int
+    notifications_enabled: bool
+    battery_low_threshold: float
+    battery_full_threshold: float
+    free_window_orchestrator_enabled: bool
+
+    @classmethod
+    def from_config(cls, config: AppConfig) -> _TickConfig:
+        return cls(
+            tick_hours=config.planning.evaluation_interval_seconds / 3600.0,
+            max_grid_import_w=config.battery.max_grid_import_w,
+            max_charge_rate_w=config.battery.max_charge_rate_w,
+            notifications_enabled=config.notifications.enabled,
+            battery_low_threshold=config.notifications.battery_low_threshold,
+            battery_full_threshold=config.notifications.battery_full_threshold,
+            free_window_orchestrator_enabled=config.loads.free_window_orchestrator.enabled,
+        )
+
+
 class Application:
     """Main application lifecycle manager.
 
@@ -64,6 +113,7 @@ class Application:
     def __init__(self, config: AppConfig, config_manager: ConfigManager) -> None:
         self.config: AppConfig = config
         self.config_manager: ConfigManager = config_manager
+        self._tick_cfg: _TickConfig = _TickConfig.from_config(config)
         self._running: bool = False
         self._tasks: list[asyncio.Task] = []
         self._stop_event: asyncio.Event = asyncio.Event()
@@ -71,10 +121,14 @@ class Application:
         # References held for cleanup
         self._adapter: Any = None
         self._mqtt_client: Any = None
+        self._mqtt_publisher: Any = None
+        self._poll_store_task: asyncio.Task | None = None  # telemetry poller's DB write
         self._control_loop: Any = None
         self._providers: list[Any] = []  # providers with .close() methods
+        self._http: Any = None  # shared httpx.AsyncClient for all providers
         self._server: Any = None
         self._load_manager: Any = None
+        self._accounting: Any = None
         self._repo: Any = None
         self._db_log_handler: Any = None
 
@@ -82,8 +136,22 @@ class Application:
         self._solar_calibration_model: Any = None
         self._solar_calibration_last_fit: datetime | None = None
 
+        # Dedicated solver thread so MILP solves never queue behind (or
+        # starve) blocking work on the default executor
+        self._solver_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="solver",
+        )
+
+        # Historic load predictor (lazy-built, refreshed on stale / tz change)
+        self._load_predictor: Any = None
+        self._load_predictor_built_at: float = 0.0
+
+        # Planning slot grid from the last solve: (start, slot_minutes,
+        # slot start times, slot start epochs)
+        self._slot_cache: tuple[datetime, int, list[datetime], list[float]] | None = None
+
         # Telemetry batching
-        self._telemetry_buffer: list[dict] = []
+        self._telemetry_buffer: list[tuple] = []
         self._telemetry_buffer_lock: asyncio.Lock = asyncio.Lock()
         self._telemetry_buffer_flush_time: float = 0.0
 
@@ -106,6 +174,10 @@ class Application:
         logger.info("Starting Power Master v%s", VERSION)
         self._running = True
         self._stop_event.clear()
+        if self.config.logging.asyncio_debug:
+            loop = asyncio.get_running_loop()
+            loop.set_debug(True)
+            loop.slow_callback_duration = 0.05
 
         # ── 0. Ensure auth session secret exists ──────────────
         auth_cfg = self.config.dashboard.auth
@@ -309,7 +381,9 @@ class Application:
         from power_master.accounting.engine import AccountingEngine
 
         accounting = AccountingEngine(self.config)
-        await accounting.init_persistence(repo)
+        # Accounting writes ride along with the telemetry batch commit
+        await accounting.init_persistence(repo, batched=True)
+        self._accounting = accounting
 
         # ── 7b. Notification event bus + manager ───────────────
         from power_master.notifications.bus import EventBus
@@ -354,6 +428,7 @@ class Application:
         if self.config.mqtt.enabled:
             mqtt_client, mqtt_publisher = await self._setup_mqtt(load_manager)
             self._mqtt_client = mqtt_client
+            self._mqtt_publisher = mqtt_publisher
 
         # ── 11. History collector ────────────────────────────
         from power_master.history.collector import HistoryCollector
@@ -416,27 +491,17 @@ class Application:
         manual_override.clear = _clear_and_persist
 
         # Register telemetry callback: buffer for DB + history + MQTT
+        self._tick_cfg = _TickConfig.from_config(self.config)
+
         async def on_telemetry(telemetry):
+            cfg = self._tick_cfg  # one snapshot per tick; swapped on reload
             # Buffer telemetry for batch commit (10 records or 30s)
             async with self._telemetry_buffer_lock:
-                self._telemetry_buffer.append({
-                    "soc": telemetry.soc,
-                    "battery_power_w": telemetry.battery_power_w,
-                    "solar_power_w": telemetry.solar_power_w,
-                    "grid_power_w": telemetry.grid_power_w,
-                    "load_power_w": telemetry.load_power_w,
-                    "battery_voltage": telemetry.battery_voltage,
-                    "battery_temp_c": telemetry.battery_temp_c,
-                    "inverter_mode": telemetry.inverter_mode,
-                    "grid_available": telemetry.grid_available,
-                    "raw_data": telemetry.raw_data,
-                })
+                self._telemetry_buffer.append(_telemetry_row(telemetry))
                 # Flush if buffer hits max records threshold
                 if len(self._telemetry_buffer) >= TELEMETRY_BUFFER_MAX_RECORDS:
                     try:
-                        await repo.store_telemetry_batch(self._telemetry_buffer)
-                        self._telemetry_buffer.clear()
-                        self._telemetry_buffer_flush_time = time.monotonic()
+                        await self._flush_write_batch(repo)
                     except Exception:
                         logger.exception("Failed to flush telemetry batch")
 
@@ -451,8 +516,7 @@ class Application:
             # record_charge sees the previous tick's stored_wh, not the
             # already-updated SOC (which would double-count charged energy
             # and anchor the WACB at its initial value).
-            tick_interval_s = self.config.planning.evaluation_interval_seconds
-            tick_hours = tick_interval_s / 3600.0
+            tick_hours = cfg.tick_hours
             tariff = getattr(aggregator.state, "tariff", None)
             import_rate = 15.0  # default cents/kWh
             export_rate = 5.0
@@ -464,204 +528,199 @@ class Application:
                 if ep is not None:
                     export_rate = ep
 
-            grid_w = telemetry.grid_power_w
-            solar_w = telemetry.solar_power_w
-            battery_w = telemetry.battery_power_w  # positive=charging
-            load_w = telemetry.load_power_w
-
-            if grid_w > 0:
-                # Grid import
-                import_wh = round(grid_w * tick_hours)
-                if import_wh > 0:
-                    await accounting.record_grid_import(import_wh, import_rate)
-
-                    # ── Increment free-window cap tracker from measured free-window import ──
-                    if free_window_cap_tracker:
-                        # Check if current time is within the active free window
-                        from datetime import datetime
-                        from zoneinfo import ZoneInfo
-
-                        now_local = datetime.now(ZoneInfo(self.config.providers.tariff.timezone))
-                        hm = (now_local.hour, now_local.minute)
-
-                        # Find the active version and free window
-                        from datetime import date as date_cls
-                        today = date_cls.today()
-                        plan = self.config.providers.tariff.plan
-                        active_version = None
-                        for version in plan.versions:
-                            if version.valid_from <= today:
-                                if version.valid_until is None or version.valid_until >= today:
-                                    if active_version is None or version.valid_from > active_version.valid_from:
-                                        active_version = version
-
-                        if active_version:
-                            # Check if time is in any free window on the "general" channel
-                            in_free_window = False
-                            free_window_name = None
-                            for fw in active_version.free_windows:
-                                if fw.applies_to_channel == "general":
-                                    # Check if time is in this window
-                                    if _time_in_windows(hm, fw.windows):
-                                        in_free_window = True
-                                        free_window_name = fw.name
-                                        break
-
-                            if in_free_window:
-                                import_kwh = import_wh / 1000.0
-                                was_approaching = free_window_cap_tracker.is_cap_approaching(0.80)
-                                was_exhausted = free_window_cap_tracker.is_cap_exhausted()
-
-                                await free_window_cap_tracker.increment(import_kwh)
-
-                                is_exhausted = free_window_cap_tracker.is_cap_exhausted()
-
-                                # Free period effectively over on the cap
-                                # transition: prompt a pricing refresh + rebuild so
-                                # charging stops and the plan reverts to self-use.
-                                # Done independent of the event emitter so the
-                                # behaviour holds even when notifications are off.
-                                if not was_exhausted and is_exhausted:
-                                    self._cap_exhausted_rebuild_needed.set()
+            flows = split_tick_energy(
+                telemetry.grid_power_w,
+                telemetry.solar_power_w,
+                telemetry.battery_power_w,
+                telemetry.load_power_w,
+                tick_hours,
+            )
 
-                                # Emit cap consumption event
-                                if tariff_event_emitter:
-                                    consumed = free_window_cap_tracker.get_consumed_today()
-                                    cap = free_window_cap_tracker._cap_kwh_per_day
-                                    tariff_event_emitter.emit_free_window_cap_consumed(
+            # Grid import
+            import_wh = flows.grid_import_wh
+            if import_wh > 0:
+                await accounting.record_grid_import(import_wh, import_rate)
+
+                # ── Increment free-window cap tracker from measured free-window import ──
+                if free_window_cap_tracker:
+                    # Check if current time is within the active free window
+                    from datetime import datetime
+                    from zoneinfo import ZoneInfo
+
+                    now_local = datetime.now(ZoneInfo(self.config.providers.tariff.timezone))
+                    hm = (now_local.hour, now_local.minute)
+
+                    # Find the active version and free window
+                    from datetime import date as date_cls
+                    today = date_cls.today()
+                    plan = self.config.providers.tariff.plan
+                    active_version = None
+                    for version in plan.versions:
+                        if version.valid_from <= today:
+                            if version.valid_until is None or version.valid_until >= today:
+                                if active_version is None or version.valid_from > active_version.valid_from:
+                                    active_version = version
+
+                    if active_version:
+                        # Check if time is in any free window on the "general" channel
+                        in_free_window = False
+                        free_window_name = None
+                        for fw in active_version.free_windows:
+                            if fw.applies_to_channel == "general":
+                                # Check if time is in this window
+                                if _time_in_windows(hm, fw.windows):
+                                    in_free_window = True
+                                    free_window_name = fw.name
+                                    break
+
+                        if in_free_window:
+                            import_kwh = import_wh / 1000.0
+                            was_approaching = free_window_cap_tracker.is_cap_approaching(0.80)
+                            was_exhausted = free_window_cap_tracker.is_cap_exhausted()
+
+                            await free_window_cap_tracker.increment(import_kwh)
+
+                            is_exhausted = free_window_cap_tracker.is_cap_exhausted()
+
+                            # Free period effectively over on the cap
+                            # transition: prompt a pricing refresh + rebuild so
+                            # charging stops and the plan reverts to self-use.
+                            # Done independent of the event emitter so the
+                            # behaviour holds even when notifications are off.
+                            if not was_exhausted and is_exhausted:
+                                self._cap_exhausted_rebuild_needed.set()
+
+                            # Emit cap consumption event
+                            if tariff_event_emitter:
+                                consumed = free_window_cap_tracker.get_consumed_today()
+                                cap = free_window_cap_tracker._cap_kwh_per_day
+                                tariff_event_emitter.emit_free_window_cap_consumed(
+                                    cap_name=free_window_name,
+                                    kwh_consumed=consumed,
+                                    cap_kwh_per_day=cap,
+                                )
+
+                                # Check threshold transitions
+                                is_approaching = free_window_cap_tracker.is_cap_approaching(0.80)
+
+                                if not was_approaching and is_approaching:
+                                    tariff_event_emitter.emit_free_window_cap_approaching(
                                         cap_name=free_window_name,
                                         kwh_consumed=consumed,
                                         cap_kwh_per_day=cap,
                                     )
 
-                                    # Check threshold transitions
-                                    is_approaching = free_window_cap_tracker.is_cap_approaching(0.80)
-
-                                    if not was_approaching and is_approaching:
-                                        tariff_event_emitter.emit_free_window_cap_approaching(
-                                            cap_name=free_window_name,
-                                            kwh_consumed=consumed,
-                                            cap_kwh_per_day=cap,
-                                        )
-
-                                    if not was_exhausted and is_exhausted:
-                                        tariff_event_emitter.emit_free_window_cap_exhausted(
-                                            cap_name=free_window_name,
-                                            cap_kwh_per_day=cap,
-                                        )
-
-                    # ── Increment daily credit tracker from measured in-window import ──
-                    if daily_credit_tracker:
-                        from datetime import datetime
-                        from zoneinfo import ZoneInfo
-
-                        now_local = datetime.now(ZoneInfo(self.config.providers.tariff.timezone))
-                        hm = (now_local.hour, now_local.minute)
-
-                        # Find the active version and low_import_window credits
-                        from datetime import date as date_cls
-                        today = date_cls.today()
-                        plan = self.config.providers.tariff.plan
-                        active_version = None
-                        for version in plan.versions:
-                            if version.valid_from <= today:
-                                if version.valid_until is None or version.valid_until >= today:
-                                    if active_version is None or version.valid_from > active_version.valid_from:
-                                        active_version = version
-
-                        if active_version:
-                            # Check if time is in any low_import_window credit window
-                            in_credit_window = False
-                            credit_config = None
-                            for credit in active_version.credits:
-                                if credit.type == "low_import_window":
-                                    if _time_in_windows(hm, credit.windows):
-                                        in_credit_window = True
-                                        credit_config = credit
-                                        break
-
-                            if in_credit_window and credit_config:
-                                # Record the import in the credit tracker
-                                result = await daily_credit_tracker.record_in_window_import(import_wh)
+                                if not was_exhausted and is_exhausted:
+                                    tariff_event_emitter.emit_free_window_cap_exhausted(
+                                        cap_name=free_window_name,
+                                        cap_kwh_per_day=cap,
+                                    )
+
+                # ── Increment daily credit tracker from measured in-window import ──
+                if daily_credit_tracker:
+                    from datetime import datetime
+                    from zoneinfo import ZoneInfo
+
+                    now_local = datetime.now(ZoneInfo(self.config.providers.tariff.timezone))
+                    hm = (now_local.hour, now_local.minute)
+
+                    # Find the active version and low_import_window credits
+                    from datetime import date as date_cls
+                    today = date_cls.today()
+                    plan = self.config.providers.tariff.plan
+                    active_version = None
+                    for version in plan.versions:
+                        if version.valid_from <= today:
+                            if version.valid_until is None or version.valid_until >= today:
+                                if active_version is None or version.valid_from > active_version.valid_from:
+                                    active_version = version
+
+                    if active_version:
+                        # Check if time is in any low_import_window credit window
+                        in_credit_window = False
+                        credit_config = None
+                        for credit in active_version.credits:
+                            if credit.type == "low_import_window":
+                                if _time_in_windows(hm, credit.windows):
+                                    in_credit_window = True
+                                    credit_config = credit
+                                    break
+
+                        if in_credit_window and credit_config:
+                            # Record the import in the credit tracker
+                            result = await daily_credit_tracker.record_in_window_import(import_wh)
+                            logger.debug(
+                                "DailyCreditTracker: %.3f kWh imported in window, "
+                                "total=%.3f kWh (threshold=%.3f kWh), status=%s, earned=$%.2f",
+                                import_wh / 1000.0,
+                                result["import_total_kwh"],
+                                result["threshold_kwh"],
+                                result["status"],
+                                result["earned_dollars"],
+                            )
+
+            # Battery charging from grid while importing
+            if flows.grid_charge_wh > 0:
+                accounting.record_grid_charge(flows.grid_charge_wh, import_rate)
+
+            # Grid export
+            export_wh = flows.grid_export_wh
+            if export_wh > 0:
+                await accounting.record_grid_export(export_wh, export_rate)
+
+                # ── Increment export tier ledger from measured tiered feed-in export ──
+                if export_tier_ledger:
+                    from datetime import datetime
+                    from zoneinfo import ZoneInfo
+
+                    now_local = datetime.now(ZoneInfo(self.config.providers.tariff.timezone))
+                    hm = (now_local.hour, now_local.minute)
+
+                    # Find the active version and tiered feed-in bands
+                    from datetime import date as date_cls
+                    today = date_cls.today()
+                    plan = self.config.providers.tariff.plan
+                    active_version = None
+                    for version in plan.versions:
+                        if version.valid_from <= today:
+                            if version.valid_until is None or version.valid_until >= today:
+                                if active_version is None or version.valid_from > active_version.valid_from:
+                                    active_version = version
+
+                    if active_version:
+                        # Check if time is in any tiered feed-in window
+                        in_tiered_window = False
+                        tiered_band = None
+                        for band in active_version.feed_in_bands:
+                            if band.tiers:  # Only check tiered bands
+                                # Check if time is in this band's windows
+                                if not band.windows or _time_in_windows(hm, band.windows):
+                                    in_tiered_window = True
+                                    tiered_band = band
+                                    break
+
+                        if in_tiered_window and tiered_band:
+                            # Record the export in the tier ledger
+                            result = await export_tier_ledger.record_export(export_wh, export_rate)
+                            if result["tier_name"]:
                                 logger.debug(
-                                    "DailyCreditTracker: %.3f kWh imported in window, "
-                                    "total=%.3f kWh (threshold=%.3f kWh), status=%s, earned=$%.2f",
-                                    import_wh / 1000.0,
-                                    result["import_total_kwh"],
-                                    result["threshold_kwh"],
-                                    result["status"],
-                                    result["earned_dollars"],
+                                    "ExportTierLedger: %.2f kWh exported to tier '%s', "
+                                    "now %.2f kWh in tier, revenue %d cents",
+                                    export_wh / 1000.0,
+                                    result["tier_name"],
+                                    result["kwh_in_tier"],
+                                    result["revenue_cents"],
                                 )
 
-                # If battery is also charging from grid
-                if battery_w > 0:
-                    grid_charge_w = min(battery_w, grid_w)
-                    grid_charge_wh = round(grid_charge_w * tick_hours)
-                    if grid_charge_wh > 0:
-                        accounting.record_grid_charge(grid_charge_wh, import_rate)
-            elif grid_w < 0:
-                # Grid export
-                export_wh = round(abs(grid_w) * tick_hours)
-                if export_wh > 0:
-                    await accounting.record_grid_export(export_wh, export_rate)
-
-                    # ── Increment export tier ledger from measured tiered feed-in export ──
-                    if export_tier_ledger:
-                        from datetime import datetime
-                        from zoneinfo import ZoneInfo
-
-                        now_local = datetime.now(ZoneInfo(self.config.providers.tariff.timezone))
-                        hm = (now_local.hour, now_local.minute)
-
-                        # Find the active version and tiered feed-in bands
-                        from datetime import date as date_cls
-                        today = date_cls.today()
-                        plan = self.config.providers.tariff.plan
-                        active_version = None
-                        for version in plan.versions:
-                            if version.valid_from <= today:
-                                if version.valid_until is None or version.valid_until >= today:
-                                    if active_version is None or version.valid_from > active_version.valid_from:
-                                        active_version = version
-
-                        if active_version:
-                            # Check if time is in any tiered feed-in window
-                            in_tiered_window = False
-                            tiered_band = None
-                            for band in active_version.feed_in_bands:
-                                if band.tiers:  # Only check tiered bands
-                                    # Check if time is in this band's windows
-                                    if not band.windows or _time_in_windows(hm, band.windows):
-                                        in_tiered_window = True
-                                        tiered_band = band
-                                        break
-
-                            if in_tiered_window and tiered_band:
-                                # Record the export in the tier ledger
-                                result = await export_tier_ledger.record_export(export_wh, export_rate)
-                                if result["tier_name"]:
-                                    logger.debug(
-                                        "ExportTierLedger: %.2f kWh exported to tier '%s', "
-                                        "now %.2f kWh in tier, revenue %d cents",
-                                        export_wh / 1000.0,
-                                        result["tier_name"],
-                                        result["kwh_in_tier"],
-                                        result["revenue_cents"],
-                                    )
-
             # Solar charging battery
-            if battery_w > 0 and solar_w > 0 and grid_w <= 0:
-                solar_charge_w = min(battery_w, solar_w)
-                solar_charge_wh = round(solar_charge_w * tick_hours)
-                if solar_charge_wh > 0:
-                    accounting.record_solar_charge(solar_charge_wh, export_rate)
+            if flows.solar_charge_wh > 0:
+                accounting.record_solar_charge(flows.solar_charge_wh, export_rate)
 
             # Self-consumption: load served by solar/battery (not grid)
-            if load_w > 0 and grid_w <= 0:
-                self_consumption_w = min(load_w, solar_w + max(0, -battery_w))
-                self_consumption_wh = round(self_consumption_w * tick_hours)
-                if self_consumption_wh > 0:
-                    await accounting.record_self_consumption(self_consumption_wh, import_rate)
+            if flows.self_consumption_wh > 0:
+                await accounting.record_self_consumption(
+                    flows.self_consumption_wh, import_rate,
+                )
 
             # Sync accounting SOC after energy recording (see note above)
             try:
@@ -670,10 +729,10 @@ class Application:
                 logger.exception("Failed to sync accounting SOC")
 
             # Notification: battery SOC thresholds
-            if self.config.notifications.enabled:
+            if cfg.notifications_enabled:
                 from power_master.notifications.bus import Event as _NEvent
                 soc = telemetry.soc
-                if soc <= self.config.notifications.battery_low_threshold:
+                if soc <= cfg.battery_low_threshold:
                     await event_bus.publish(_NEvent(
                         name="battery_low",
                         severity="warning",
@@ -681,7 +740,7 @@ class Application:
                         message=f"Battery SOC is {soc*100:.0f}%",
                         data={"soc": soc},
                     ))
-                elif soc >= self.config.notifications.battery_full_threshold:
+                elif soc >= cfg.battery_full_threshold:
                     await event_bus.publish(_NEvent(
                         name="battery_full",
                         severity="info",
@@ -692,21 +751,36 @@ class Application:
 
             # Health check: inverter success
             health_checker.record_success("inverter")
-            # Publish to MQTT
+            # Publish to MQTT and shed loads if grid import exceeds the
+            # configured max.  Neither depends on the other, so run them
+            # concurrently and let the tick finish with the slower one.
+            max_grid_w = cfg.max_grid_import_w
+            tick_io = []
             if mqtt_publisher:
-                await mqtt_publisher.publish_telemetry(telemetry)
-            # Load shedding: shed loads if grid import exceeds configured max
-            max_grid_w = self.config.battery.max_grid_import_w
+                tick_io.append(mqtt_publisher.publish_telemetry(telemetry))
             if max_grid_w > 0 and telemetry.grid_power_w > max_grid_w:
-                await load_manager.shed_for_overload(
+                tick_io.append(load_manager.shed_for_overload(
                     telemetry.grid_power_w, max_grid_w,
-                )
+                ))
+            if tick_io:
+                escalate: BaseException | None = None
+                for outcome in await asyncio.gather(*tick_io, return_exceptions=True):
+                    if isinstance(outcome, Exception):
+                        logger.error(
+                            "Telemetry tick publish/shed failed", exc_info=outcome,
+                        )
+                    elif isinstance(outcome, BaseException):
+                        # CancelledError (or an interrupt) is not an
+                        # Exception: propagate it once the rest are logged
+                        escalate = outcome
+                if escalate is not None:
+                    raise escalate
 
             # ── Free-window cap-aware orchestration (§7.5) ─────────
             # During free windows, coordinate battery grid-charge + controlled loads
             # so their total never exceeds max_grid_import_w.
             if (
-                self.config.loads.free_window_orchestrator.enabled
+                cfg.free_window_orchestrator_enabled
                 and max_grid_w > 0
                 and aggregator.state.tariff
             ):
@@ -726,7 +800,7 @@ class Application:
                 result = await free_window_orchestrator.allocate_for_free_window(
                     current_grid_import_w=telemetry.grid_power_w,
                     measured_uncontrollable_load_w=uncontrollable_load_w,
-                    battery_max_charge_w=self.config.battery.max_charge_rate_w,
+                    battery_max_charge_w=cfg.max_charge_rate_w,
                     is_in_free_window=is_in_free,
                     cap_exhausted=cap_exhausted,
                 )
@@ -772,7 +846,7 @@ class Application:
         # throttling the battery grid-charge setpoint to stay under the free-window cap.
         async def on_command_free_window_throttle(command, result):
             """Throttle battery grid-charge setpoint if free-window cap requires it."""
-            if not self.config.loads.free_window_orchestrator.enabled:
+            if not self._tick_cfg.free_window_orchestrator_enabled:
                 return
             # Check if a throttled setpoint was stored by the telemetry callback
             throttled_setpoint_w = control_loop.state.free_window_battery_setpoint_w
@@ -789,19 +863,35 @@ class Application:
         control_loop._on_command.append(on_command_free_window_throttle)
 
         # ── 13. Load cached forecasts + initial fetch ─────────
-        logger.info("Loading cached forecasts from DB...")
-        await aggregator.load_from_db(repo)
-
-        logger.info("Fetching initial forecasts (skipping fresh data)...")
-        await aggregator.update_all(
-            config=self.config.providers, respect_validity=True,
-        )
+        # The forecast refresh (which needs the restored timestamps) and the
+        # first telemetry read are independent, so they run concurrently.
+        async def _initial_forecasts() -> None:
+            logger.info("Loading cached forecasts from DB...")
+            await aggregator.load_from_db(repo)
+
+            logger.info("Fetching initial forecasts (skipping fresh data)...")
+            await aggregator.update_all(
+                config=self.config.providers, respect_validity=True,
+            )
 
         # Fetch one telemetry reading so the initial plan uses real SOC
         # (without this, _run_solver defaults to 50% because the control
         # loop / poll tasks haven't started yet).
-        try:
-            init_telemetry = await adapter.get_telemetry()
+        async def _initial_telemetry():
+            try:
+                return await adapter.get_telemetry()
+            except Exception:
+                logger.warning(
+                    "Could not fetch telemetry before initial plan — "
+                    "solver will use SOC=50%% default",
+                    exc_info=True,
+                )
+                return None
+
+        _, init_telemetry = await asyncio.gather(
+            _initial_forecasts(), _initial_telemetry(),
+        )
+        if init_telemetry is not None:
             control_loop.update_live_telemetry(init_telemetry)
             logger.info(
                 "Initial telemetry: SOC=%.1f%%, PV=%dW, Grid=%dW, Load=%dW",
@@ -810,20 +900,17 @@ class Application:
                 init_telemetry.grid_power_w,
                 init_telemetry.load_power_w,
             )
-        except Exception:
-            logger.warning(
-                "Could not fetch telemetry before initial plan — "
-                "solver will use SOC=50%% default",
-                exc_info=True,
-            )
 
-        # Always build an initial plan so startup does not reuse stale plan data.
-        # If tariff data is missing, _run_solver falls back to default rates.
-        await self._run_solver(
-            aggregator, storm_monitor, accounting,
-            rebuild_evaluator, control_loop, repo,
-            trigger="initial", load_manager=load_manager,
-        )
+        # Reuse the persisted plan when it is recent and was built from the
+        # same config; otherwise build an initial plan so startup does not
+        # run on stale plan data.  If tariff data is missing, _run_solver
+        # falls back to default rates.
+        if not await self._restore_plan(repo, control_loop, rebuild_evaluator):
+            await self._run_solver(
+                aggregator, storm_monitor, accounting,
+                rebuild_evaluator, control_loop, repo,
+                trigger="initial", load_manager=load_manager,
+            )
 
         logger.info(
             "System initialised: battery=%dWh, adapter=%s, horizon=%dh",
@@ -833,121 +920,136 @@ class Application:
         )
 
         # ── 14. Start background tasks ───────────────────────
+        # Background tasks live in one TaskGroup that also runs the dashboard
+        # server; start() returns once every task has finished.  An exception
+        # escaping any task cancels all the others and stops the application,
+        # so each loop must catch and log its own per-iteration failures.
+        async with asyncio.TaskGroup() as tg:
+            # Control loop
+            self._tasks.append(tg.create_task(
+                control_loop.run(), name="control_loop",
+            ))
 
-        # Control loop
-        self._tasks.append(asyncio.create_task(
-            control_loop.run(), name="control_loop",
-        ))
-
-        # Fast telemetry polling for live dashboard updates
-        self._tasks.append(asyncio.create_task(
-            self._telemetry_poll_loop(adapter, control_loop, repo=repo, load_manager=load_manager, event_bus=event_bus),
-            name="telemetry_poller",
-        ))
-
-        # Periodic forecast updates
-        self._tasks.append(asyncio.create_task(
-            self._forecast_update_loop(
-                aggregator, storm_monitor, health_checker,
-                history, accounting, rebuild_evaluator,
-                control_loop, repo, load_manager, mqtt_publisher,
-                event_bus=event_bus,
-            ),
-            name="forecast_updater",
-        ))
-
-        # History flush (every 30 min)
-        self._tasks.append(asyncio.create_task(
-            self._history_flush_loop(history),
-            name="history_flusher",
-        ))
-
-        # Telemetry buffer flush (every 30s)
-        self._tasks.append(asyncio.create_task(
-            self._telemetry_flush_loop(repo),
-            name="telemetry_flusher",
-        ))
-
-        # Forecast samples retention prune (once per hour)
-        self._tasks.append(asyncio.create_task(
-            self._forecast_prune_loop(repo),
-            name="forecast_prune",
-        ))
-
-        # Daily briefing + notification log retention
-        self._tasks.append(asyncio.create_task(
-            self._notification_maintenance_loop(repo, event_bus, control_loop, aggregator, storm_monitor),
-            name="notification_maintenance",
-        ))
-
-        # Resilience evaluator
-        self._tasks.append(asyncio.create_task(
-            self._resilience_loop(resilience_mgr, event_bus=event_bus),
-            name="resilience_evaluator",
-        ))
-
-        # MQTT listener (if enabled)
-        if mqtt_client:
-            self._tasks.append(asyncio.create_task(
-                mqtt_client.listen(), name="mqtt_listener",
+            # Fast telemetry polling for live dashboard updates
+            self._tasks.append(tg.create_task(
+                self._telemetry_poll_loop(adapter, control_loop, repo=repo, load_manager=load_manager, event_bus=event_bus),
+                name="telemetry_poller",
             ))
 
-        # Publish initial online status
-        if mqtt_publisher:
-            await mqtt_publisher.publish_status(online=True)
-
-        # ── 15. Self-update manager ───────────────────────────
-        from power_master.updater import UpdateManager
-
-        updater = UpdateManager(event_bus=event_bus, config=self.config)
-        self._tasks.append(asyncio.create_task(
-            updater.run(), name="update_checker",
-        ))
-
-        # ── 16. Dashboard server ─────────────────────────────
-        from power_master.dashboard.app import create_app
-
-        app = create_app(self.config, repo, config_manager=self.config_manager)
-        # Store live references in app.state for dashboard access
-        app.state.application = self
-        app.state.control_loop = control_loop
-        app.state.aggregator = aggregator
-        app.state.accounting = accounting
-        app.state.storm_monitor = storm_monitor
-        app.state.load_manager = load_manager
-        app.state.resilience_mgr = resilience_mgr
-        app.state.manual_override = manual_override
-        app.state.updater = updater
-        app.state.event_bus = event_bus
-        app.state.notification_manager = notification_manager
-        app.state.adapter = adapter
-        # TOU tariff support (dashboard needs these for TOU-aware view)
-        app.state.free_window_cap_tracker = free_window_cap_tracker
-        app.state.export_tier_ledger = export_tier_ledger
-        app.state.daily_credit_tracker = daily_credit_tracker
-        app.state.tariff_event_emitter = tariff_event_emitter
-
-        import uvicorn
-
-        uvi_config = uvicorn.Config(
-            app,
-            host=self.config.dashboard.host,
-            port=self.config.dashboard.port,
-            log_level="warning",
-        )
-        server = uvicorn.Server(uvi_config)
-        # Keep process signal handling in main() so Ctrl+C behaviour is predictable.
-        server.install_signal_handlers = lambda: None
-        self._server = server
+            # Periodic forecast updates
+            self._tasks.append(tg.create_task(
+                self._forecast_update_loop(
+                    aggregator, storm_monitor, health_checker,
+                    history, accounting, rebuild_evaluator,
+                    control_loop, repo, load_manager, mqtt_publisher,
+                    event_bus=event_bus,
+                ),
+                name="forecast_updater",
+            ))
 
-        logger.info(
-            "Dashboard available at http://%s:%d",
-            self.config.dashboard.host,
-            self.config.dashboard.port,
-        )
+            # History flush (every 30 min)
+            self._tasks.append(tg.create_task(
+                self._history_flush_loop(history),
+                name="history_flusher",
+            ))
+
+            # Telemetry buffer flush (every 30s)
+            self._tasks.append(tg.create_task(
+                self._telemetry_flush_loop(repo),
+                name="telemetry_flusher",
+            ))
+
+            # Forecast samples retention prune (once per hour)
+            self._tasks.append(tg.create_task(
+                self._forecast_prune_loop(repo),
+                name="forecast_prune",
+            ))
 
-        # Server.serve() blocks until shutdown
-        await server.serve()
+            # Daily briefing + notification log retention
+            self._tasks.append(tg.create_task(
+                self._notification_maintenance_loop(repo, event_bus, control_loop, aggregator, storm_monitor),
+                name="notification_maintenance",
+            ))
+
+            # Resilience evaluator
+            self._tasks.append(tg.create_task(
+                self._resilience_loop(resilience_mgr, event_bus=event_bus),
+                name="resilience_evaluator",
+            ))
+
+            # Event loop lag probe
+            self._tasks.append(tg.create_task(
+                self._loop_lag_monitor(mqtt_publisher),
+                name="loop_lag_monitor",
+            ))
+
+            # MQTT listener (if enabled)
+            if mqtt_client:
+                self._tasks.append(tg.create_task(
+                    mqtt_client.listen(), name="mqtt_listener",
+                ))
+
+            # Publish initial online status
+            if mqtt_publisher:
+                await mqtt_publisher.publish_status(online=True)
+
+            # ── 15. Self-update manager ───────────────────────────
+            from power_master.updater import UpdateManager
+
+            updater = UpdateManager(event_bus=event_bus, config=self.config)
+            self._tasks.append(tg.create_task(
+                updater.run(), name="update_checker",
+            ))
+
+            # ── 16. Dashboard server ─────────────────────────────
+            from power_master.dashboard.app import create_app
+
+            app = create_app(self.config, repo, config_manager=self.config_manager)
+            # Store live references in app.state for dashboard access
+            app.state.application = self
+            app.state.control_loop = control_loop
+            app.state.aggregator = aggregator
+            app.state.accounting = accounting
+            app.state.storm_monitor = storm_monitor
+            app.state.load_manager = load_manager
+            app.state.resilience_mgr = resilience_mgr
+            app.state.manual_override = manual_override
+            app.state.updater = updater
+            app.state.event_bus = event_bus
+            app.state.notification_manager = notification_manager
+            app.state.adapter = adapter
+            # TOU tariff support (dashboard needs these for TOU-aware view)
+            app.state.free_window_cap_tracker = free_window_cap_tracker
+            app.state.export_tier_ledger = export_tier_ledger
+            app.state.daily_credit_tracker = daily_credit_tracker
+            app.state.tariff_event_emitter = tariff_event_emitter
+
+            import uvicorn
+
+            uvi_config = uvicorn.Config(
+                app,
+                host=self.config.dashboard.host,
+                port=self.config.dashboard.port,
+                log_level="warning",
+            )
+            server = uvicorn.Server(uvi_config)
+            # Keep process signal handling in main() so Ctrl+C behaviour is predictable.
+            server.install_signal_handlers = lambda: None
+            self._server = server
+
+            logger.info(
+                "Dashboard available at http://%s:%d",
+                self.config.dashboard.host,
+                self.config.dashboard.port,
+            )
+
+            # Server.serve() blocks until shutdown; loops that do not watch
+            # the stop event (MQTT listener) are cancelled so the group exits.
+            try:
+                await server.serve()
+            finally:
+                for task in self._tasks:
+                    task.cancel()
 
     async def stop(self) -> None:
         """Gracefully stop all components in reverse order."""
@@ -966,15 +1068,13 @@ class Application:
         if self._control_loop:
             self._control_loop.stop()
 
-        # Flush telemetry buffer before shutdown
+        # Flush telemetry buffer + staged accounting writes before shutdown
         if self._repo:
             async with self._telemetry_buffer_lock:
-                if self._telemetry_buffer:
-                    try:
-                        await self._repo.store_telemetry_batch(self._telemetry_buffer)
-                        self._telemetry_buffer.clear()
-                    except Exception:
-                        logger.exception("Failed to flush telemetry on shutdown")
+                try:
+                    await self._flush_write_batch(self._repo)
+                except Exception:
+                    logger.exception("Failed to flush telemetry on shutdown")
 
         # Cancel background tasks
         for task in self._tasks:
@@ -984,6 +1084,11 @@ class Application:
 
         # Publish offline status
         if self._mqtt_client:
+            if self._mqtt_publisher:
+                try:
+                    await self._mqtt_publisher.flush()
+                except Exception:
+                    logger.debug("MQTT flush on shutdown failed", exc_info=True)
             try:
                 from power_master.mqtt.publisher import MQTTPublisher
                 from power_master.mqtt.topics import build_topics
@@ -1010,6 +1115,11 @@ class Application:
                     await provider.close()
                 except Exception:
                     pass
+        if self._http is not None:
+            with contextlib.suppress(Exception):
+                await self._http.aclose()
+            self._http = None
+        self._solver_executor.shutdown(wait=False, cancel_futures=True)
 
         # Persist load runtime before closing DB
         if self._load_manager and self._repo:
@@ -1036,6 +1146,7 @@ class Application:
         new_config = self.config_manager.save_user_config(updates)
         old_config = self.config
         self.config = new_config
+        self._tick_cfg = _TickConfig.from_config(new_config)
 
         # 2. Update app.state so routes see new values immediately
         app.state.config = new_config
@@ -1119,6 +1230,8 @@ class Application:
         """Reconnect MQTT with new settings."""
         if self._mqtt_client:
             try:
+                if self._mqtt_publisher:
+                    await self._mqtt_publisher.flush()
                 await self._mqtt_client.disconnect()
             except Exception:
                 pass
@@ -1129,6 +1242,7 @@ class Application:
             if load_manager:
                 client, publisher = await self._setup_mqtt(load_manager)
                 self._mqtt_client = client
+                self._mqtt_publisher = publisher
                 if publisher:
                     await publisher.publish_status(online=True)
         logger.info("MQTT reloaded")
@@ -1162,6 +1276,25 @@ class Application:
             )
         return adapter
 
+    def _shared_http_client(self):
+        """Return the process-wide HTTP client, creating it on first use.
+
+        One pooled client lets forecast/tariff fetches reuse keep-alive
+        connections and TLS sessions instead of each provider holding its own.
+        """
+        if self._http is None:
+            import httpx
+
+            self._http = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=8,
+                    keepalive_expiry=75.0,
+                ),
+            )
+        return self._http
+
     def _create_providers(self):
         """Create forecast and tariff provider instances."""
         solar_provider = None
@@ -1174,14 +1307,15 @@ class Application:
             ForecastSolarProvider,
         )
 
-        solar_provider = ForecastSolarProvider(self.config.providers.solar)
+        http = self._shared_http_client()
+        solar_provider = ForecastSolarProvider(self.config.providers.solar, client=http)
         self._providers.append(solar_provider)
         logger.info("Solar provider: Forecast.Solar")
 
         # Weather (Open-Meteo)
         from power_master.forecast.providers.openmeteo import OpenMeteoProvider
 
-        weather_provider = OpenMeteoProvider(self.config.providers.weather)
+        weather_provider = OpenMeteoProvider(self.config.providers.weather, client=http)
         self._providers.append(weather_provider)
         logger.info("Weather provider: Open-Meteo")
 
@@ -1189,7 +1323,7 @@ class Application:
         if self.config.storm.enabled and self.config.providers.storm.location_aac:
             from power_master.forecast.providers.bom_storm import BOMStormProvider
 
-            storm_provider = BOMStormProvider(self.config.providers.storm)
+            storm_provider = BOMStormProvider(self.config.providers.storm, client=http)
             self._providers.append(storm_provider)
             logger.info("Storm provider: BOM (%s)", self.config.providers.storm.state_code)
 
@@ -1200,7 +1334,7 @@ class Application:
             if self.config.providers.tariff.api_key:
                 from power_master.tariff.providers.amber import AmberProvider
 
-                tariff_provider = AmberProvider(self.config.providers.tariff)
+                tariff_provider = AmberProvider(self.config.providers.tariff, client=http)
                 self._providers.append(tariff_provider)
                 logger.info("Tariff provider: Amber Electric")
         elif tariff_type == "tou":
@@ -1260,7 +1394,12 @@ class Application:
             publisher = MQTTPublisher(
                 publish_fn=client.publish,
                 topic_prefix=self.config.mqtt.topic_prefix,
+                publish_many_fn=client.publish_many,
+                flush_interval=self.config.mqtt.coalesce_interval_seconds or None,
             )
+            # A dropped session may have lost sends (or the broker its
+            # retained values) — re-send everything once it reconnects
+            client.on_session_close(publisher.reset_cache)
 
             # HA auto-discovery
             if self.config.mqtt.ha_discovery_enabled:
@@ -1268,6 +1407,7 @@ class Application:
                     publish_fn=client.publish,
                     topic_prefix=self.config.mqtt.topic_prefix,
                     ha_prefix=self.config.mqtt.ha_discovery_prefix,
+                    publish_many_fn=client.publish_many,
                 )
                 logger.info("Published %d HA discovery entities", count)
 
@@ -1305,6 +1445,41 @@ class Application:
 
     # ── Background task loops ────────────────────────────────
 
+    async def _sleep_or_stop(
+        self, seconds: float, wake: tuple[asyncio.Event, ...] = (),
+    ) -> bool:
+        """Sleep up to *seconds*, waking as soon as stop() sets the stop event.
+
+        Any event in *wake* also ends the sleep early (without being
+        cleared).  Returns True when shutdown was requested so loops can
+        exit cleanly instead of unwinding a CancelledError.
+        """
+        if self._stop_event.is_set():
+            return True
+        if wake:
+            if any(event.is_set() for event in wake):
+                return False
+            waiters = [
+                asyncio.ensure_future(event.wait())
+                for event in (self._stop_event, *wake)
+            ]
+            try:
+                await asyncio.wait(
+                    waiters, timeout=seconds, return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+            return self._stop_event.is_set()
+        # asyncio.timeout cancels the wait in place; wait_for would wrap the
+        # wait in an extra Task on every loop iteration.
+        try:
+            async with asyncio.timeout(seconds):
+                await self._stop_event.wait()
+        except TimeoutError:
+            return False
+        return True
+
     async def _forecast_update_loop(
         self, aggregator, storm_monitor, health_checker,
         history, accounting, rebuild_evaluator,
@@ -1317,11 +1492,11 @@ class Application:
         weather_interval = self.config.providers.weather.update_interval_seconds
         storm_interval = self.config.providers.storm.update_interval_seconds
 
-        # Track last update times
-        last_tariff = 0.0
-        last_solar = 0.0
-        last_weather = 0.0
-        last_storm = 0.0
+        # Track last update times (event-loop clock; -inf = never, update now)
+        last_tariff = float("-inf")
+        last_solar = float("-inf")
+        last_weather = float("-inf")
+        last_storm = float("-inf")
 
         # Circuit breaker: track consecutive failures per provider
         provider_failures: dict[str, int] = {
@@ -1331,13 +1506,18 @@ class Application:
             "storm": 0,
         }
 
-        import time
-
+        loop_time = asyncio.get_running_loop().time
         spike_was_active = False
 
         while not self._stop_event.is_set():
+            # Take and clear the wake flags up front: a flag left set by a
+            # failing iteration would skip the sleep and spin the refreshes
+            cap_exhausted = self._cap_exhausted_rebuild_needed.is_set()
+            self._cap_exhausted_rebuild_needed.clear()
+            soc_rebuild = self._soc_rebuild_needed.is_set()
+            self._soc_rebuild_needed.clear()
             try:
-                now = time.monotonic()
+                now = loop_time()
 
                 persist_enabled = self.config.providers.forecast_persistence_enabled
                 horizons = self.config.providers.forecast_horizons_hours
@@ -1527,12 +1707,13 @@ class Application:
 
                 # Publish storm/spike status via MQTT
                 if mqtt_publisher:
-                    await mqtt_publisher.publish_storm(storm_monitor.is_active)
-                    await mqtt_publisher.publish_spike(
-                        aggregator.spike_detector.is_spike_active,
-                    )
-                    summary = accounting.get_summary()
-                    await mqtt_publisher.publish_wacb(summary.wacb_cents)
+                    async with mqtt_publisher.batch():
+                        await mqtt_publisher.publish_storm(storm_monitor.is_active)
+                        await mqtt_publisher.publish_spike(
+                            aggregator.spike_detector.is_spike_active,
+                        )
+                        summary = accounting.get_summary()
+                        await mqtt_publisher.publish_wacb(summary.wacb_cents)
 
                 # Update storm state on control loop for hierarchy evaluation
                 async with self._storm_lock:
@@ -1632,8 +1813,7 @@ class Application:
                 # Free-window cap just exhausted: refresh pricing (so the free
                 # window reads as paid) and rebuild immediately so charging stops
                 # and the plan reverts to self-use for the rest of the day.
-                if self._cap_exhausted_rebuild_needed.is_set():
-                    self._cap_exhausted_rebuild_needed.clear()
+                if cap_exhausted:
                     try:
                         await asyncio.wait_for(aggregator.update_tariff(), timeout=10.0)
                     except Exception:
@@ -1645,8 +1825,7 @@ class Application:
                     )
 
                 # Check if control loop flagged urgent SOC deviation
-                if self._soc_rebuild_needed.is_set():
-                    self._soc_rebuild_needed.clear()
+                if soc_rebuild:
                     telemetry = control_loop.state.last_telemetry
                     current_soc = telemetry.soc if telemetry else 0.5
                     soc_result = rebuild_evaluator.evaluate(
@@ -1676,98 +1855,112 @@ class Application:
             except Exception:
                 logger.exception("Error in forecast update loop iteration")
 
-            # Sleep before next check
-            try:
-                await asyncio.wait_for(
-                    self._stop_event.wait(),
-                    timeout=min(tariff_interval, 60),
-                )
+            # Sleep before next check — a flagged SOC deviation or cap
+            # exhaustion wakes the loop straight away to rebuild.
+            if await self._sleep_or_stop(
+                min(tariff_interval, 60),
+                wake=(self._soc_rebuild_needed, self._cap_exhausted_rebuild_needed),
+            ):
                 break
-            except asyncio.TimeoutError:
-                pass
 
     async def _history_flush_loop(self, history):
         """Flush history buffer and checkpoint WAL periodically."""
-        from power_master.db.engine import checkpoint_wal
-
         while not self._stop_event.is_set():
-            try:
-                await asyncio.wait_for(
-                    self._stop_event.wait(), timeout=HISTORY_FLUSH_INTERVAL_SECONDS,
-                )
+            if await self._sleep_or_stop(HISTORY_FLUSH_INTERVAL_SECONDS):
                 break
-            except asyncio.CancelledError:
-                raise
-            except asyncio.TimeoutError:
-                pass
-            await history.flush_telemetry()
-            await checkpoint_wal()
+            try:
+                await history.flush_telemetry()
+                await checkpoint_wal()
+            except Exception:
+                logger.exception("History flush failed")
+
+    async def _flush_write_batch(self, repo) -> None:
+        """Commit buffered telemetry and staged accounting writes together.
+
+        One commit (and one WAL fsync) covers every row since the last
+        flush.  Caller must hold _telemetry_buffer_lock.
+        """
+        accounting = self._accounting
+        events, kv = accounting.drain_staged() if accounting else ([], {})
+        try:
+            await repo.store_write_batch(self._telemetry_buffer, events, kv)
+        except Exception:
+            if accounting:
+                accounting.restore_staged(events, kv)
+            raise
+        self._telemetry_buffer.clear()
+        self._telemetry_buffer_flush_time = time.monotonic()
 
     async def _telemetry_flush_loop(self, repo):
-        """Flush telemetry buffer periodically."""
+        """Flush telemetry buffer and staged accounting writes periodically."""
         while not self._stop_event.is_set():
-            try:
-                await asyncio.wait_for(
-                    self._stop_event.wait(), timeout=TELEMETRY_BUFFER_FLUSH_SECONDS,
-                )
+            if await self._sleep_or_stop(TELEMETRY_BUFFER_FLUSH_SECONDS):
                 break
-            except asyncio.CancelledError:
-                raise
-            except asyncio.TimeoutError:
-                pass
 
-            # Flush pending telemetry records
+            # Flush pending telemetry records and staged accounting writes
             async with self._telemetry_buffer_lock:
-                if self._telemetry_buffer:
-                    try:
-                        await repo.store_telemetry_batch(self._telemetry_buffer)
-                        self._telemetry_buffer.clear()
-                        self._telemetry_buffer_flush_time = time.monotonic()
-                    except Exception:
-                        logger.exception("Telemetry batch flush failed")
+                try:
+                    await self._flush_write_batch(repo)
+                except Exception:
+                    logger.exception("Telemetry batch flush failed")
 
     async def _resilience_loop(self, resilience_mgr, event_bus=None):
         """Periodically evaluate resilience level."""
         interval = self.config.resilience.health_check_interval_seconds
         while not self._stop_event.is_set():
-            try:
-                await asyncio.wait_for(
-                    self._stop_event.wait(), timeout=interval,
-                )
+            if await self._sleep_or_stop(interval):
                 break
-            except asyncio.CancelledError:
-                raise
-            except asyncio.TimeoutError:
-                pass
-            old_level = resilience_mgr.level
-            changed = resilience_mgr.evaluate()
-            if changed:
-                logger.warning(
-                    "Resilience level: %s (unhealthy: %s)",
-                    resilience_mgr.level.value,
-                    resilience_mgr.state.unhealthy_providers,
-                )
-                if event_bus and self.config.notifications.enabled:
-                    from power_master.notifications.bus import Event as _NEvent
-                    from power_master.resilience.manager import ResilienceLevel
-                    new_level = resilience_mgr.level
-                    if new_level.value > old_level.value:
-                        await event_bus.publish(_NEvent(
-                            name="resilience_degraded",
-                            severity="warning",
-                            title=f"System Degraded: {new_level.value}",
-                            message=f"Unhealthy providers: {', '.join(resilience_mgr.state.unhealthy_providers)}",
-                            data={"level": new_level.value},
-                        ))
-                    elif new_level == ResilienceLevel.NORMAL:
-                        await event_bus.publish(_NEvent(
-                            name="resilience_recovered",
-                            severity="info",
-                            title="System Recovered",
-                            message="All providers are healthy. Resilience level: NORMAL.",
-                        ))
+            try:
+                await self._evaluate_resilience(resilience_mgr, event_bus)
+            except Exception:
+                logger.exception("Resilience evaluation failed")
+
+    async def _evaluate_resilience(self, resilience_mgr, event_bus=None) -> None:
+        """Re-evaluate the resilience level and notify on a change."""
+        old_level = resilience_mgr.level
+        changed = resilience_mgr.evaluate()
+        if changed:
+            logger.warning(
+                "Resilience level: %s (unhealthy: %s)",
+                resilience_mgr.level.value,
+                resilience_mgr.state.unhealthy_providers,
+            )
+            if event_bus and self.config.notifications.enabled:
+                from power_master.notifications.bus import Event as _NEvent
+                from power_master.resilience.manager import ResilienceLevel
+                new_level = resilience_mgr.level
+                if new_level.value > old_level.value:
+                    await event_bus.publish(_NEvent(
+                        name="resilience_degraded",
+                        severity="warning",
+                        title=f"System Degraded: {new_level.value}",
+                        message=f"Unhealthy providers: {', '.join(resilience_mgr.state.unhealthy_providers)}",
+                        data={"level": new_level.value},
+                    ))
+                elif new_level == ResilienceLevel.NORMAL:
+                    await event_bus.publish(_NEvent(
+                        name="resilience_recovered",
+                        severity="info",
+                        title="System Recovered",
+                        message="All providers are healthy. Resilience level: NORMAL.",
+                    ))
 
     async def _telemetry_poll_loop(self, adapter, control_loop, repo=None, load_manager=None, event_bus=None) -> None:
+        """Run the telemetry poller, finishing its last DB write on any exit.
+
+        The throttled store runs as its own task; waiting for it here, also
+        on cancellation, keeps it from outliving the poller and the database.
+        """
+        try:
+            await self._poll_telemetry(adapter, control_loop, repo, load_manager, event_bus)
+        finally:
+            store_task, self._poll_store_task = self._poll_store_task, None
+            if store_task is not None:
+                await store_task
+
+    async def _poll_telemetry(
+        self, adapter, control_loop, repo=None, load_manager=None, event_bus=None,
+    ) -> None:
         """Poll inverter telemetry frequently for responsive dashboard updates.
 
         Also stores to DB every 60s so historical charts have continuous
@@ -1776,22 +1969,27 @@ class Application:
         Uses self._adapter (not the initial parameter) so hot-reloaded
         adapters are picked up automatically.
         """
-        import time as _time
+        # Event-loop clock (same monotonic source as the sleeps below)
+        loop_time = asyncio.get_running_loop().time
 
         interval = max(1, int(self.config.hardware.foxess.poll_interval_seconds))
         db_store_interval: int = DB_STORE_INTERVAL_SECONDS
         load_poll_interval: int = LOAD_POLL_INTERVAL_SECONDS
         reconnect_interval: int = RECONNECT_INTERVAL_SECONDS
-        last_db_store: float = 0.0
-        last_load_poll: float = 0.0
-        last_reconnect_attempt: float = 0.0
+        last_db_store: float = float("-inf")
+        last_load_poll: float = float("-inf")
+        last_reconnect_attempt: float = float("-inf")
+        # Throttled DB store runs in the background so a slow write never
+        # delays polling; a store still in flight skips the next one
+        self._poll_store_task = None
         _was_connected: bool = True  # assume connected at startup
         logger.info("Telemetry poll loop starting (interval: %ds)", interval)
         while not self._stop_event.is_set():
             # Always use the latest adapter (may be swapped by config reload)
             current_adapter = self._adapter
             if current_adapter is None:
-                await asyncio.sleep(interval)
+                if await self._sleep_or_stop(interval):
+                    break
                 continue
 
             # Attempt reconnect if disconnected
@@ -1823,7 +2021,7 @@ class Application:
                         fallback_message="Lost connection to the inverter — retrying every 30s.",
                     )
                 _was_connected = False
-                now_mono = _time.monotonic()
+                now_mono = loop_time()
                 if (now_mono - last_reconnect_attempt) >= reconnect_interval:
                     last_reconnect_attempt = now_mono
                     try:
@@ -1854,11 +2052,8 @@ class Application:
                             self._grid_outage_since = None
                     except Exception:
                         logger.warning("Inverter reconnect failed, will retry in %ds", reconnect_interval)
-                try:
-                    await asyncio.wait_for(self._stop_event.wait(), timeout=interval)
+                if await self._sleep_or_stop(interval):
                     break
-                except asyncio.TimeoutError:
-                    pass
                 continue
 
             try:
@@ -1866,24 +2061,16 @@ class Application:
                 control_loop.update_live_telemetry(telemetry)
 
                 # Persist to DB at a throttled rate for chart continuity
-                now_mono = _time.monotonic()
+                now_mono = loop_time()
                 if repo is not None and (now_mono - last_db_store) >= db_store_interval:
-                    try:
-                        await repo.store_telemetry(
-                            soc=telemetry.soc,
-                            battery_power_w=telemetry.battery_power_w,
-                            solar_power_w=telemetry.solar_power_w,
-                            grid_power_w=telemetry.grid_power_w,
-                            load_power_w=telemetry.load_power_w,
-                            battery_voltage=telemetry.battery_voltage,
-                            battery_temp_c=telemetry.battery_temp_c,
-                            inverter_mode=telemetry.inverter_mode,
-                            grid_available=telemetry.grid_available,
-                            raw_data=telemetry.raw_data,
+                    if self._poll_store_task is not None and not self._poll_store_task.done():
+                        logger.warning("Skipping telemetry store: previous write still in flight")
+                    else:
+                        self._poll_store_task = asyncio.create_task(
+                            self._store_poll_telemetry(repo, telemetry),
+                            name="telemetry_poll_store",
                         )
-                        last_db_store = now_mono
-                    except Exception:
-                        logger.debug("Poll loop DB store failed", exc_info=True)
+                    last_db_store = now_mono
 
                 # Poll load device statuses for runtime tracking + schedule execution
                 if load_manager and (now_mono - last_load_poll) >= load_poll_interval:
@@ -1895,7 +2082,7 @@ class Application:
                         plan = control_loop.state.current_plan
                         if plan is not None:
                             load_cmds = await load_manager.execute_current_slot(plan, repo=repo)
-                            if load_cmds:
+                            if load_cmds and logger.isEnabledFor(logging.INFO):
                                 logger.info(
                                     "Load schedule: %d commands (%s)",
                                     len(load_cmds),
@@ -1909,13 +2096,16 @@ class Application:
             except Exception:
                 logger.warning("Telemetry poll read failed", exc_info=True)
 
-            try:
-                await asyncio.wait_for(self._stop_event.wait(), timeout=interval)
+            if await self._sleep_or_stop(interval):
                 break
-            except asyncio.CancelledError:
-                raise
-            except asyncio.TimeoutError:
-                pass
+
+    @staticmethod
+    async def _store_poll_telemetry(repo, telemetry) -> None:
+        """Persist one poll-loop telemetry sample, logging (not raising) failures."""
+        try:
+            await repo.store_telemetry_row(_telemetry_row(telemetry))
+        except Exception:
+            logger.debug("Poll loop DB store failed", exc_info=True)
 
     async def _run_solver(
         self, aggregator, storm_monitor, accounting,
@@ -1924,8 +2114,6 @@ class Application:
         trigger: str = "periodic",
     ):
         """Build solver inputs and run the MILP optimisation."""
-        from power_master.optimisation.solver import SolverInputs, solve
-
         state = aggregator.state
         n_slots = (self.config.planning.horizon_hours * 60) // self.config.planning.slot_duration_minutes
         slot_minutes = self.config.planning.slot_duration_minutes
@@ -1935,9 +2123,11 @@ class Application:
         now = datetime.now(timezone.utc)
         floor_min = (now.minute // slot_minutes) * slot_minutes
         now_floored = now.replace(minute=floor_min, second=0, microsecond=0)
-        slot_start_times = [
-            now_floored + timedelta(minutes=i * slot_minutes) for i in range(n_slots)
-        ]
+        # Epoch seconds of each slot start are shared by the solar and
+        # tariff lookups so the horizon is converted once per solve.
+        slot_start_times, slot_start_epochs = self._slot_grid(
+            now_floored, slot_minutes, n_slots,
+        )
 
         # Solar forecast — fill from aggregator, fallback to bell curve, or default to 0
         solar_forecast_w = [0.0] * n_slots
@@ -1946,8 +2136,6 @@ class Application:
 
         # If Solcast is stale/missing and system size is configured, use bell curve fallback
         if (not state.has_solar or not state.solar) and system_size_kw > 0:
-            from power_master.forecast.solar_estimate import build_fallback_forecast, merge_solar_forecasts
-
             # Build cloud cover map from weather forecast if available
             cloud_cover_by_hour: dict[int, float] = {}
             if state.has_weather and state.weather:
@@ -1966,12 +2154,12 @@ class Application:
 
         if solar_source and solar_source.slots:
             matched_solar = 0
-            for i, t in enumerate(slot_start_times):
-                for slot in solar_source.slots:
-                    if slot.start <= t < slot.end:
-                        solar_forecast_w[i] = slot.pv_estimate_w
-                        matched_solar += 1
-                        break
+            for i, slot in enumerate(match_slots(
+                solar_source.slots, slot_start_times, slot_start_epochs,
+            )):
+                if slot is not None:
+                    solar_forecast_w[i] = slot.pv_estimate_w
+                    matched_solar += 1
             nonzero_solar = sum(1 for v in solar_forecast_w if v > 0)
             logger.info(
                 "Solar matching: %d/%d plan slots matched, %d non-zero. "
@@ -1998,7 +2186,6 @@ class Application:
         async with self._model_lock:
             solar_model = self._solar_calibration_model
         if solar_model is not None:
-            from power_master.forecast.solar_calibration import apply_calibration
             calibrated = apply_calibration(solar_forecast_w, slot_start_times, solar_model)
             raw_sum = sum(solar_forecast_w)
             cal_sum = sum(calibrated)
@@ -2031,7 +2218,6 @@ class Application:
         is_spike = [False] * n_slots
 
         # Phase 2: Volume-tiered export structures
-        from power_master.optimisation.solver import ExportTier, ExportTierStructure
         export_tier_structures = [ExportTierStructure() for _ in range(n_slots)]
 
         if state.has_tariff and state.tariff:
@@ -2040,12 +2226,16 @@ class Application:
             # Get tariff provider if available (Phase 2: volume-tiered export)
             tariff_provider = aggregator.tariff_provider
 
+            tariff_matches = state.tariff.get_slots_at(
+                slot_start_times, slot_start_epochs,
+            )
+            spike_threshold = self.config.arbitrage.spike_threshold_cents
             for i, t in enumerate(slot_start_times):
-                tariff_slot = state.tariff.get_slot_at(t)
+                tariff_slot = tariff_matches[i]
                 if tariff_slot:
                     import_rate_cents[i] = tariff_slot.import_price_cents
                     export_rate_cents[i] = tariff_slot.export_price_cents
-                    is_spike[i] = tariff_slot.import_price_cents >= self.config.arbitrage.spike_threshold_cents
+                    is_spike[i] = tariff_slot.import_price_cents >= spike_threshold
 
                     # Phase 2: Build tier structure from StaticTariffProvider (if available)
                     if tariff_provider and hasattr(tariff_provider, "get_export_tier_structure"):
@@ -2068,16 +2258,9 @@ class Application:
                     unmatched.append(i)
 
             # Gap-fill: use nearest matched neighbor for unmatched slots
-            unmatched_set = set(unmatched)
+            nearest_matched = _nearest_matched([m is not None for m in tariff_matches])
             for i in unmatched:
-                nearest = None
-                for offset in range(1, n_slots):
-                    if i - offset >= 0 and (i - offset) not in unmatched_set:
-                        nearest = i - offset
-                        break
-                    if i + offset < n_slots and (i + offset) not in unmatched_set:
-                        nearest = i + offset
-                        break
+                nearest = nearest_matched[i]
                 if nearest is not None:
                     import_rate_cents[i] = import_rate_cents[nearest]
                     export_rate_cents[i] = export_rate_cents[nearest]
@@ -2085,7 +2268,6 @@ class Application:
                     export_tier_structures[i] = export_tier_structures[nearest]
 
             # Phase 2: Low-import credit window structures
-            from power_master.optimisation.solver import CreditWindowInfo
             credit_windows = [CreditWindowInfo() for _ in range(n_slots)]
 
             if tariff_provider and hasattr(tariff_provider, "get_credit_windows"):
@@ -2144,10 +2326,25 @@ class Application:
 
         # Extract incumbent slot-0 mode from current plan for hysteresis (mode-switch stability)
         incumbent_mode = None
-        if control_loop.state.current_plan:
-            current_slot = control_loop.state.current_plan.get_current_slot()
+        warm_start_charging = None
+        previous_soc = None
+        current_plan = control_loop.state.current_plan
+        if current_plan:
+            current_slot = current_plan.get_current_slot()
             if current_slot:
                 incumbent_mode = current_slot.mode
+            # Warm-start CBC from the previous plan unless the storm reserve
+            # flipped, which changes the model enough to make it a poor hint
+            if current_plan.metrics.get("storm_active") == storm_monitor.is_active:
+                warm_start_charging = warm_start_from_plan(
+                    current_plan, slot_start_times, current_soc,
+                )
+                # Storm and SOC-deviation rebuilds need a full re-plan
+                if (
+                    self.config.planning.fix_tail_slots > 0
+                    and trigger not in ("storm", "soc_deviation")
+                ):
+                    previous_soc = previous_soc_from_plan(current_plan, slot_start_times)
 
         inputs = SolverInputs(
             solar_forecast_w=solar_forecast_w,
@@ -2163,13 +2360,15 @@ class Application:
             export_tier_structures=export_tier_structures,
             credit_windows=credit_windows,
             incumbent_mode=incumbent_mode,
+            warm_start_charging=warm_start_charging,
+            previous_soc=previous_soc,
         )
 
-        # Run solver in thread pool to avoid blocking
+        # Run solver on its own thread to avoid blocking the event loop
         version = await repo.get_next_plan_version()
         loop = asyncio.get_running_loop()
         plan = await loop.run_in_executor(
-            None, solve, self.config, inputs, trigger, version,
+            self._solver_executor, solve, self.config, inputs, trigger, version,
         )
 
         # Validate solver status before storing/activating plan
@@ -2241,8 +2440,6 @@ class Application:
         # Second pass: schedule controllable loads into plan slots.
         if load_manager is not None:
             try:
-                from power_master.optimisation.load_scheduler import schedule_loads
-
                 scheduled = schedule_loads(
                     plan,
                     available_loads=load_manager.get_load_configs(),
@@ -2255,7 +2452,8 @@ class Application:
                 logger.warning("Load scheduling failed; continuing with base plan", exc_info=True)
 
         # Store plan and slots in DB
-        plan_id = await repo.store_plan(
+        plan.metrics["config_hash"] = _config_hash(self.config)
+        await repo.store_plan(
             version=plan.version,
             trigger_reason=plan.trigger_reason,
             horizon_start=plan.horizon_start.isoformat(),
@@ -2264,9 +2462,8 @@ class Application:
             solver_time_ms=plan.solver_time_ms,
             metrics=plan.metrics,
             active_constraints=plan.active_constraints,
+            slots=plan.slots_to_db_dicts(),
         )
-        if plan.slots:
-            await repo.store_plan_slots(plan_id, plan.slots_to_db_dicts())
 
         # Update control loop with new plan (under lock to prevent control loop conflicts)
         async with self._plan_lock:
@@ -2280,17 +2477,48 @@ class Application:
 
         return plan
 
+    async def _restore_plan(self, repo, control_loop, rebuild_evaluator) -> bool:
+        """Install the persisted active plan if it is still usable at startup.
+
+        Usable means it was built from the current config, still covers the
+        current slot, and is not due for a periodic rebuild in the next
+        few minutes.  Returns True when the plan was installed.
+        """
+        from power_master.optimisation.plan import OptimisationPlan
+
+        try:
+            row = await repo.get_active_plan()
+            if row is None:
+                return False
+            plan = OptimisationPlan.from_db(row, await repo.get_plan_slots(row["id"]))
+        except Exception:
+            logger.warning("Could not load persisted plan — re-solving", exc_info=True)
+            return False
+
+        if plan.metrics.get("config_hash") != _config_hash(self.config):
+            return False
+        now = datetime.now(timezone.utc)
+        valid_until = plan.created_at + timedelta(
+            seconds=self.config.planning.periodic_rebuild_interval_seconds,
+        )
+        if valid_until <= now + timedelta(minutes=5) or plan.get_current_slot() is None:
+            return False
+
+        async with self._plan_lock:
+            control_loop.set_plan(plan)
+        age_s = (now - plan.created_at).total_seconds()
+        rebuild_evaluator.mark_rebuilt(trigger="restored", age_seconds=age_s)
+        logger.info("Restored plan v%d from DB (age %ds)", plan.version, int(age_s))
+        return True
+
     async def _forecast_prune_loop(self, repo):
         """Delete forecast samples older than providers.forecast_retention_days.
 
         Runs once per hour, a trivial DELETE on an indexed column.
         """
         # Let the app warm up before first prune
-        try:
-            await asyncio.wait_for(self._stop_event.wait(), timeout=300)
+        if await self._sleep_or_stop(300):
             return
-        except asyncio.TimeoutError:
-            pass
         while not self._stop_event.is_set():
             try:
                 retention_days = self.config.providers.forecast_retention_days
@@ -2303,13 +2531,39 @@ class Application:
                     )
             except Exception:
                 logger.exception("Forecast sample prune failed")
-            try:
-                await asyncio.wait_for(self._stop_event.wait(), timeout=3600)
+            if await self._sleep_or_stop(3600):
                 return
-            except asyncio.CancelledError:
-                raise
-            except asyncio.TimeoutError:
+
+    async def _loop_lag_monitor(self, mqtt_publisher=None) -> None:
+        """Measure how late the event loop wakes from a short sleep.
+
+        Oversleep beyond LOOP_LAG_PROBE_SECONDS is time some callback held
+        the loop.  The worst lag per report window is published over MQTT
+        and logged when it exceeds LOOP_LAG_WARN_SECONDS.
+        """
+        loop_time = asyncio.get_running_loop().time
+        window_max = 0.0
+        window_start = loop_time()
+        while True:
+            t0 = loop_time()
+            if await self._sleep_or_stop(LOOP_LAG_PROBE_SECONDS):
+                return
+            now = loop_time()
+            window_max = max(window_max, now - t0 - LOOP_LAG_PROBE_SECONDS)
+            if now - window_start < LOOP_LAG_REPORT_SECONDS:
                 continue
+            if window_max > LOOP_LAG_WARN_SECONDS:
+                logger.warning(
+                    "Event loop lag: max %.3fs over the last %ds",
+                    window_max, LOOP_LAG_REPORT_SECONDS,
+                )
+            if mqtt_publisher:
+                try:
+                    await mqtt_publisher.publish_loop_lag(window_max * 1000)
+                except Exception:
+                    logger.debug("MQTT loop lag publish failed", exc_info=True)
+            window_max = 0.0
+            window_start = now
 
     async def _notification_maintenance_loop(
         self, repo, event_bus, control_loop, aggregator, storm_monitor,
@@ -2330,13 +2584,8 @@ class Application:
         except Exception:
             last_briefing_date = None
         while not self._stop_event.is_set():
-            try:
-                await asyncio.wait_for(self._stop_event.wait(), timeout=60)
+            if await self._sleep_or_stop(60):
                 return
-            except asyncio.CancelledError:
-                raise
-            except asyncio.TimeoutError:
-                pass
             try:
                 cfg = self.config.notifications
                 # Notification log prune (once per iteration is cheap)
@@ -2597,22 +2846,21 @@ class Application:
         1. Historical day-of-week + hour-of-day patterns (if enough data)
         2. Configured 4-hour block averages from load_profile config
         """
-        from power_master.history.prediction import LoadPredictor
-
         profile_cfg = self.config.load_profile
         load_tz = resolve_timezone(profile_cfg.timezone)
 
         # Try historic prediction first
-        predictor = LoadPredictor(repo, timezone_name=profile_cfg.timezone)
-        await predictor.rebuild_profile(lookback_days=28)
+        predictor = await self._get_load_predictor(repo)
+
+        local_slots = _local_weekday_hours(slot_start_times, load_tz)
+        hour_defaults = [profile_cfg.get_for_hour(h) for h in range(24)]
 
         if predictor._profile is not None:
             # Historic data available — use it with config fallback per-slot
             forecast = []
-            for t in slot_start_times:
-                local_hour = t.astimezone(load_tz).hour
-                predicted = predictor.predict(
-                    t, default_w=profile_cfg.get_for_hour(local_hour),
+            for weekday, hour in local_slots:
+                predicted = predictor.predict_local(
+                    weekday, hour, default_w=hour_defaults[hour],
                 )
                 forecast.append(max(0.0, predicted))
             logger.info(
@@ -2621,15 +2869,68 @@ class Application:
             return forecast
 
         # Fall back to configured 4-hour block profile
-        forecast = [
-            profile_cfg.get_for_hour(t.astimezone(load_tz).hour)
-            for t in slot_start_times
-        ]
+        forecast = [hour_defaults[hour] for _, hour in local_slots]
         logger.info(
             "Load forecast: using configured profile (no historic data)",
         )
         return forecast
 
+    def _slot_grid(
+        self, start: datetime, slot_minutes: int, n_slots: int,
+    ) -> tuple[list[datetime], list[float]]:
+        """Slot start times and epochs for a horizon beginning at *start*.
+
+        Successive solves share most of their horizon, so the previous grid
+        is reused: unchanged when the start is the same, otherwise shifted
+        forward with only the new tail slots constructed.  Copies are
+        returned so callers may not disturb the cache.
+        """
+        step = timedelta(minutes=slot_minutes)
+        step_s = slot_minutes * 60
+        cached = self._slot_cache
+        times: list[datetime] | None = None
+        if cached is not None and cached[1] == slot_minutes:
+            cached_start, _, cached_times, cached_epochs = cached
+            shift, rem = divmod(start - cached_start, step)
+            if not rem and 0 <= shift < min(len(cached_times), n_slots):
+                times = cached_times[shift:n_slots + shift]
+                epochs = cached_epochs[shift:n_slots + shift]
+                last_t, last_e = times[-1], epochs[-1]
+                for i in range(1, n_slots - len(times) + 1):
+                    times.append(last_t + i * step)
+                    epochs.append(last_e + i * step_s)
+        if times is None:
+            base = start.timestamp()
+            times = [start + i * step for i in range(n_slots)]
+            epochs = [base + i * step_s for i in range(n_slots)]
+        self._slot_cache = (start, slot_minutes, times, epochs)
+        return list(times), list(epochs)
+
+    async def _get_load_predictor(self, repo):
+        """Return the cached LoadPredictor, rebuilding its profile when stale.
+
+        The 28-day history scan is only repeated every
+        LOAD_PROFILE_REFRESH_SECONDS, or straight away when the load-profile
+        timezone has been changed by a config reload.
+        """
+        from power_master.history.prediction import LoadPredictor
+
+        tz_name = self.config.load_profile.timezone
+        predictor = self._load_predictor
+        now = time.monotonic()
+        if (
+            predictor is not None
+            and predictor._timezone_name == tz_name
+            and now - self._load_predictor_built_at < LOAD_PROFILE_REFRESH_SECONDS
+        ):
+            return predictor
+
+        predictor = LoadPredictor(repo, timezone_name=tz_name)
+        await predictor.rebuild_profile(lookback_days=28)
+        self._load_predictor = predictor
+        self._load_predictor_built_at = now
+        return predictor
+
     async def _build_ev_forecast(
         self,
         slot_start_times: list[datetime],
@@ -2771,7 +3072,7 @@ def main() -> None:
                 with contextlib.suppress(Exception):
                     await app.stop()
 
-    loop = asyncio.new_event_loop()
+    loop = _new_event_loop(config.use_uvloop)
     asyncio.set_event_loop(loop)
 
     def _request_stop() -> None:
@@ -2810,6 +3111,100 @@ def main() -> None:
         loop.close()
 
 
+def _new_event_loop(use_uvloop: bool) -> asyncio.AbstractEventLoop:
+    """Create the main event loop, preferring uvloop when enabled and installed.
+
+    uvloop ships with uvicorn[standard]; fall back to the stock loop if it
+    is missing.  Note that profiles taken under uvloop show libuv frames,
+    so filters on asyncio's selectors.py will not match.
+    """
+    if use_uvloop:
+        try:
+            import uvloop
+
+            logger.info("Using uvloop event loop")
+            return uvloop.new_event_loop()
+        except ImportError:
+            logger.info("uvloop not installed — using default asyncio event loop")
+    return asyncio.new_event_loop()
+
+
+def _local_weekday_hours(times: list[datetime], tz) -> list[tuple[int, int]]:
+    """Local (weekday, hour) in *tz* for each aware datetime in *times*.
+
+    Only the first and last times are converted; the rest are derived by
+    offset arithmetic when both ends share a UTC offset (no DST change in
+    the range), otherwise every time is converted.
+    """
+    if not times:
+        return []
+    first = times[0].astimezone(tz)
+    if first.utcoffset() != times[-1].astimezone(tz).utcoffset():
+        return [(lt.weekday(), lt.hour) for lt in (t.astimezone(tz) for t in times)]
+
+    t0 = times[0]
+    base_s = ((first.weekday() * 24 + first.hour) * 60 + first.minute) * 60 + first.second
+    week_s = 7 * 86400
+    result = []
+    for t in times:
+        s = (base_s + int((t - t0).total_seconds())) % week_s
+        result.append((s // 86400, (s % 86400) // 3600))
+    return result
+
+
+def _nearest_matched(matched: list[bool]) -> list[int | None]:
+    """Index of the nearest True entry in *matched* for every position.
+
+    Ties go to the earlier index; None when nothing matched.  Two linear
+    passes carry the last matched index forward and backward, so sparse
+    data costs O(n) rather than an outward scan per gap.
+    """
+    n = len(matched)
+    before: list[int | None] = [None] * n
+    last = None
+    for i in range(n):
+        if matched[i]:
+            last = i
+        before[i] = last
+
+    result: list[int | None] = [None] * n
+    after = None
+    for i in range(n - 1, -1, -1):
+        if matched[i]:
+            after = i
+        prev = before[i]
+        if prev is None or (after is not None and after - i < i - prev):
+            result[i] = after
+        else:
+            result[i] = prev
+    return result
+
+
+def _config_hash(config: AppConfig) -> str:
+    """Stable digest of the full config, stored with each plan."""
+    import hashlib
+
+    return hashlib.blake2b(
+        config.model_dump_json().encode(), digest_size=16,
+    ).hexdigest()
+
+
+def _telemetry_row(telemetry) -> tuple:
+    """Positional telemetry row in Repository.store_telemetry_row order."""
+    return (
+        telemetry.soc,
+        telemetry.battery_power_w,
+        telemetry.solar_power_w,
+        telemetry.grid_power_w,
+        telemetry.load_power_w,
+        telemetry.battery_voltage,
+        telemetry.battery_temp_c,
+        telemetry.inverter_mode,
+        telemetry.grid_available,
+        telemetry.raw_data,
+    )
+
+
 def _time_in_windows(local_hm: tuple[int, int], windows: list[str]) -> bool:
     """Check if a (hour, minute) local time falls in any window.
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 from typing import Any, Callable, Coroutine
 
@@ -13,11 +14,16 @@ logger = logging.getLogger(__name__)
 # Type alias for message callback: (topic, payload) -> None
 MessageCallback = Callable[[str, str], Coroutine[Any, Any, None]]
 
+# Delay before the listener re-opens the session after it was dropped
+_LISTEN_RETRY_SECONDS = 5.0
+
 
 class MQTTClient:
     """Async MQTT client wrapping aiomqtt.
 
     Handles connection, reconnection, and provides publish/subscribe methods.
+    One broker session is kept open and shared by publishes and the listener;
+    it is opened on first use and re-opened after a failure.
     """
 
     def __init__(self, config: MQTTConfig) -> None:
@@ -25,6 +31,10 @@ class MQTTClient:
         self._client: Any = None
         self._connected = False
         self._subscriptions: dict[str, MessageCallback] = {}
+        self._stack: contextlib.AsyncExitStack | None = None
+        self._session: Any = None
+        self._session_lock = asyncio.Lock()
+        self._session_callbacks: list[Callable[[], None]] = []
 
     @property
     def is_connected(self) -> bool:
@@ -56,30 +66,83 @@ class MQTTClient:
     async def disconnect(self) -> None:
         """Disconnect from the broker."""
         self._connected = False
+        await self._close_session()
         self._client = None
 
+    def on_session_close(self, callback: Callable[[], None]) -> None:
+        """Register a callback run each time the broker session is dropped."""
+        self._session_callbacks.append(callback)
+
+    async def _get_session(self) -> Any:
+        """Return the open broker session, connecting if there is none."""
+        async with self._session_lock:
+            if self._session is None:
+                stack = contextlib.AsyncExitStack()
+                self._session = await stack.enter_async_context(self._client)
+                self._stack = stack
+            return self._session
+
+    async def _close_session(self) -> None:
+        """Drop the broker session so the next call reconnects."""
+        stack, self._stack, self._session = self._stack, None, None
+        for callback in self._session_callbacks:
+            callback()
+        if stack is not None:
+            with contextlib.suppress(Exception):
+                await stack.aclose()
+
     async def publish(self, topic: str, payload: str, retain: bool = False) -> None:
         """Publish a message to a topic."""
         if not self._connected or self._client is None:
             return
 
         try:
-            async with self._client as client:
-                await client.publish(topic, payload, retain=retain)
+            session = await self._get_session()
+            await session.publish(topic, payload, retain=retain)
         except Exception as e:
             logger.error("MQTT publish failed for %s: %s", topic, e)
+            await self._close_session()
+
+    async def publish_many(self, messages: list[tuple[str, str, bool]]) -> None:
+        """Publish several (topic, payload, retain) messages on the session.
+
+        The publishes are issued together so the client can write them in
+        one pass; every one runs to completion before a failure is handled.
+        """
+        if not messages or not self._connected or self._client is None:
+            return
+
+        try:
+            session = await self._get_session()
+            results = await asyncio.gather(
+                *(session.publish(topic, payload, retain=retain)
+                  for topic, payload, retain in messages),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        except Exception as e:
+            logger.error("MQTT batch publish failed (%d messages): %s", len(messages), e)
+            await self._close_session()
 
     def subscribe(self, topic: str, callback: MessageCallback) -> None:
         """Register a subscription callback for a topic."""
         self._subscriptions[topic] = callback
 
     async def listen(self) -> None:
-        """Start listening for subscribed messages (blocking)."""
+        """Listen for subscribed messages until disconnected (blocking).
+
+        If the shared session drops (including when a failed publish closes
+        it) the listener backs off, re-opens it and re-subscribes.
+        """
         if not self._connected or self._client is None or not self._subscriptions:
             return
 
-        try:
-            async with self._client as client:
+        while self._connected and self._client is not None:
+            client = None
+            try:
+                client = await self._get_session()
                 for topic in self._subscriptions:
                     await client.subscribe(topic)
 
@@ -93,6 +156,12 @@ class MQTTClient:
                             await callback(topic, payload)
                         except Exception:
                             logger.exception("MQTT callback error for %s", topic)
-        except Exception as e:
-            logger.error("MQTT listener error: %s", e)
-            self._connected = False
+            except Exception as e:
+                logger.error("MQTT listener error: %s", e)
+                # A publish may already have replaced the session; keep that one
+                if client is not None and client is self._session:
+                    await self._close_session()
+
+            if not self._connected:
+                break
+            await asyncio.sleep(_LISTEN_RETRY_SECONDS)
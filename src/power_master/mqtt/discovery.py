@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 from typing import Any, Callable, Coroutine
@@ -11,6 +12,7 @@ from power_master.mqtt.topics import build_topics
 logger = logging.getLogger(__name__)
 
 PublishFn = Callable[[str, str, bool], Coroutine[Any, Any, None]]
+PublishManyFn = Callable[[list[tuple[str, str, bool]]], Coroutine[Any, Any, None]]
 
 # Discovery entities: (unique_id_suffix, name, state_topic_key, unit, device_class, icon)
 _ENTITIES = [
@@ -26,6 +28,7 @@ _ENTITIES = [
     ("storm_active", "Storm Reserve", "storm_active", None, None, "mdi:weather-lightning"),
     ("spike_active", "Price Spike", "spike_active", None, None, "mdi:alert"),
     ("accounting_today", "Today Net Cost", "accounting_today_net", "c", None, "mdi:cash"),
+    ("loop_lag", "Event Loop Lag", "loop_lag", "ms", "duration", "mdi:timer-alert"),
 ]
 
 
@@ -38,6 +41,12 @@ def build_discovery_configs(
     Returns:
         List of (discovery_topic, config_json) tuples.
     """
+    return list(_discovery_configs(topic_prefix, ha_prefix))
+
+
+@functools.lru_cache(maxsize=8)
+def _discovery_configs(topic_prefix: str, ha_prefix: str) -> tuple[tuple[str, str], ...]:
+    """Serialised discovery configs, memoised per (topic_prefix, ha_prefix)."""
     topics = build_topics(topic_prefix)
     configs = []
 
@@ -65,21 +74,28 @@ def build_discovery_configs(
         if device_class:
             config["device_class"] = device_class
 
-        configs.append((discovery_topic, json.dumps(config)))
+        configs.append((discovery_topic, json.dumps(config, separators=(",", ":"))))
 
-    return configs
+    return tuple(configs)
 
 
 async def publish_discovery(
     publish_fn: PublishFn,
     topic_prefix: str = "power_master",
     ha_prefix: str = "homeassistant",
+    publish_many_fn: PublishManyFn | None = None,
 ) -> int:
-    """Publish all HA discovery configs. Returns count published."""
+    """Publish all HA discovery configs. Returns count published.
+
+    With *publish_many_fn* the configs go out as a single batch.
+    """
     configs = build_discovery_configs(topic_prefix, ha_prefix)
 
-    for topic, payload in configs:
-        await publish_fn(topic, payload, True)
+    if publish_many_fn is not None:
+        await publish_many_fn([(topic, payload, True) for topic, payload in configs])
+    else:
+        for topic, payload in configs:
+            await publish_fn(topic, payload, True)
 
     logger.info("Published %d HA discovery configs", len(configs))
     return len(configs)
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
-from typing import Any, Callable, Coroutine
+from collections.abc import AsyncIterator, Callable, Coroutine
+from typing import Any
 
 from power_master.hardware.telemetry import Telemetry
 from power_master.mqtt.topics import build_topics
@@ -12,48 +15,175 @@ logger = logging.getLogger(__name__)
 
 # Type for async publish function: (topic, payload, retain) -> None
 PublishFn = Callable[[str, str, bool], Coroutine[Any, Any, None]]
+# Type for async batch publish function: ([(topic, payload, retain), ...]) -> None
+PublishManyFn = Callable[[list[tuple[str, str, bool]]], Coroutine[Any, Any, None]]
 
 
 class MQTTPublisher:
-    """Publishes telemetry and system state to MQTT topics."""
-
-    def __init__(self, publish_fn: PublishFn, topic_prefix: str = "power_master") -> None:
+    """Publishes telemetry and system state to MQTT topics.
+
+    With *flush_interval* set, publishes are coalesced: each topic's
+    latest payload is held and a background task sends whatever changed
+    once per interval, so bursts of updates cost one flush.
+    """
+
+    def __init__(
+        self,
+        publish_fn: PublishFn,
+        topic_prefix: str = "power_master",
+        publish_many_fn: PublishManyFn | None = None,
+        flush_interval: float | None = None,
+    ) -> None:
         self._publish = publish_fn
+        self._publish_many = publish_many_fn
+        self._flush_interval = flush_interval
         self._topics = build_topics(topic_prefix)
+        # Telemetry topics resolved once — publish_telemetry runs every poll
+        self._t_soc = self._topics["battery_soc"]
+        self._t_battery = self._topics["battery_power"]
+        self._t_solar = self._topics["solar_power"]
+        self._t_grid = self._topics["grid_power"]
+        self._t_load = self._topics["load_total"]
+        # Last payload delivered per topic — unchanged values are not re-sent
+        self._last: dict[str, str] = {}
+        # Bumped by reset_cache so a delivery that lost its session is not recorded
+        self._cache_epoch = 0
+        # Messages queued inside a batch() block, None when not batching
+        self._pending: list[tuple[str, str, bool]] | None = None
+        # Latest (payload, retain) per topic awaiting the next timed flush
+        self._coalesced: dict[str, tuple[str, bool]] = {}
+        self._flusher: asyncio.Task | None = None
+
+    @contextlib.asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Queue publishes made inside the block and send them together on exit."""
+        if self._pending is not None:  # Already batching — join the outer batch
+            yield
+            return
+        self._pending = []
+        try:
+            yield
+        finally:
+            messages, self._pending = self._pending, None
+            await self._send(messages)
+
+    async def _send(self, messages: list[tuple[str, str, bool]]) -> None:
+        """Queue messages inside batch() or for the timed flush, else deliver them."""
+        if not messages:
+            return
+        if self._pending is not None:
+            self._pending.extend(messages)
+        elif self._flush_interval is not None:
+            for topic, payload, retain in messages:
+                self._coalesced[topic] = (payload, retain)
+            if self._flusher is None or self._flusher.done():
+                self._flusher = asyncio.create_task(self._flush_loop(), name="mqtt_flush")
+        else:
+            await self._deliver(messages)
+
+    async def _deliver(self, messages: list[tuple[str, str, bool]]) -> None:
+        """Send messages now, as one batch if possible, and record them as sent."""
+        epoch = self._cache_epoch
+        await self._deliver_now(messages)
+        if epoch == self._cache_epoch:
+            for topic, payload, _ in messages:
+                self._last[topic] = payload
+
+    async def _deliver_now(self, messages: list[tuple[str, str, bool]]) -> None:
+        if self._publish_many is not None and len(messages) > 1:
+            await self._publish_many(messages)
+        elif len(messages) == 1:
+            await self._publish(*messages[0])
+        else:
+            results = await asyncio.gather(
+                *(self._publish(topic, payload, retain) for topic, payload, retain in messages),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+
+    def _take_coalesced(self) -> list[tuple[str, str, bool]]:
+        coalesced, self._coalesced = self._coalesced, {}
+        return [(topic, payload, retain) for topic, (payload, retain) in coalesced.items()]
+
+    async def _flush_loop(self) -> None:
+        """Send coalesced messages every flush interval; exits once idle."""
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            messages = self._take_coalesced()
+            if not messages:
+                return
+            try:
+                await self._deliver(messages)
+            except Exception:
+                logger.warning("MQTT flush of %d messages failed", len(messages), exc_info=True)
+
+    async def flush(self) -> None:
+        """Stop the timed flush and send anything still coalesced."""
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await flusher
+        messages = self._take_coalesced()
+        if messages:
+            await self._deliver(messages)
+
+    def _changed(self, topic: str, payload: str, retain: bool) -> list[tuple[str, str, bool]]:
+        """Return the message unless the payload is already sent or awaiting a flush."""
+        pending = self._coalesced.get(topic)
+        latest = pending[0] if pending is not None else self._last.get(topic)
+        if latest == payload:
+            return []
+        return [(topic, payload, retain)]
+
+    def reset_cache(self) -> None:
+        """Forget sent payloads so the next publish of every topic goes out."""
+        self._last.clear()
+        self._cache_epoch += 1
 
     async def publish_telemetry(self, telemetry: Telemetry) -> None:
-        """Publish current telemetry readings."""
-        await self._publish(self._topics["battery_soc"], f"{telemetry.soc_pct:.1f}", True)
-        await self._publish(self._topics["battery_power"], str(telemetry.battery_power_w), False)
-        await self._publish(self._topics["solar_power"], str(telemetry.solar_power_w), False)
-        await self._publish(self._topics["grid_power"], str(telemetry.grid_power_w), False)
-        await self._publish(self._topics["load_total"], str(telemetry.load_power_w), False)
+        """Publish current telemetry readings, skipping unchanged values."""
+        await self._send([
+            *self._changed(self._t_soc, f"{telemetry.soc_pct:.1f}", True),
+            *self._changed(self._t_battery, str(telemetry.battery_power_w), False),
+            *self._changed(self._t_solar, str(telemetry.solar_power_w), False),
+            *self._changed(self._t_grid, str(telemetry.grid_power_w), False),
+            *self._changed(self._t_load, str(telemetry.load_power_w), False),
+        ])
 
     async def publish_status(self, online: bool = True) -> None:
         """Publish system online/offline status."""
-        await self._publish(self._topics["status"], "online" if online else "offline", True)
+        await self._send([(self._topics["status"], "online" if online else "offline", True)])
 
     async def publish_mode(self, mode_name: str) -> None:
         """Publish current operating mode."""
-        await self._publish(self._topics["mode_current"], mode_name, True)
+        await self._send(self._changed(self._topics["mode_current"], mode_name, True))
 
     async def publish_tariff(self, import_cents: float, export_cents: float) -> None:
         """Publish current tariff rates."""
-        await self._publish(self._topics["tariff_import"], f"{import_cents:.1f}", True)
-        await self._publish(self._topics["tariff_export"], f"{export_cents:.1f}", True)
+        await self._send([
+            *self._changed(self._topics["tariff_import"], f"{import_cents:.1f}", True),
+            *self._changed(self._topics["tariff_export"], f"{export_cents:.1f}", True),
+        ])
 
     async def publish_wacb(self, wacb_cents: float) -> None:
         """Publish battery WACB."""
-        await self._publish(self._topics["battery_wacb"], f"{wacb_cents:.1f}", True)
+        await self._send(self._changed(self._topics["battery_wacb"], f"{wacb_cents:.1f}", True))
 
     async def publish_storm(self, active: bool) -> None:
         """Publish storm reserve status."""
-        await self._publish(self._topics["storm_active"], "true" if active else "false", True)
+        await self._send(self._changed(self._topics["storm_active"], "true" if active else "false", True))
 
     async def publish_spike(self, active: bool) -> None:
         """Publish spike status."""
-        await self._publish(self._topics["spike_active"], "true" if active else "false", True)
+        await self._send(self._changed(self._topics["spike_active"], "true" if active else "false", True))
+
+    async def publish_loop_lag(self, lag_ms: float) -> None:
+        """Publish the worst recent event-loop lag."""
+        await self._send(self._changed(self._topics["loop_lag"], str(round(lag_ms)), False))
 
     async def publish_accounting(self, today_net_cents: int) -> None:
         """Publish today's net cost."""
-        await self._publish(self._topics["accounting_today_net"], str(today_net_cents), False)
+        await self._send([(self._topics["accounting_today_net"], str(today_net_cents), False)])
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+import sys
 from typing import Callable
 
 from power_master.mqtt.topics import load_command_topic
 
 logger = logging.getLogger(__name__)
 
+# Unhandled topics remembered so repeats are dropped without logging
+_UNHANDLED_CACHE_SIZE = 1024
+
 
 class LoadCommandSubscriber:
     """Subscribes to MQTT load command topics and dispatches to callbacks."""
@@ -16,6 +20,8 @@ class LoadCommandSubscriber:
     def __init__(self, topic_prefix: str = "power_master") -> None:
         self._prefix = topic_prefix
         self._handlers: dict[str, Callable[[str], None]] = {}
+        # Insertion-ordered, so the oldest entry is evicted first
+        self._unhandled: dict[str, None] = {}
 
     def register_load(self, load_id: str, handler: Callable[[str], None]) -> str:
         """Register a handler for a load's command topic.
@@ -27,8 +33,10 @@ class LoadCommandSubscriber:
         Returns:
             The MQTT topic to subscribe to.
         """
-        topic = load_command_topic(self._prefix, load_id)
+        # Interned so dispatch lookups can match on identity first
+        topic = sys.intern(load_command_topic(self._prefix, load_id))
         self._handlers[topic] = handler
+        self._unhandled.pop(topic, None)
         return topic
 
     @property
@@ -42,5 +50,9 @@ class LoadCommandSubscriber:
         if handler:
             logger.debug("Load command received: %s → %s", topic, payload)
             handler(payload)
-        else:
-            logger.debug("Unhandled MQTT message: %s", topic)
+        elif topic not in self._unhandled:
+            if len(self._unhandled) >= _UNHANDLED_CACHE_SIZE:
+                del self._unhandled[next(iter(self._unhandled))]
+            self._unhandled[topic] = None
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Unhandled MQTT message: %s", topic)
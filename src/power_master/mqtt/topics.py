@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import functools
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 
-def build_topics(prefix: str = "power_master") -> dict[str, str]:
-    """Build all MQTT topic strings from a configurable prefix."""
-    return {
+
+@functools.lru_cache(maxsize=8)
+def build_topics(prefix: str = "power_master") -> Mapping[str, str]:
+    """Build all MQTT topic strings from a configurable prefix.
+
+    The result is cached per prefix and read-only, so every publisher
+    shares one mapping.  Topic strings are interned so comparisons against
+    them can short-circuit on identity.
+    """
+    topics = {
         "status": f"{prefix}/status",
         "battery_soc": f"{prefix}/battery/soc",
         "battery_power": f"{prefix}/battery/power",
@@ -19,7 +30,9 @@ def build_topics(prefix: str = "power_master") -> dict[str, str]:
         "storm_active": f"{prefix}/storm/active",
         "accounting_today_net": f"{prefix}/accounting/today_net",
         "spike_active": f"{prefix}/spike/active",
+        "loop_lag": f"{prefix}/system/loop_lag",
     }
+    return MappingProxyType({key: sys.intern(topic) for key, topic in topics.items()})
 
 
 def load_command_topic(prefix: str, load_id: str) -> str:
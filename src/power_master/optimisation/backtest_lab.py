@@ -3,14 +3,37 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Any, Callable
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Any, Callable, TypeVar
 
 from power_master.config.schema import AppConfig
 from power_master.db.repository import Repository
-from power_master.optimisation.plan import SlotMode
-from power_master.optimisation.solver import SolverInputs, solve
+from power_master.optimisation.plan import OptimisationPlan, SlotMode
+from power_master.optimisation.solver import SolverInputs, solve, warm_start_from_plan
+from power_master.timezone_utils import resolve_timezone
+
+# Historical series replayed by the backtest, in _load_series unpack order
+_SERIES = (
+    "load_w",
+    "solar_w",
+    "import_price_cents",
+    "export_price_cents",
+    "forecast_import_price_cents",
+    "forecast_export_price_cents",
+)
+
+# Solved plans remembered per run, keyed by quantised horizon inputs
+_PLAN_CACHE_SIZE = 256
+
+# Floor on the progress heartbeat while a slow solve runs
+_MIN_HEARTBEAT_SECONDS = 1.0
+
+# Element type of the per-slot series sliced into solver horizons
+T = TypeVar("T", float, bool)
 
 
 @dataclass
@@ -47,11 +70,25 @@ def _slot_key(ts: datetime) -> datetime:
     return ts.replace(minute=minute, second=0, microsecond=0)
 
 
+@functools.lru_cache(maxsize=65536)
+def _slot_key_from_iso(ts: str) -> datetime:
+    """_slot_key of an ISO timestamp, memoised: the series share timestamps."""
+    return _slot_key(_as_utc(ts))
+
+
+def _by_slot(pairs: list[tuple[str, float]]) -> dict[datetime, float]:
+    """Map (recorded_at, value) pairs onto their 30-minute slot (last wins).
+
+    ``historical_data.value`` has REAL affinity, so values arrive as floats.
+    """
+    return {_slot_key_from_iso(ts): value for ts, value in pairs}
+
+
 def _interp(prev_val: float | None, current_val: float | None, fallback: float = 0.0) -> float:
     if current_val is not None:
-        return float(current_val)
+        return current_val
     if prev_val is not None:
-        return float(prev_val)
+        return prev_val
     return fallback
 
 
@@ -63,19 +100,15 @@ async def _load_series(
     start_iso = start.astimezone(timezone.utc).isoformat()
     end_iso = end.astimezone(timezone.utc).isoformat()
 
-    load_rows = await repo.get_historical("load_w", start_iso, end_iso)
-    solar_rows = await repo.get_historical("solar_w", start_iso, end_iso)
-    import_rows = await repo.get_historical("import_price_cents", start_iso, end_iso)
-    export_rows = await repo.get_historical("export_price_cents", start_iso, end_iso)
-    forecast_import_rows = await repo.get_historical("forecast_import_price_cents", start_iso, end_iso)
-    forecast_export_rows = await repo.get_historical("forecast_export_price_cents", start_iso, end_iso)
-
-    load_by = {_slot_key(_as_utc(r["recorded_at"])): float(r["value"]) for r in load_rows}
-    solar_by = {_slot_key(_as_utc(r["recorded_at"])): float(r["value"]) for r in solar_rows}
-    import_by = {_slot_key(_as_utc(r["recorded_at"])): float(r["value"]) for r in import_rows}
-    export_by = {_slot_key(_as_utc(r["recorded_at"])): float(r["value"]) for r in export_rows}
-    forecast_import_by = {_slot_key(_as_utc(r["recorded_at"])): float(r["value"]) for r in forecast_import_rows}
-    forecast_export_by = {_slot_key(_as_utc(r["recorded_at"])): float(r["value"]) for r in forecast_export_rows}
+    series = await repo.get_historical_values(list(_SERIES), start_iso, end_iso)
+    try:
+        (
+            load_by, solar_by, import_by, export_by,
+            forecast_import_by, forecast_export_by,
+        ) = (_by_slot(series[name]) for name in _SERIES)
+    finally:
+        # Timestamps are rarely shared across runs — release the entries
+        _slot_key_from_iso.cache_clear()
 
     timeline = sorted(import_by.keys())
     if not timeline:
@@ -112,23 +145,27 @@ async def _load_series(
     return rows
 
 
-def _apply_first_slot(
+def _step_battery(
     slot_mode: SlotMode,
-    target_power_w: int,
+    target_power_w: float,
     load_w: float,
     solar_w: float,
     soc: float,
-    config: AppConfig,
+    cap_wh: float,
+    eff: float,
+    max_charge: float,
+    max_discharge: float,
+    soc_min: float,
+    soc_max: float,
     slot_hours: float,
-) -> dict[str, float]:
-    cap_wh = float(config.battery.capacity_wh)
-    eff = config.battery.round_trip_efficiency ** 0.5
+) -> tuple[float, float, float, float, float]:
+    """Simulate one slot of battery dispatch on plain scalars.
 
-    max_charge = float(config.battery.max_charge_rate_w)
-    max_discharge = float(config.battery.max_discharge_rate_w)
-
-    max_charge_by_soc = max(0.0, (config.battery.soc_max_hard - soc) * cap_wh / (slot_hours * eff))
-    max_discharge_by_soc = max(0.0, (soc - config.battery.soc_min_hard) * cap_wh * eff / slot_hours)
+    Returns (charge_w, discharge_w, grid_import_w, grid_export_w, soc_next).
+    *eff* is the one-way (square-root of round-trip) efficiency.
+    """
+    max_charge_by_soc = max(0.0, (soc_max - soc) * cap_wh / (slot_hours * eff))
+    max_discharge_by_soc = max(0.0, (soc - soc_min) * cap_wh * eff / slot_hours)
 
     charge_w = 0.0
     discharge_w = 0.0
@@ -136,9 +173,9 @@ def _apply_first_slot(
     excess_solar = max(0.0, solar_w - load_w)
 
     if slot_mode == SlotMode.FORCE_CHARGE:
-        charge_w = min(float(target_power_w), max_charge, max_charge_by_soc)
+        charge_w = min(target_power_w, max_charge, max_charge_by_soc)
     elif slot_mode == SlotMode.FORCE_DISCHARGE:
-        discharge_w = min(float(target_power_w), max_discharge, max_discharge_by_soc)
+        discharge_w = min(target_power_w, max_discharge, max_discharge_by_soc)
     else:
         if net_load > 0:
             discharge_w = min(net_load, max_discharge, max_discharge_by_soc)
@@ -147,25 +184,38 @@ def _apply_first_slot(
 
     grid_w = load_w + charge_w - solar_w - discharge_w
     soc_next = soc + (charge_w * slot_hours * eff) / cap_wh - (discharge_w * slot_hours) / (eff * cap_wh)
-    soc_next = min(config.battery.soc_max_hard, max(config.battery.soc_min_hard, soc_next))
-
-    return {
-        "charge_w": charge_w,
-        "discharge_w": discharge_w,
-        "grid_import_w": max(0.0, grid_w),
-        "grid_export_w": max(0.0, -grid_w),
-        "soc_next": soc_next,
-    }
-
-
-def _horizon_slice(values: list[float], start_idx: int, n_slots: int) -> list[float]:
-    out: list[float] = []
-    last = values[-1] if values else 0.0
-    for i in range(start_idx, start_idx + n_slots):
-        out.append(values[i] if i < len(values) else last)
+    soc_next = min(soc_max, max(soc_min, soc_next))
+
+    return charge_w, discharge_w, max(0.0, grid_w), max(0.0, -grid_w), soc_next
+
+
+def _horizon_slice(values: list[T], start_idx: int, n_slots: int) -> list[T]:
+    """n_slots values from start_idx, padded past the end with the last value."""
+    out = values[start_idx:start_idx + n_slots]
+    if len(out) < n_slots:
+        out.extend([values[-1] if values else 0.0] * (n_slots - len(out)))
     return out
 
 
+def _plan_key(inputs: SolverInputs, planner_tz: tzinfo) -> tuple:
+    """Quantised solver inputs that determine a backtest plan.
+
+    Powers are rounded to 0.1 W, prices to 0.001 c, SoC to 0.001 and WACB
+    to 0.01 c.  Slot times enter only as local hours, which is all the
+    solver reads from them.
+    """
+    return (
+        tuple(round(w, 1) for w in inputs.solar_forecast_w),
+        tuple(round(w, 1) for w in inputs.load_forecast_w),
+        tuple(round(c, 3) for c in inputs.import_rate_cents),
+        tuple(round(c, 3) for c in inputs.export_rate_cents),
+        tuple(inputs.is_spike),
+        round(inputs.current_soc, 3),
+        round(inputs.wacb_cents, 2),
+        tuple(t.astimezone(planner_tz).hour for t in inputs.slot_start_times or ()),
+    )
+
+
 async def run_backtest(
     repo: Repository,
     config: AppConfig,
@@ -201,29 +251,42 @@ async def run_backtest(
     replan_every_slots = max(1, int(replan_every_slots))
 
     ts_list = [r["ts"] for r in rows]
-    load_list = [float(r["load_w"]) for r in rows]
-    solar_list = [float(r["solar_w"]) for r in rows]
-    import_list = [float(r["import_cents"]) for r in rows]
-    export_list = [float(r["export_cents"]) for r in rows]
-    forecast_import_list = [float(r["forecast_import_cents"]) for r in rows]
-    forecast_export_list = [float(r["forecast_export_cents"]) for r in rows]
+    load_list = [r["load_w"] for r in rows]
+    solar_list = [r["solar_w"] for r in rows]
+    import_list = [r["import_cents"] for r in rows]
+    export_list = [r["export_cents"] for r in rows]
+    forecast_import_list = [r["forecast_import_cents"] for r in rows]
+    forecast_export_list = [r["forecast_export_cents"] for r in rows]
     planner_import_list = forecast_import_list if use_forecast_prices_for_planning else import_list
     planner_export_list = forecast_export_list if use_forecast_prices_for_planning else export_list
+    spike_threshold = float(config.arbitrage.spike_threshold_cents)
+    spike_list = [p >= spike_threshold for p in import_list]
 
-    soc = max(config.battery.soc_min_hard, min(config.battery.soc_max_hard, initial_soc))
-
-    import_wh_total = 0.0
-    export_wh_total = 0.0
-    import_cost_cents = 0.0
-    export_revenue_cents = 0.0
-    planner_import_cost_cents = 0.0
-    planner_export_revenue_cents = 0.0
-    throughput_wh = 0.0
-
-    daily: dict[str, dict[str, float]] = {}
-    slot_rows: list[dict[str, Any]] = []
+    # Battery constants for the slot simulation, read once per run
+    cap_wh = float(config.battery.capacity_wh)
+    eff = config.battery.round_trip_efficiency ** 0.5
+    max_charge = float(config.battery.max_charge_rate_w)
+    max_discharge = float(config.battery.max_discharge_rate_w)
+    soc_min = config.battery.soc_min_hard
+    soc_max = config.battery.soc_max_hard
+
+    soc = max(soc_min, min(soc_max, initial_soc))
+
+    # Per-slot dispatch results, one column per field, kept unrounded; the
+    # accounting and the (rounded) report rows are derived after the loop
+    n = len(ts_list)
+    soc_col = [0.0] * n
+    charge_w_col = [0.0] * n
+    discharge_w_col = [0.0] * n
+    grid_import_w_col = [0.0] * n
+    grid_export_w_col = [0.0] * n
+    mode_col = [0] * n
     current_plan = None
     plan_offset = 0
+    # Stable-price stretches repeat horizons; reuse their plans
+    plan_cache: OrderedDict[tuple, OptimisationPlan] = OrderedDict()
+    # Same zone the solver reads local hours in
+    planner_tz = resolve_timezone(config.load_profile.timezone)
 
     for i, ts in enumerate(ts_list):
         if progress_callback:
@@ -234,108 +297,138 @@ async def run_backtest(
             or plan_offset >= len(current_plan.slots)
         )
         if need_replan:
+            slot_start_times = [
+                ts + timedelta(minutes=config.planning.slot_duration_minutes * j)
+                for j in range(horizon_slots)
+            ]
             horizon_inputs = SolverInputs(
                 solar_forecast_w=_horizon_slice(solar_list, i, horizon_slots),
                 load_forecast_w=_horizon_slice(load_list, i, horizon_slots),
                 import_rate_cents=_horizon_slice(planner_import_list, i, horizon_slots),
                 export_rate_cents=_horizon_slice(planner_export_list, i, horizon_slots),
-                is_spike=[
-                    p >= float(config.arbitrage.spike_threshold_cents)
-                    for p in _horizon_slice(import_list, i, horizon_slots)
-                ],
+                is_spike=_horizon_slice(spike_list, i, horizon_slots),
                 current_soc=soc,
                 wacb_cents=initial_wacb_cents,
                 storm_active=False,
                 storm_reserve_soc=0.0,
-                slot_start_times=[
-                    ts + timedelta(minutes=config.planning.slot_duration_minutes * j)
-                    for j in range(horizon_slots)
-                ],
+                slot_start_times=slot_start_times,
+                # Successive horizons overlap: start from the previous plan.
+                # A cached plan may come from another day, so read it by offset.
+                warm_start_charging=(
+                    warm_start_from_plan(
+                        current_plan, slot_start_times, soc, offset=plan_offset,
+                    )
+                    if current_plan is not None else None
+                ),
             )
-            solve_task = asyncio.create_task(
-                asyncio.to_thread(solve, config, horizon_inputs, "lab_backtest")
-            )
-            heartbeat = max(1.0, float(progress_heartbeat_seconds))
-            while True:
+            key = _plan_key(horizon_inputs, planner_tz)
+            cached = plan_cache.get(key)
+            if cached is not None:
+                plan_cache.move_to_end(key)
+                current_plan = cached
+            else:
+                solve_task = asyncio.create_task(
+                    asyncio.to_thread(solve, config, horizon_inputs, "lab_backtest")
+                )
+                heartbeat = max(_MIN_HEARTBEAT_SECONDS, float(progress_heartbeat_seconds))
+                # Wait for completion, but emit progress heartbeats for long
+                # solves.  asyncio.wait never cancels the task on timeout.
                 try:
-                    # Wait for completion, but emit progress heartbeats for long solves.
-                    current_plan = await asyncio.wait_for(solve_task, timeout=heartbeat)
-                    break
-                except TimeoutError:
-                    if progress_callback:
-                        progress_callback(i + 1, len(ts_list), ts)
+                    while not (await asyncio.wait({solve_task}, timeout=heartbeat))[0]:
+                        if progress_callback:
+                            progress_callback(i + 1, len(ts_list), ts)
+                finally:
+                    # Cancelled mid-solve: do not leave the task behind
+                    if not solve_task.done():
+                        solve_task.cancel()
+                        with contextlib.suppress(asyncio.CancelledError):
+                            await solve_task
+                current_plan = solve_task.result()
+                plan_cache[key] = current_plan
+                if len(plan_cache) > _PLAN_CACHE_SIZE:
+                    plan_cache.popitem(last=False)
             plan_offset = 0
 
         first = current_plan.slots[min(plan_offset, len(current_plan.slots) - 1)]
 
-        flows = _apply_first_slot(
-            slot_mode=first.mode,
-            target_power_w=first.target_power_w,
-            load_w=load_list[i],
-            solar_w=solar_list[i],
-            soc=soc,
-            config=config,
-            slot_hours=slot_hours,
-        )
-        soc = flows["soc_next"]
-
-        import_wh = flows["grid_import_w"] * slot_hours
-        export_wh = flows["grid_export_w"] * slot_hours
-        import_wh_total += import_wh
-        export_wh_total += export_wh
-        import_cost_cents += (import_wh / 1000.0) * import_list[i]
-        export_revenue_cents += (export_wh / 1000.0) * export_list[i]
-        planner_import_cost_cents += (import_wh / 1000.0) * planner_import_list[i]
-        planner_export_revenue_cents += (export_wh / 1000.0) * planner_export_list[i]
-        throughput_wh += (flows["charge_w"] + flows["discharge_w"]) * slot_hours
-        slot_value_cents = (export_wh / 1000.0) * export_list[i] - (import_wh / 1000.0) * import_list[i]
-        planner_slot_value_cents = (
-            (export_wh / 1000.0) * planner_export_list[i]
-            - (import_wh / 1000.0) * planner_import_list[i]
+        charge_w, discharge_w, grid_import_w, grid_export_w, soc = _step_battery(
+            first.mode, float(first.target_power_w), load_list[i], solar_list[i], soc,
+            cap_wh, eff, max_charge, max_discharge, soc_min, soc_max, slot_hours,
         )
 
-        day_key = ts.date().isoformat()
-        d = daily.setdefault(
-            day_key,
-            {"import_cost_cents": 0.0, "export_revenue_cents": 0.0, "import_kwh": 0.0, "export_kwh": 0.0},
-        )
-        d["import_cost_cents"] += (import_wh / 1000.0) * import_list[i]
-        d["export_revenue_cents"] += (export_wh / 1000.0) * export_list[i]
-        d["import_kwh"] += import_wh / 1000.0
-        d["export_kwh"] += export_wh / 1000.0
-
-        slot_rows.append(
-            {
-                "ts": ts.isoformat(),
-                "soc": round(soc, 4),
-                "load_kw": round(load_list[i] / 1000.0, 4),
-                "solar_kw": round(solar_list[i] / 1000.0, 4),
-                "charge_kw": round(flows["charge_w"] / 1000.0, 4),
-                "discharge_kw": round(flows["discharge_w"] / 1000.0, 4),
-                "grid_import_kw": round(flows["grid_import_w"] / 1000.0, 4),
-                "grid_export_kw": round(flows["grid_export_w"] / 1000.0, 4),
-                "import_cents": round(import_list[i], 4),
-                "export_cents": round(export_list[i], 4),
-                "planner_import_cents": round(planner_import_list[i], 4),
-                "planner_export_cents": round(planner_export_list[i], 4),
-                "slot_value_cents": round(slot_value_cents, 4),
-                "planner_slot_value_cents": round(planner_slot_value_cents, 4),
-                "mode": int(first.mode),
-            }
-        )
+        soc_col[i] = soc
+        charge_w_col[i] = charge_w
+        discharge_w_col[i] = discharge_w
+        grid_import_w_col[i] = grid_import_w
+        grid_export_w_col[i] = grid_export_w
+        mode_col[i] = int(first.mode)
         plan_offset += 1
 
+    # Accounting over the whole run, one pass per column
+    import_wh_col = [w * slot_hours for w in grid_import_w_col]
+    export_wh_col = [w * slot_hours for w in grid_export_w_col]
+    import_kwh_col = [wh / 1000.0 for wh in import_wh_col]
+    export_kwh_col = [wh / 1000.0 for wh in export_wh_col]
+    import_cost_col = [kwh * p for kwh, p in zip(import_kwh_col, import_list)]
+    export_revenue_col = [kwh * p for kwh, p in zip(export_kwh_col, export_list)]
+    planner_import_cost_col = [kwh * p for kwh, p in zip(import_kwh_col, planner_import_list)]
+    planner_export_revenue_col = [kwh * p for kwh, p in zip(export_kwh_col, planner_export_list)]
+    slot_value_col = [r - c for r, c in zip(export_revenue_col, import_cost_col)]
+    planner_slot_value_col = [
+        r - c for r, c in zip(planner_export_revenue_col, planner_import_cost_col)
+    ]
+
+    import_wh_total = sum(import_wh_col)
+    export_wh_total = sum(export_wh_col)
+    import_cost_cents = sum(import_cost_col)
+    export_revenue_cents = sum(export_revenue_col)
+    planner_import_cost_cents = sum(planner_import_cost_col)
+    planner_export_revenue_cents = sum(planner_export_revenue_col)
+    throughput_wh = sum((c + d) * slot_hours for c, d in zip(charge_w_col, discharge_w_col))
+
+    # Per-day [import_cost_cents, export_revenue_cents, import_kwh, export_kwh]
+    # keyed by UTC date ordinal; ISO dates are only built for the report
+    daily: defaultdict[int, list[float]] = defaultdict(lambda: [0.0, 0.0, 0.0, 0.0])
+    for i, ts in enumerate(ts_list):
+        d = daily[ts.toordinal()]
+        d[0] += import_cost_col[i]
+        d[1] += export_revenue_col[i]
+        d[2] += import_kwh_col[i]
+        d[3] += export_kwh_col[i]
+
+    slot_rows: list[dict[str, Any]] = [
+        {
+            "ts": ts_list[i].isoformat(),
+            "soc": round(soc_col[i], 4),
+            "load_kw": round(load_list[i] / 1000.0, 4),
+            "solar_kw": round(solar_list[i] / 1000.0, 4),
+            "charge_kw": round(charge_w_col[i] / 1000.0, 4),
+            "discharge_kw": round(discharge_w_col[i] / 1000.0, 4),
+            "grid_import_kw": round(grid_import_w_col[i] / 1000.0, 4),
+            "grid_export_kw": round(grid_export_w_col[i] / 1000.0, 4),
+            "import_cents": round(import_list[i], 4),
+            "export_cents": round(export_list[i], 4),
+            "planner_import_cents": round(planner_import_list[i], 4),
+            "planner_export_cents": round(planner_export_list[i], 4),
+            "slot_value_cents": round(slot_value_col[i], 4),
+            "planner_slot_value_cents": round(planner_slot_value_col[i], 4),
+            "mode": mode_col[i],
+        }
+        for i in range(n)
+    ]
+
     daily_rows = []
-    for day, vals in sorted(daily.items()):
-        net = vals["import_cost_cents"] - vals["export_revenue_cents"]
+    for day_ord, (day_import_cost, day_export_revenue, day_import_kwh, day_export_kwh) in sorted(
+        daily.items()
+    ):
         daily_rows.append(
             {
-                "day": day,
-                "import_kwh": round(vals["import_kwh"], 3),
-                "export_kwh": round(vals["export_kwh"], 3),
-                "import_cost_cents": round(vals["import_cost_cents"], 2),
-                "export_revenue_cents": round(vals["export_revenue_cents"], 2),
-                "net_cost_cents": round(net, 2),
+                "day": date.fromordinal(day_ord).isoformat(),
+                "import_kwh": round(day_import_kwh, 3),
+                "export_kwh": round(day_export_kwh, 3),
+                "import_cost_cents": round(day_import_cost, 2),
+                "export_revenue_cents": round(day_export_revenue, 2),
+                "net_cost_cents": round(day_import_cost - day_export_revenue, 2),
             }
         )
 
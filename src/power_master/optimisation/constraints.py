@@ -4,6 +4,44 @@ from __future__ import annotations
 
 import pulp
 
+_EQ = pulp.LpConstraintEQ
+_LE = pulp.LpConstraintLE
+_GE = pulp.LpConstraintGE
+
+
+def _add_constraint(
+    prob: pulp.LpProblem,
+    name: str,
+    terms: list[tuple[pulp.LpVariable, float]],
+    sense: int,
+    rhs: float | None = None,
+    constant: float = 0.0,
+) -> None:
+    """Add ``sum(coef * var) + constant <sense> rhs`` to *prob*.
+
+    The expression is built from its terms in one call instead of through
+    variable arithmetic, which copies an intermediate expression for every
+    ``+``, ``-`` and ``*``.
+    """
+    expr = pulp.LpAffineExpression(terms, constant)
+    prob.addConstraint(pulp.LpConstraint(expr, sense, name, rhs))
+
+
+def _fix_to_zero(var: pulp.LpVariable) -> None:
+    """Pin a non-negative variable at zero through its bounds.
+
+    Cheaper than an ``var == 0`` row: the variable stays in the model but
+    there is no constraint for PuLP to build and write out, nor for the
+    solver's presolve to eliminate.
+    """
+    var.lowBound = 0
+    var.upBound = 0
+
+
+def _scaled(var: pulp.LpVariable, coef: float) -> list[tuple[pulp.LpVariable, float]]:
+    """A ``coef * var`` term, dropped when *coef* is zero as PuLP does."""
+    return [(var, coef)] if coef != 0 else []
+
 
 def add_energy_balance(
     prob: pulp.LpProblem,
@@ -24,17 +62,17 @@ def add_energy_balance(
     Excess solar flows into battery charge, grid export, or is curtailed
     when neither sink is available (e.g. battery full + export blocked).
     """
-    prob += (
-        solar_w + grid_import + discharge
-        == load_w + grid_export + charge + curtail,
-        f"energy_balance_{t}",
+    _add_constraint(
+        prob, f"energy_balance_{t}",
+        [(grid_import, 1), (discharge, 1), (grid_export, -1), (charge, -1), (curtail, -1)],
+        _EQ, constant=solar_w - load_w,
     )
     # Curtailment can't exceed available solar
-    prob += curtail <= solar_w, f"curtail_cap_{t}"
+    _add_constraint(prob, f"curtail_cap_{t}", [(curtail, 1)], _LE, solar_w)
     # Self-consumed solar is an accounting variable for the objective
     # (rewards using solar locally instead of importing).
-    prob += self_consumed <= solar_w, f"self_consume_cap_solar_{t}"
-    prob += self_consumed <= load_w, f"self_consume_cap_load_{t}"
+    _add_constraint(prob, f"self_consume_cap_solar_{t}", [(self_consumed, 1)], _LE, solar_w)
+    _add_constraint(prob, f"self_consume_cap_load_{t}", [(self_consumed, 1)], _LE, load_w)
 
 
 def add_soc_dynamics(
@@ -50,13 +88,15 @@ def add_soc_dynamics(
     discharge_efficiency: float,
 ) -> None:
     """SOC transition: soc_t = soc_{t-1} + charge*eff/cap - discharge/(eff*cap)."""
-    prob += (
-        soc
-        == soc_prev
-        + (charge * slot_hours * charge_efficiency) / capacity_wh
-        - (discharge * slot_hours) / (discharge_efficiency * capacity_wh),
-        f"soc_dynamics_{t}",
-    )
+    terms = [(soc, 1)]
+    rhs = None
+    if isinstance(soc_prev, pulp.LpVariable):
+        terms.append((soc_prev, -1))
+    else:
+        rhs = soc_prev
+    terms += _scaled(charge, -(slot_hours * charge_efficiency / capacity_wh))
+    terms += _scaled(discharge, slot_hours / (discharge_efficiency * capacity_wh))
+    _add_constraint(prob, f"soc_dynamics_{t}", terms, _EQ, rhs)
 
 
 def add_safety_limits(
@@ -68,8 +108,8 @@ def add_safety_limits(
     safety_slack: pulp.LpVariable,
 ) -> None:
     """Hard SOC limits with safety slack for feasibility."""
-    prob += soc >= soc_min - safety_slack, f"soc_min_hard_{t}"
-    prob += soc <= soc_max + safety_slack, f"soc_max_hard_{t}"
+    _add_constraint(prob, f"soc_min_hard_{t}", [(soc, 1), (safety_slack, 1)], _GE, soc_min)
+    _add_constraint(prob, f"soc_max_hard_{t}", [(soc, 1), (safety_slack, -1)], _LE, soc_max)
 
 
 def add_power_limits(
@@ -82,8 +122,14 @@ def add_power_limits(
     max_discharge_w: float,
 ) -> None:
     """Inverter power limits and charge/discharge exclusivity."""
-    prob += charge <= max_charge_w * is_charging, f"charge_limit_{t}"
-    prob += discharge <= max_discharge_w * (1 - is_charging), f"discharge_limit_{t}"
+    _add_constraint(
+        prob, f"charge_limit_{t}",
+        [(charge, 1)] + _scaled(is_charging, -max_charge_w), _LE,
+    )
+    _add_constraint(
+        prob, f"discharge_limit_{t}",
+        [(discharge, 1)] + _scaled(is_charging, max_discharge_w), _LE, max_discharge_w,
+    )
 
 
 def add_storm_reserve(
@@ -94,7 +140,7 @@ def add_storm_reserve(
     storm_slack: pulp.LpVariable,
 ) -> None:
     """Storm reserve: SOC >= reserve target (with slack)."""
-    prob += soc >= reserve_soc - storm_slack, f"storm_reserve_{t}"
+    _add_constraint(prob, f"storm_reserve_{t}", [(soc, 1), (storm_slack, 1)], _GE, reserve_soc)
 
 
 def add_arbitrage_gate(
@@ -133,9 +179,10 @@ def add_arbitrage_gate(
         # TOU: no gate — let the solver decide based on the fixed export rate.
         return
 
-    # Spot policy: apply the protective gate (existing behaviour).
+    # Spot policy: apply the protective gate (existing behaviour).  The gate
+    # is a bound on the variable rather than a constraint row.
     if export_rate < wacb + break_even_delta:
-        prob += grid_export == 0, f"arbitrage_gate_{t}"
+        _fix_to_zero(grid_export)
 
 
 def add_evening_soc_target(
@@ -146,7 +193,7 @@ def add_evening_soc_target(
     slack: pulp.LpVariable,
 ) -> None:
     """Soft penalty for SOC below target at evening peak start."""
-    prob += soc >= target_soc - slack, f"evening_soc_{t}"
+    _add_constraint(prob, f"evening_soc_{t}", [(soc, 1), (slack, 1)], _GE, target_soc)
 
 
 def add_free_window_soc_target(
@@ -163,7 +210,7 @@ def add_free_window_soc_target(
     evening target. Uses a slack variable penalised in the objective; the hard
     SOC ceiling (soc_max_hard) still bounds the actual charge.
     """
-    prob += soc >= target_soc - slack, f"free_window_soc_{t}"
+    _add_constraint(prob, f"free_window_soc_{t}", [(soc, 1), (slack, 1)], _GE, target_soc)
 
 
 def add_morning_soc_minimum(
@@ -174,7 +221,7 @@ def add_morning_soc_minimum(
     slack: pulp.LpVariable,
 ) -> None:
     """Soft penalty for SOC below minimum at morning."""
-    prob += soc >= min_soc - slack, f"morning_soc_{t}"
+    _add_constraint(prob, f"morning_soc_{t}", [(soc, 1), (slack, 1)], _GE, min_soc)
 
 
 def add_daytime_soc_minimum(
@@ -185,7 +232,7 @@ def add_daytime_soc_minimum(
     slack: pulp.LpVariable,
 ) -> None:
     """Soft penalty for SOC below daytime reserve target."""
-    prob += soc >= min_soc - slack, f"daytime_soc_{t}"
+    _add_constraint(prob, f"daytime_soc_{t}", [(soc, 1), (slack, 1)], _GE, min_soc)
 
 
 def add_spike_constraints(
@@ -196,7 +243,7 @@ def add_spike_constraints(
 ) -> None:
     """During price spikes: block grid charging."""
     if is_spike:
-        prob += charge == 0, f"spike_no_charge_{t}"
+        _fix_to_zero(charge)
 
 
 def add_grid_charge_policy(
@@ -249,7 +296,7 @@ def add_grid_charge_policy(
         # the system to rely on the free window and solar. The battery can discharge
         # to cover load directly from grid (which it must, if depleted), just not
         # import-to-store at paid rates.
-        prob += charge == 0, f"grid_charge_policy_paid_{t}"
+        _fix_to_zero(charge)
 
 
 def add_charge_taper(
@@ -273,9 +320,16 @@ def add_charge_taper(
     M = 1.0  # SOC is in [0, 1] so M=1 is sufficient
 
     # Link in_taper binary to SOC threshold
-    prob += soc <= taper_start_soc + M * in_taper, f"taper_link_upper_{t}"
-    prob += soc >= taper_start_soc - M * (1 - in_taper), f"taper_link_lower_{t}"
+    _add_constraint(
+        prob, f"taper_link_upper_{t}", [(soc, 1), (in_taper, -M)], _LE, taper_start_soc,
+    )
+    _add_constraint(
+        prob, f"taper_link_lower_{t}", [(soc, 1), (in_taper, -M)], _GE, taper_start_soc - M,
+    )
 
     # Reduce charge rate when in taper zone
     reduction = max_charge_w * (1 - taper_factor)
-    prob += charge <= max_charge_w - reduction * in_taper, f"taper_charge_limit_{t}"
+    _add_constraint(
+        prob, f"taper_charge_limit_{t}",
+        [(charge, 1)] + _scaled(in_taper, reduction), _LE, max_charge_w,
+    )
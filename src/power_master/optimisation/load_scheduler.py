@@ -17,6 +17,12 @@ from power_master.timezone_utils import resolve_timezone
 logger = logging.getLogger(__name__)
 
 
+_UTC = resolve_timezone("UTC")
+
+# Run scores closer than this are treated as tied
+_SCORE_EPSILON = 1e-9
+
+
 @dataclass
 class ScheduledLoad:
     """A load scheduled into specific plan slots."""
@@ -29,6 +35,65 @@ class ScheduledLoad:
     prefer_solar: bool = True
 
 
+@dataclass
+class _LocalSlotTimes:
+    """Plan slot starts projected into one timezone, indexed by slot."""
+
+    weekday: list[int]
+    minute_of_day: list[int]
+    day: list[date]
+
+
+def _project_slots(plan: OptimisationPlan, tz_name: str) -> _LocalSlotTimes:
+    """Convert every slot start to local time in *tz_name* once."""
+    tz = resolve_timezone(tz_name)
+    weekday: list[int] = []
+    minute_of_day: list[int] = []
+    day: list[date] = []
+    for slot in plan.slots:
+        start = slot.start if slot.start.tzinfo is not None else slot.start.replace(tzinfo=_UTC)
+        local_start = start.astimezone(tz)
+        weekday.append(local_start.weekday())
+        minute_of_day.append(local_start.hour * 60 + local_start.minute)
+        day.append(local_start.date())
+    return _LocalSlotTimes(weekday=weekday, minute_of_day=minute_of_day, day=day)
+
+
+@dataclass
+class _SlotColumns:
+    """Per-slot scores for load scheduling, indexed by slot. Lower is better.
+
+    The load-independent parts are precomputed: ``score`` is the import rate
+    plus the spike penalty, ``solar_score`` the same with the excess-solar
+    bonus applied.  A load takes ``solar_score`` where it prefers solar and
+    ``excess_solar`` exceeds its power.
+    """
+
+    score: list[float]
+    solar_score: list[float]
+    excess_solar: list[float]
+
+
+def _slot_columns(plan: OptimisationPlan) -> _SlotColumns:
+    """Score every plan slot once, for all loads."""
+    score: list[float] = []
+    solar_score: list[float] = []
+    for s in plan.slots:
+        base = s.import_rate_cents  # Base: prefer cheap import slots
+        bonus = base - 50  # Large bonus for running during excess solar
+        # Penalty for spike slots
+        if s.constraint_flags and "spike" in s.constraint_flags:
+            base += 500
+            bonus += 500
+        score.append(base)
+        solar_score.append(bonus)
+    return _SlotColumns(
+        score=score,
+        solar_score=solar_score,
+        excess_solar=[s.solar_forecast_w - s.load_forecast_w for s in plan.slots],
+    )
+
+
 def schedule_loads(
     plan: OptimisationPlan,
     available_loads: list[dict],
@@ -47,8 +112,13 @@ def schedule_loads(
     - Respect runtime requirements (duration/min/max)
     - Schedule one run per eligible day in the plan horizon
     """
-    scheduled = []
+    scheduled: list[ScheduledLoad] = []
     overridden_ids: set[str] = manual_override_load_ids or set()
+    # Local slot times per timezone name, shared by loads in the same zone
+    projections: dict[str, _LocalSlotTimes] = {}
+    columns: _SlotColumns | None = None
+    # Eligible slots per (timezone, window, days) — loads often share defaults
+    eligibility: dict[tuple, list[int]] = {}
 
     # Sort loads by priority (lower = more important)
     sorted_loads = sorted(available_loads, key=lambda l: l.get("priority_class", 5))
@@ -56,6 +126,9 @@ def schedule_loads(
     if not sorted_loads:
         logger.info("Load scheduler: no loads configured")
 
+    slots = plan.slots
+    slot_minutes = _slot_duration_minutes(plan)
+
     for load_config in sorted_loads:
         load_name = load_config.get("name", "?")
         priority = load_config.get("priority_class", 5)
@@ -75,7 +148,6 @@ def schedule_loads(
             logger.info("Skipping load '%s' — manual override active", load_name)
             continue
 
-        slot_minutes = _slot_duration_minutes(plan)
         runtime_minutes = _effective_runtime_minutes(load_config)
 
         # Credit actual runtime already achieved today
@@ -94,8 +166,22 @@ def schedule_loads(
         power_w = load_config.get("power_w", 0)
         prefer_solar = load_config.get("prefer_solar", True)
 
+        tz_name = str(load_config.get("timezone", "UTC"))
+        local = projections.get(tz_name)
+        if local is None:
+            local = projections[tz_name] = _project_slots(plan, tz_name)
+
         # Find eligible slots within the time window
-        eligible = _find_eligible_slots(plan, load_config)
+        days = load_config.get("days_of_week")
+        window_key = (
+            tz_name,
+            load_config.get("earliest_start", "00:00"),
+            load_config.get("latest_end", "23:59"),
+            tuple(days) if isinstance(days, (list, tuple)) else days,
+        )
+        eligible = eligibility.get(window_key)
+        if eligible is None:
+            eligible = eligibility[window_key] = _find_eligible_slots(plan, load_config, local)
 
         if not eligible:
             logger.info(
@@ -105,21 +191,28 @@ def schedule_loads(
                 load_config.get("latest_end", "23:59"),
                 load_config.get("timezone", "UTC"),
                 load_config.get("days_of_week", "all"),
-                len(plan.slots),
+                len(slots),
             )
             continue
 
         # Score all eligible slots once
-        score_by_index: dict[int, float] = {}
-        for idx in eligible:
-            score_by_index[idx] = _score_slot(plan.slots[idx], power_w, prefer_solar)
+        if columns is None:
+            columns = _slot_columns(plan)
+        score, solar_score, excess = columns.score, columns.solar_score, columns.excess_solar
+        if prefer_solar:
+            score_by_index = {
+                idx: solar_score[idx] if excess[idx] > power_w else score[idx] for idx in eligible
+            }
+        else:
+            score_by_index = {idx: score[idx] for idx in eligible}
 
-        # Schedule once per eligible local day
+        # Schedule once per eligible local day.  The run search does not
+        # depend on the order of its input, so day groups are not re-sorted
+        # by score
+        day_groups = _group_indices_by_local_day(eligible, local)
         assigned: list[int] = []
-        for day_indices in _group_indices_by_local_day(plan, eligible, load_config):
-            scored = [(idx, score_by_index[idx]) for idx in day_indices]
-            scored.sort(key=lambda x: x[1])  # Lower score = better
-            day_assigned = _assign_consecutive(scored, duration_slots)
+        for day_indices in day_groups:
+            day_assigned = _assign_consecutive(day_indices, score_by_index, duration_slots)
             if not day_assigned:
                 logger.info(
                     "Load '%s' — day group has %d eligible slots but needs %d consecutive (duration=%dmin)",
@@ -129,7 +222,7 @@ def schedule_loads(
 
         if assigned:
             slot_times = [
-                plan.slots[idx].start.strftime("%a %H:%M") for idx in assigned[:4]
+                slots[idx].start.strftime("%a %H:%M") for idx in assigned[:4]
             ]
             logger.info(
                 "Load '%s' scheduled into %d slots: %s%s",
@@ -147,14 +240,15 @@ def schedule_loads(
             ))
             # Update plan slots with scheduled load info
             for idx in assigned:
-                if plan.slots[idx].scheduled_loads is None:
-                    plan.slots[idx].scheduled_loads = []
-                plan.slots[idx].scheduled_loads.append(load_config["name"])
+                slot = slots[idx]
+                if slot.scheduled_loads is None:
+                    slot.scheduled_loads = []
+                slot.scheduled_loads.append(load_config["name"])
         else:
             logger.info(
                 "Load '%s' — %d eligible slots across %d days but no consecutive run found (need %d slots = %dmin)",
                 load_name, len(eligible),
-                len(list(_group_indices_by_local_day(plan, eligible, load_config))),
+                len(day_groups),
                 duration_slots, runtime_minutes,
             )
 
@@ -162,7 +256,9 @@ def schedule_loads(
     return scheduled
 
 
-def _find_eligible_slots(plan: OptimisationPlan, load_config: dict) -> list[int]:
+def _find_eligible_slots(
+    plan: OptimisationPlan, load_config: dict, local: _LocalSlotTimes,
+) -> list[int]:
     """Find slot indices that fall within the load's time window."""
     earliest = load_config.get("earliest_start", "00:00")
     latest = load_config.get("latest_end", "23:59")
@@ -174,32 +270,22 @@ def _find_eligible_slots(plan: OptimisationPlan, load_config: dict) -> list[int]
         return list(range(len(plan.slots)))
 
     day_filter = set(int(d) for d in load_config.get("days_of_week", [0, 1, 2, 3, 4, 5, 6]))
-    tz = resolve_timezone(str(load_config.get("timezone", "UTC")))
-
-    eligible = []
-    for i, slot in enumerate(plan.slots):
-        local_start = slot.start if slot.start.tzinfo is not None else slot.start.replace(tzinfo=resolve_timezone("UTC"))
-        local_start = local_start.astimezone(tz)
-        if int(local_start.weekday()) not in day_filter:
-            continue
-
-        h = local_start.hour
-        m = local_start.minute
-        slot_time = h * 60 + m
-        start_time = earliest_h * 60 + earliest_m
-        end_time = latest_h * 60 + latest_m
-
-        if start_time <= end_time:
-            # Normal daytime window, end exclusive.
-            in_window = start_time <= slot_time < end_time
-        else:
-            # Overnight window (e.g. 22:00-06:00).
-            in_window = slot_time >= start_time or slot_time < end_time
-
-        if in_window:
-            eligible.append(i)
-
-    return eligible
+    start_time = earliest_h * 60 + earliest_m
+    end_time = latest_h * 60 + latest_m
+    weekday = local.weekday
+    minute_of_day = local.minute_of_day
+
+    if start_time <= end_time:
+        # Normal daytime window, end exclusive.
+        return [
+            i for i, slot_time in enumerate(minute_of_day)
+            if weekday[i] in day_filter and start_time <= slot_time < end_time
+        ]
+    # Overnight window (e.g. 22:00-06:00).
+    return [
+        i for i, slot_time in enumerate(minute_of_day)
+        if weekday[i] in day_filter and (slot_time >= start_time or slot_time < end_time)
+    ]
 
 
 def _slot_duration_minutes(plan: OptimisationPlan) -> int:
@@ -230,53 +316,40 @@ def _effective_runtime_minutes(load_config: dict) -> int:
     return max(1, int(runtime))
 
 
-def _group_indices_by_local_day(plan: OptimisationPlan, indices: list[int], load_config: dict) -> list[list[int]]:
-    tz = resolve_timezone(str(load_config.get("timezone", "UTC")))
+def _group_indices_by_local_day(indices: list[int], local: _LocalSlotTimes) -> list[list[int]]:
     by_day: dict[date, list[int]] = {}
     for idx in indices:
-        local_start = plan.slots[idx].start
-        if local_start.tzinfo is None:
-            local_start = local_start.replace(tzinfo=resolve_timezone("UTC"))
-        local_start = local_start.astimezone(tz)
-        key = local_start.date()
-        by_day.setdefault(key, []).append(idx)
+        by_day.setdefault(local.day[idx], []).append(idx)
     return [sorted(v) for _, v in sorted(by_day.items(), key=lambda kv: kv[0])]
 
 
-def _score_slot(slot, power_w: int, prefer_solar: bool) -> float:
-    """Score a slot for load scheduling. Lower is better."""
-    score = slot.import_rate_cents  # Base: prefer cheap import slots
-
-    if prefer_solar:
-        excess_solar = slot.solar_forecast_w - slot.load_forecast_w
-        if excess_solar > power_w:
-            score -= 50  # Large bonus for running during excess solar
-
-    # Penalty for spike slots
-    if slot.constraint_flags and "spike" in slot.constraint_flags:
-        score += 500
-
-    return score
+def _assign_consecutive(
+    indices: list[int], score_by_index: dict[int, float], duration_slots: int,
+) -> list[int]:
+    """Find the best run of consecutive slots among ascending *indices*.
 
-
-def _assign_consecutive(scored: list[tuple[int, float]], duration_slots: int) -> list[int]:
-    """Find the best run of consecutive slots."""
-    if len(scored) < duration_slots:
+    Single pass with a running window sum that restarts at every gap.
+    Ties keep the earliest run; the comparison allows for the rounding the
+    running add/subtract accumulates.
+    """
+    if len(indices) < duration_slots:
         return []
 
-    indices = sorted([idx for idx, _ in scored])
-
-    best_run = []
+    best_run: list[int] = []
     best_score = float("inf")
-
-    for start in range(len(indices) - duration_slots + 1):
-        run = indices[start : start + duration_slots]
-        # Check consecutiveness
-        if all(run[i + 1] - run[i] == 1 for i in range(len(run) - 1)):
-            # Score is sum of individual scores
-            run_score = sum(s for idx, s in scored if idx in run)
-            if run_score < best_score:
-                best_score = run_score
-                best_run = run
+    run_start = 0  # Position in indices where the current consecutive run begins
+    window = 0.0
+
+    for pos, idx in enumerate(indices):
+        if pos and idx != indices[pos - 1] + 1:
+            run_start = pos
+            window = 0.0
+        window += score_by_index[idx]
+        if pos - run_start >= duration_slots:
+            window -= score_by_index[indices[pos - duration_slots]]
+        # Score is sum of individual scores over the last duration_slots
+        if pos - run_start + 1 >= duration_slots and window < best_score - _SCORE_EPSILON:
+            best_score = window
+            best_run = indices[pos - duration_slots + 1 : pos + 1]
 
     return best_run
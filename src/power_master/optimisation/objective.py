@@ -77,15 +77,22 @@ def build_objective(
     """
     w = weights or ObjectiveWeights()
 
-    cost_terms = []
+    # All terms go straight into one expression as (variable, coefficient)
+    # pairs; rate * var * kwh products would allocate two expressions each.
+    # Every energy variable appears once, so those coefficients are assigned
+    # directly; later terms use addterm, which accumulates.
+    # Energy per slot in kWh: power_W * slot_hours / 1000
+    # All cost terms are in cents: rate_cents_per_kWh * kWh
+    kwh = slot_hours / 1000  # multiply by power_W later via LP variable
+    early_bias = w.early_charge_bias
+    self_reward = -w.self_consume_reward * kwh
+    cost = pulp.LpAffineExpression()
     for t in range(n_slots):
-        # Energy per slot in kWh: power_W * slot_hours / 1000
-        # All cost terms are in cents: rate_cents_per_kWh * kWh
-        kwh = slot_hours / 1000  # multiply by power_W later via LP variable
-        # Import cost
-        cost_terms.append(import_rate[t] * grid_import[t] * kwh)
-        # Hedging cost on all imports
-        cost_terms.append(hedging_rate * grid_import[t] * kwh)
+        # Import cost plus hedging cost on all imports, plus the early-charge
+        # bias: later grid imports are penalised slightly so the solver
+        # prefers to charge earlier in the window when prices are otherwise
+        # equal.  Folded into one coefficient per import variable.
+        cost[grid_import[t]] = (import_rate[t] + hedging_rate + early_bias * t) * kwh
 
         # Export revenue (subtract = good)
         # Check if this slot has tiered export
@@ -103,35 +110,32 @@ def build_objective(
             for k in range(len(export_tier_vars[t])):
                 tier = tier_structs[t].tiers[k]
                 tier_rate = tier.rate_c_per_kwh
-                cost_terms.append(-tier_rate * export_tier_vars[t][k] * kwh)
+                cost[export_tier_vars[t][k]] = -tier_rate * kwh
         else:
             # Flat export revenue (backward compat for non-tiered plans)
-            cost_terms.append(-export_rate[t] * grid_export[t] * kwh)
+            cost[grid_export[t]] = -export_rate[t] * kwh
 
         # Self-consumption reward
-        cost_terms.append(-w.self_consume_reward * self_consumed_solar[t] * kwh)
-        # Early-charge bias: penalise later grid imports slightly so the solver
-        # prefers to charge earlier in the window when prices are otherwise equal
-        cost_terms.append(w.early_charge_bias * t * grid_import[t] * kwh)
+        cost[self_consumed_solar[t]] = self_reward
 
     # Penalty terms
     for t in range(n_slots):
-        cost_terms.append(w.safety_violation * safety_slack[t])
+        cost.addterm(safety_slack[t], w.safety_violation)
 
-    for t in range(len(storm_slack)):
-        cost_terms.append(w.storm_violation * storm_slack[t])
+    for v in storm_slack:
+        cost.addterm(v, w.storm_violation)
 
-    for t in range(len(evening_soc_slack)):
-        cost_terms.append(w.evening_soc_shortfall * evening_soc_slack[t])
+    for v in evening_soc_slack:
+        cost.addterm(v, w.evening_soc_shortfall)
 
-    for t in range(len(free_window_soc_slack)):
-        cost_terms.append(w.free_window_soc_shortfall * free_window_soc_slack[t])
+    for v in free_window_soc_slack:
+        cost.addterm(v, w.free_window_soc_shortfall)
 
-    for t in range(len(morning_soc_slack)):
-        cost_terms.append(w.morning_soc_shortfall * morning_soc_slack[t])
+    for v in morning_soc_slack:
+        cost.addterm(v, w.morning_soc_shortfall)
 
-    for t in range(len(daytime_soc_slack)):
-        cost_terms.append(w.daytime_soc_shortfall * daytime_soc_slack[t])
+    for v in daytime_soc_slack:
+        cost.addterm(v, w.daytime_soc_shortfall)
 
     # Low-import credit penalty/reward terms (Phase 2)
     # Soft enforcement: penalise missed credit; reward earned credit (scaled by priority weight)
@@ -150,19 +154,19 @@ def build_objective(
                 # Missed var = 1: lose the reward (cost += reward); missed var = 0: earn reward (cost -= reward)
                 # With credit_priority_weight scaling: lower weight = less aggressively pursue the credit
                 weighted_reward = reward_cents * cw.credit_priority_weight
-                cost_terms.append(weighted_reward * missed_var)
+                cost.addterm(missed_var, weighted_reward)
 
     # Hard enforcement: penalise slack (grid import during hard-constraint windows)
     if credit_slack:
         # Large penalty for violating hard constraints (similar to safety_slack)
         for cs in credit_slack:
-            cost_terms.append(w.safety_violation * cs)
+            cost.addterm(cs, w.safety_violation)
 
     # Status-quo tie-break (hysteresis): bias slot-0 export toward incumbent mode.
     # Positive bias discourages exporting (hold SELF_USE); negative bias encourages exporting (hold FORCE_DISCHARGE).
     # Only applied when incumbent is set and hysteresis is enabled; default 0.0 keeps behaviour unchanged.
     if incumbent_export_bias_cents != 0.0 and n_slots > 0:
         kwh_slot0 = slot_hours / 1000
-        cost_terms.append(incumbent_export_bias_cents * grid_export[0] * kwh_slot0)
+        cost.addterm(grid_export[0], incumbent_export_bias_cents * kwh_slot0)
 
-    prob += pulp.lpSum(cost_terms), "MinimiseNetCost"
+    prob += cost, "MinimiseNetCost"
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import json
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import IntEnum
 
+# Persisted in plan_slots.constraint_flags to round-trip allow_charge_at_max_soc
+_FREE_WINDOW_CHARGE_FLAG = "free_window_charge"
+
 
 class SlotMode(IntEnum):
     """Operating mode for each plan slot (mirrors OperatingMode)."""
@@ -58,18 +63,36 @@ class OptimisationPlan:
     def total_slots(self) -> int:
         return len(self.slots)
 
+    def __post_init__(self) -> None:
+        self._index_slots()
+
+    def _index_slots(self) -> None:
+        # Slot starts for bisection; None when slots are unordered or overlap,
+        # in which case lookups fall back to a first-match scan.
+        self._indexed = (self.slots, len(self.slots))
+        self._slot_starts: list[datetime] | None = [s.start for s in self.slots]
+        try:
+            if any(b.start < a.end for a, b in zip(self.slots, self.slots[1:])):
+                self._slot_starts = None
+        except TypeError:  # mixed naive/aware times
+            self._slot_starts = None
+
     def get_current_slot(self) -> PlanSlot | None:
         """Get the slot covering the current time."""
-        now = datetime.now(timezone.utc)
-        for slot in self.slots:
-            if slot.start <= now < slot.end:
-                return slot
-        return None
+        return self.get_slot_at(datetime.now(timezone.utc))
 
     def get_slot_at(self, dt: datetime) -> PlanSlot | None:
-        for slot in self.slots:
-            if slot.start <= dt < slot.end:
-                return slot
+        slots, n = self._indexed
+        if slots is not self.slots or n != len(self.slots):
+            self._index_slots()
+        if self._slot_starts is None:
+            for slot in self.slots:
+                if slot.start <= dt < slot.end:
+                    return slot
+            return None
+        i = bisect_right(self._slot_starts, dt) - 1
+        if i >= 0 and dt < self.slots[i].end:
+            return self.slots[i]
         return None
 
     def to_db_dict(self) -> dict:
@@ -100,7 +123,56 @@ class OptimisationPlan:
                 "solar_forecast_w": s.solar_forecast_w,
                 "load_forecast_w": s.load_forecast_w,
                 "scheduled_loads": s.scheduled_loads,
-                "constraint_flags": s.constraint_flags,
+                "constraint_flags": (
+                    [*(s.constraint_flags or []), _FREE_WINDOW_CHARGE_FLAG]
+                    if s.allow_charge_at_max_soc else s.constraint_flags
+                ),
             }
             for s in self.slots
         ]
+
+    @classmethod
+    def from_db(cls, row: dict, slot_rows: list[dict]) -> OptimisationPlan:
+        """Rebuild a plan from Repository.get_active_plan / get_plan_slots rows."""
+        slots = []
+        for r in slot_rows:
+            flags = json.loads(r["constraint_flags"]) if r.get("constraint_flags") else None
+            allow_charge = bool(flags) and _FREE_WINDOW_CHARGE_FLAG in flags
+            if allow_charge:
+                flags = [f for f in flags if f != _FREE_WINDOW_CHARGE_FLAG] or None
+            slots.append(PlanSlot(
+                index=r["slot_index"],
+                start=datetime.fromisoformat(r["slot_start"]),
+                end=datetime.fromisoformat(r["slot_end"]),
+                mode=SlotMode(r["operating_mode"]),
+                target_power_w=r["target_power_w"],
+                expected_soc=r["expected_soc"],
+                import_rate_cents=r["import_rate_cents"],
+                export_rate_cents=r["export_rate_cents"],
+                solar_forecast_w=r["solar_forecast_w"],
+                load_forecast_w=r["load_forecast_w"],
+                scheduled_loads=(
+                    json.loads(r["scheduled_loads_json"]) if r.get("scheduled_loads_json") else None
+                ),
+                constraint_flags=flags,
+                allow_charge_at_max_soc=allow_charge,
+            ))
+        metrics = json.loads(row["metrics_json"]) if row.get("metrics_json") else {}
+        return cls(
+            version=row["version"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+            trigger_reason=row["trigger_reason"],
+            horizon_start=datetime.fromisoformat(row["horizon_start"]),
+            horizon_end=datetime.fromisoformat(row["horizon_end"]),
+            slots=slots,
+            objective_score=row["objective_score"],
+            solver_time_ms=row["solver_time_ms"],
+            solver_status=metrics.get("status", "Optimal"),
+            active_constraints=(
+                json.loads(row["active_constraints_json"]) if row.get("active_constraints_json") else []
+            ),
+            reserve_state=(
+                json.loads(row["reserve_state_json"]) if row.get("reserve_state_json") else None
+            ),
+            metrics=metrics,
+        )
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
@@ -25,6 +26,9 @@ from power_master.optimisation.plan import OptimisationPlan, PlanSlot
 
 logger = logging.getLogger(__name__)
 
+# A no-rebuild verdict is reused for unchanged inputs for up to this long
+_IDLE_RECHECK_SECONDS = 5.0
+
 
 @dataclass
 class RebuildResult:
@@ -35,6 +39,21 @@ class RebuildResult:
     reason: str = ""
 
 
+@dataclass
+class _EvalContext:
+    """Inputs shared by the trigger checks of one evaluation."""
+
+    plan: OptimisationPlan
+    soc: float
+    aggregator: ForecastAggregator
+    now: float  # time.monotonic()
+    actual_solar_w: float | None = None
+    actual_load_w: float | None = None
+    # Set once the safety checks have passed
+    now_utc: datetime | None = None
+    slot: PlanSlot | None = None
+
+
 class RebuildEvaluator:
     """Evaluates whether the current plan needs rebuilding."""
 
@@ -45,6 +64,27 @@ class RebuildEvaluator:
         self._last_actuals_rebuild_time: float = 0.0
         self._last_tariff_rebuild_time: float = 0.0
         self._last_storm_state: bool = False
+        # (plan, slot index, SOC at slot start) from the last interpolation
+        self._soc_start_cache: tuple[OptimisationPlan, int, float] | None = None
+        # Inputs of the last evaluation that found nothing to do: plan and
+        # aggregator (compared by identity), quantised readings, expiry time
+        self._idle_refs: tuple[OptimisationPlan, ForecastAggregator, object] | None = None
+        self._idle_key: tuple = ()
+        self._idle_until: float = 0.0
+        # Trigger checks in priority order; each returns a result or None.
+        # Safety checks also run during manual override.
+        self._safety_checks: tuple[Callable[[_EvalContext], RebuildResult | None], ...] = (
+            self._check_price_spike,
+            self._check_storm,
+        )
+        self._plan_checks: tuple[Callable[[_EvalContext], RebuildResult | None], ...] = (
+            self._check_plan_expired,
+            self._check_soc_deviation,
+            self._check_tariff_change,
+            self._check_actuals_deviation,
+            self._check_periodic,
+            self._check_forecast_staleness,
+        )
 
     def evaluate(
         self,
@@ -57,6 +97,7 @@ class RebuildEvaluator:
     ) -> RebuildResult:
         """Check all rebuild triggers and return result.
 
+        Triggers are checked in priority order and the first hit wins.
         When manual_override_active is True, only safety-critical triggers
         (price spike, storm) are evaluated — SOC deviation and periodic
         rebuilds are suppressed because the user is intentionally overriding
@@ -68,147 +109,232 @@ class RebuildEvaluator:
         if current_plan is None:
             return RebuildResult(True, "initial", "No active plan")
 
-        # 2. Price spike state changed (always active, even during override)
-        if aggregator.spike_detector.is_spike_active:
+        ctx = _EvalContext(
+            plan=current_plan,
+            soc=current_soc,
+            aggregator=aggregator,
+            now=now,
+            actual_solar_w=actual_solar_w,
+            actual_load_w=actual_load_w,
+        )
+        for check in self._safety_checks:
+            result = check(ctx)
+            if result is not None:
+                return result
+
+        # During manual override, skip SOC deviation, periodic, actuals
+        # deviation, and staleness triggers — they are not useful when the
+        # user is intentionally controlling the system.
+        if manual_override_active:
+            return RebuildResult(False)
+
+        # One wall-clock read per evaluation, shared by the checks below
+        ctx.now_utc = datetime.now(timezone.utc)
+        ctx.slot = current_slot = current_plan.get_slot_at(ctx.now_utc)
+
+        # Nothing relevant changed since the last no-rebuild verdict: SOC
+        # within 0.5%, actuals within 50 W, same plan slot and tariff.
+        tariff = aggregator.state.tariff
+        idle_key = (
+            current_slot.index if current_slot else None,
+            round(current_soc * 200),
+            None if actual_solar_w is None else round(actual_solar_w / 50),
+            None if actual_load_w is None else round(actual_load_w / 50),
+        )
+        refs = self._idle_refs
+        if (
+            refs is not None and now < self._idle_until
+            and refs[0] is current_plan and refs[1] is aggregator and refs[2] is tariff
+            and idle_key == self._idle_key
+        ):
+            return RebuildResult(False)
+
+        for check in self._plan_checks:
+            result = check(ctx)
+            if result is not None:
+                return result
+
+        self._idle_refs = (current_plan, aggregator, tariff)
+        self._idle_key = idle_key
+        # Never hold the verdict past the next periodic rebuild
+        self._idle_until = min(
+            now + _IDLE_RECHECK_SECONDS,
+            self._last_rebuild_time + self._config.planning.periodic_rebuild_interval_seconds,
+        )
+        return RebuildResult(False)
+
+    def _check_price_spike(self, ctx: _EvalContext) -> RebuildResult | None:
+        """2. Price spike state changed (always active, even during override)."""
+        if ctx.aggregator.spike_detector.is_spike_active:
             # Check if we haven't already rebuilt for this spike
-            if current_plan.trigger_reason != "price_spike":
+            if ctx.plan.trigger_reason != "price_spike":
                 return RebuildResult(True, "price_spike", "Price spike detected")
+        return None
 
-        # 3. Storm state changed (always active, even during override)
-        storm_active = aggregator.state.storm_probability >= self._config.storm.probability_threshold
+    def _check_storm(self, ctx: _EvalContext) -> RebuildResult | None:
+        """3. Storm state changed (always active, even during override)."""
+        storm_active = ctx.aggregator.state.storm_probability >= self._config.storm.probability_threshold
         if storm_active != self._last_storm_state:
             self._last_storm_state = storm_active
             state_str = "activated" if storm_active else "cleared"
             return RebuildResult(True, "storm", f"Storm {state_str}")
+        return None
 
-        # During manual override, skip SOC deviation, periodic, actuals
-        # deviation, and staleness triggers — they are not useful when the
-        # user is intentionally controlling the system.
-        if manual_override_active:
-            return RebuildResult(False)
+    def _check_plan_expired(self, ctx: _EvalContext) -> RebuildResult | None:
+        """4. Plan expired — current time is past all plan slots.
 
-        # 4. Plan expired — current time is past all plan slots.
-        #    This means the plan is completely stale and must be rebuilt.
-        current_slot = current_plan.get_current_slot()
-        if current_slot is None and current_plan.slots:
-            last_slot_end = current_plan.slots[-1].end
-            from datetime import datetime, timezone
-            if datetime.now(timezone.utc) >= last_slot_end:
+        This means the plan is completely stale and must be rebuilt.
+        """
+        if ctx.slot is None and ctx.plan.slots:
+            last_slot_end = ctx.plan.slots[-1].end
+            if ctx.now_utc >= last_slot_end:
                 return RebuildResult(
                     True, "plan_expired",
                     f"Plan expired (horizon ended {last_slot_end.isoformat()})",
                 )
+        return None
 
-        # 5. SOC deviation — interpolate expected SOC within current slot
-        if current_slot:
-            expected_now = self._interpolated_expected_soc(current_plan, current_slot)
-            deviation = abs(current_soc - expected_now)
-            logger.info(
-                "SOC check: actual=%.1f%% expected=%.1f%% deviation=%.1f%% tolerance=%.1f%%",
-                current_soc * 100, expected_now * 100, deviation * 100,
-                self._config.planning.soc_deviation_tolerance * 100,
-            )
-            if deviation > self._config.planning.soc_deviation_tolerance:
-                cooldown = self._config.planning.soc_deviation_cooldown_seconds
-                if (now - self._last_soc_rebuild_time) >= cooldown:
-                    return RebuildResult(
-                        True, "soc_deviation",
-                        f"SOC deviation: {deviation:.1%} "
-                        f"(expected {expected_now:.1%}, actual {current_soc:.1%})",
-                    )
-
-        # 6. Tariff change — current import price differs significantly
-        #    from what the plan assumed for this slot.
-        if current_slot:
-            tariff = aggregator.state.tariff
-            if tariff:
-                live_import = tariff.get_current_import_price()
-                if live_import is not None and current_slot.import_rate_cents > 0:
-                    tariff_dev = abs(live_import - current_slot.import_rate_cents) / max(current_slot.import_rate_cents, 1)
-                    threshold_pct = self._config.planning.forecast_delta_threshold_pct / 100.0
-                    if tariff_dev > threshold_pct:
-                        cooldown = self._config.planning.soc_deviation_cooldown_seconds
-                        if (now - self._last_tariff_rebuild_time) >= cooldown:
-                            return RebuildResult(
-                                True, "tariff_change",
-                                f"Import price changed: plan={current_slot.import_rate_cents:.1f}c "
-                                f"live={live_import:.1f}c ({tariff_dev:.0%} deviation)",
-                            )
-
-        # 7. Actuals vs forecast deviation — trigger rebuild when real
-        # solar or load diverges significantly from what the plan assumed.
-        # Gate behind rebuild_on_actuals_deviation (True for amber, False for TOU).
-        if (self._config.planning.rebuild_on_actuals_deviation and
-            current_slot and (actual_solar_w is not None or actual_load_w is not None)):
-            threshold_pct = self._config.planning.forecast_delta_threshold_pct / 100.0
+    def _check_soc_deviation(self, ctx: _EvalContext) -> RebuildResult | None:
+        """5. SOC deviation — interpolate expected SOC within current slot."""
+        current_slot = ctx.slot
+        if not current_slot:
+            return None
+        current_soc = ctx.soc
+        expected_now = self._interpolated_expected_soc(ctx.plan, current_slot, ctx.now_utc)
+        deviation = abs(current_soc - expected_now)
+        logger.info(
+            "SOC check: actual=%.1f%% expected=%.1f%% deviation=%.1f%% tolerance=%.1f%%",
+            current_soc * 100, expected_now * 100, deviation * 100,
+            self._config.planning.soc_deviation_tolerance * 100,
+        )
+        if deviation > self._config.planning.soc_deviation_tolerance:
             cooldown = self._config.planning.soc_deviation_cooldown_seconds
+            if (ctx.now - self._last_soc_rebuild_time) >= cooldown:
+                return RebuildResult(
+                    True, "soc_deviation",
+                    f"SOC deviation: {deviation:.1%} "
+                    f"(expected {expected_now:.1%}, actual {current_soc:.1%})",
+                )
+        return None
+
+    def _check_tariff_change(self, ctx: _EvalContext) -> RebuildResult | None:
+        """6. Tariff change — current import price differs significantly
+        from what the plan assumed for this slot.
+        """
+        current_slot = ctx.slot
+        tariff = ctx.aggregator.state.tariff
+        if current_slot and tariff:
+            live_import = tariff.get_current_import_price()
+            if live_import is not None and current_slot.import_rate_cents > 0:
+                tariff_dev = abs(live_import - current_slot.import_rate_cents) / max(current_slot.import_rate_cents, 1)
+                threshold_pct = self._config.planning.forecast_delta_threshold_pct / 100.0
+                if tariff_dev > threshold_pct:
+                    cooldown = self._config.planning.soc_deviation_cooldown_seconds
+                    if (ctx.now - self._last_tariff_rebuild_time) >= cooldown:
+                        return RebuildResult(
+                            True, "tariff_change",
+                            f"Import price changed: plan={current_slot.import_rate_cents:.1f}c "
+                            f"live={live_import:.1f}c ({tariff_dev:.0%} deviation)",
+                        )
+        return None
 
-            if actual_solar_w is not None and current_slot.solar_forecast_w > 0:
-                solar_dev = abs(actual_solar_w - current_slot.solar_forecast_w) / max(current_slot.solar_forecast_w, 1)
-                if solar_dev > threshold_pct and (now - self._last_actuals_rebuild_time) >= cooldown:
-                    return RebuildResult(
-                        True, "actuals_deviation",
-                        f"Solar actuals deviation: {solar_dev:.0%} "
-                        f"(forecast {current_slot.solar_forecast_w:.0f}W, actual {actual_solar_w:.0f}W)",
-                    )
-
-            if actual_load_w is not None and current_slot.load_forecast_w > 0:
-                load_dev = abs(actual_load_w - current_slot.load_forecast_w) / max(current_slot.load_forecast_w, 1)
-                if load_dev > threshold_pct and (now - self._last_actuals_rebuild_time) >= cooldown:
-                    return RebuildResult(
-                        True, "actuals_deviation",
-                        f"Load actuals deviation: {load_dev:.0%} "
-                        f"(forecast {current_slot.load_forecast_w:.0f}W, actual {actual_load_w:.0f}W)",
-                    )
-        elif (not self._config.planning.rebuild_on_actuals_deviation and
-              current_slot and (actual_solar_w is not None or actual_load_w is not None)):
+    def _check_actuals_deviation(self, ctx: _EvalContext) -> RebuildResult | None:
+        """7. Actuals vs forecast deviation.
+
+        Rebuild when real solar or load diverges significantly from what the
+        plan assumed.  Gated behind rebuild_on_actuals_deviation (True for
+        amber, False for TOU).
+        """
+        current_slot = ctx.slot
+        actual_solar_w = ctx.actual_solar_w
+        actual_load_w = ctx.actual_load_w
+        if not current_slot or (actual_solar_w is None and actual_load_w is None):
+            return None
+        if not self._config.planning.rebuild_on_actuals_deviation:
             # Debug log when trigger is suppressed
             logger.debug("Rebuild trigger 'actuals_deviation' suppressed (rebuild_on_actuals_deviation=False)")
+            return None
+
+        threshold_pct = self._config.planning.forecast_delta_threshold_pct / 100.0
+        cooldown = self._config.planning.soc_deviation_cooldown_seconds
+        cooled_down = (ctx.now - self._last_actuals_rebuild_time) >= cooldown
 
-        # 8. Periodic rebuild
-        elapsed = now - self._last_rebuild_time
+        if actual_solar_w is not None and current_slot.solar_forecast_w > 0:
+            solar_dev = abs(actual_solar_w - current_slot.solar_forecast_w) / max(current_slot.solar_forecast_w, 1)
+            if solar_dev > threshold_pct and cooled_down:
+                return RebuildResult(
+                    True, "actuals_deviation",
+                    f"Solar actuals deviation: {solar_dev:.0%} "
+                    f"(forecast {current_slot.solar_forecast_w:.0f}W, actual {actual_solar_w:.0f}W)",
+                )
+
+        if actual_load_w is not None and current_slot.load_forecast_w > 0:
+            load_dev = abs(actual_load_w - current_slot.load_forecast_w) / max(current_slot.load_forecast_w, 1)
+            if load_dev > threshold_pct and cooled_down:
+                return RebuildResult(
+                    True, "actuals_deviation",
+                    f"Load actuals deviation: {load_dev:.0%} "
+                    f"(forecast {current_slot.load_forecast_w:.0f}W, actual {actual_load_w:.0f}W)",
+                )
+        return None
+
+    def _check_periodic(self, ctx: _EvalContext) -> RebuildResult | None:
+        """8. Periodic rebuild."""
+        elapsed = ctx.now - self._last_rebuild_time
         if elapsed >= self._config.planning.periodic_rebuild_interval_seconds:
             return RebuildResult(True, "periodic", f"Periodic ({elapsed:.0f}s since last)")
+        return None
 
-        # 9. Forecast staleness
-        # Gate behind rebuild_on_forecast_staleness (True for amber, False for TOU).
-        if self._config.planning.rebuild_on_forecast_staleness:
-            if aggregator.is_stale(self._config.resilience.stale_forecast_max_age_seconds):
-                return RebuildResult(True, "forecast_delta", "Forecast data is stale")
-        else:
-            # Debug log when trigger is suppressed
-            if aggregator.is_stale(self._config.resilience.stale_forecast_max_age_seconds):
-                logger.debug("Rebuild trigger 'forecast_delta' suppressed (rebuild_on_forecast_staleness=False)")
+    def _check_forecast_staleness(self, ctx: _EvalContext) -> RebuildResult | None:
+        """9. Forecast staleness.
 
-        return RebuildResult(False)
+        Gated behind rebuild_on_forecast_staleness (True for amber, False
+        for TOU).
+        """
+        stale = ctx.aggregator.is_stale(self._config.resilience.stale_forecast_max_age_seconds)
+        if not stale:
+            return None
+        if self._config.planning.rebuild_on_forecast_staleness:
+            return RebuildResult(True, "forecast_delta", "Forecast data is stale")
+        # Debug log when trigger is suppressed
+        logger.debug("Rebuild trigger 'forecast_delta' suppressed (rebuild_on_forecast_staleness=False)")
+        return None
 
     def _interpolated_expected_soc(
-        self, plan: OptimisationPlan, current_slot: PlanSlot,
+        self, plan: OptimisationPlan, current_slot: PlanSlot, now: datetime | None = None,
     ) -> float:
-        """Linearly interpolate expected SOC at current time within the slot.
+        """Linearly interpolate expected SOC at *now* (default: current time) within the slot.
 
         Uses previous slot's expected_soc as start, current slot's as end.
         For the first slot, uses plan's initial SOC (from metrics).
         """
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         slot_duration = (current_slot.end - current_slot.start).total_seconds()
         elapsed = (now - current_slot.start).total_seconds()
         progress = max(0.0, min(1.0, elapsed / slot_duration)) if slot_duration > 0 else 1.0
 
-        # SOC at start of current slot = previous slot's expected_soc or initial
-        if current_slot.index > 0 and current_slot.index <= len(plan.slots):
-            prev_slot = plan.slots[current_slot.index - 1]
-            soc_start = prev_slot.expected_soc
+        # SOC at start of current slot = previous slot's expected_soc or initial.
+        # Fixed for a given plan and slot, so reused until either changes.
+        cached = self._soc_start_cache
+        if cached is not None and cached[0] is plan and cached[1] == current_slot.index:
+            soc_start = cached[2]
         else:
-            # First slot — use the solver's initial SOC from plan metrics
-            soc_start = plan.metrics.get("current_soc", current_slot.expected_soc)
+            if current_slot.index > 0 and current_slot.index <= len(plan.slots):
+                prev_slot = plan.slots[current_slot.index - 1]
+                soc_start = prev_slot.expected_soc
+            else:
+                # First slot — use the solver's initial SOC from plan metrics
+                soc_start = plan.metrics.get("current_soc", current_slot.expected_soc)
+            self._soc_start_cache = (plan, current_slot.index, soc_start)
 
         soc_end = current_slot.expected_soc
         return soc_start + (soc_end - soc_start) * progress
 
-    def mark_rebuilt(self, trigger: str = "") -> None:
-        """Record that a rebuild just occurred."""
-        self._last_rebuild_time = time.monotonic()
+    def mark_rebuilt(self, trigger: str = "", age_seconds: float = 0.0) -> None:
+        """Record that a rebuild occurred ``age_seconds`` ago (default: just now)."""
+        self._last_rebuild_time = time.monotonic() - age_seconds
+        self._idle_refs = None
         if trigger == "soc_deviation":
             self._last_soc_rebuild_time = time.monotonic()
         if trigger == "actuals_deviation":
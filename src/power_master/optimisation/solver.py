@@ -1,10 +1,12 @@
-"""MILP solver for battery optimisation using PuLP (CBC)."""
+"""MILP solver for battery optimisation using PuLP (CBC or HiGHS)."""
 
 from __future__ import annotations
 
+import functools
 import logging
 import time
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, replace
 from datetime import date, datetime, timedelta, timezone
 
 import pulp
@@ -27,7 +29,7 @@ from power_master.optimisation.constraints import (
     add_spike_constraints,
     add_storm_reserve,
 )
-from power_master.optimisation.objective import ObjectiveWeights, build_objective
+from power_master.optimisation.objective import build_objective
 from power_master.optimisation.plan import OptimisationPlan, PlanSlot, SlotMode
 from power_master.timezone_utils import resolve_timezone
 
@@ -38,6 +40,43 @@ logger = logging.getLogger(__name__)
 # grid-charge policy so free-window detection stays consistent.
 FREE_RATE_THRESHOLD_CENTS = 1.0
 
+# Half-width of the SOC band a pinned tail slot may move within.  Plan SOC is
+# stored rounded to 4 dp, so pinning consecutive slots exactly can be
+# infeasible once efficiency losses are applied.
+_TAIL_SOC_TOLERANCE = 0.005
+
+
+def _cbc_solver(time_limit: int, warm_start: bool) -> pulp.LpSolver:
+    return pulp.PULP_CBC_CMD(msg=0, timeLimit=time_limit, warmStart=warm_start)
+
+
+def _highs_solver(time_limit: int, warm_start: bool) -> pulp.LpSolver:
+    # In-process highspy binding: no model file or subprocess round-trip.
+    # It does not take a warm start.
+    return pulp.HiGHS(msg=False, timeLimit=time_limit)
+
+
+# planning.solver value -> factory(time_limit, warm_start)
+SOLVER_REGISTRY = {
+    "cbc": _cbc_solver,
+    "highs": _highs_solver,
+}
+
+
+@functools.cache
+def _solver_available(name: str) -> bool:
+    available = bool(SOLVER_REGISTRY[name](1, False).available())
+    if not available:
+        logger.warning("Solver backend '%s' is not available — falling back to CBC", name)
+    return available
+
+
+def _make_solver(name: str, time_limit: int, warm_start: bool) -> pulp.LpSolver:
+    """Instantiate the configured MILP backend, falling back to CBC."""
+    if name not in SOLVER_REGISTRY or (name != "cbc" and not _solver_available(name)):
+        name = "cbc"
+    return SOLVER_REGISTRY[name](time_limit, warm_start)
+
 
 def _add_export_tier_constraints(
     prob: pulp.LpProblem,
@@ -56,7 +95,11 @@ def _add_export_tier_constraints(
         return
 
     # Decomposition: sum of tier exports = total export
-    prob += pulp.lpSum(export_tier_vars) == grid_export, f"export_tier_decomp_{t}"
+    terms = [(var, 1) for var in export_tier_vars]
+    terms.append((grid_export, -1))
+    prob.addConstraint(pulp.LpConstraint(
+        pulp.LpAffineExpression(terms), pulp.LpConstraintEQ, f"export_tier_decomp_{t}",
+    ))
 
 
 def _add_export_tier_caps(
@@ -73,9 +116,6 @@ def _add_export_tier_caps(
 
     Open-ended tiers (cap=None) have no constraint.
     """
-    from datetime import date
-    from collections import defaultdict
-
     # Group slots by (local_date, tier_index)
     # tier_slots[date][tier_index] = list of slot indices
     tier_slots: dict[tuple[date, int], list[int]] = defaultdict(list)
@@ -103,17 +143,19 @@ def _add_export_tier_caps(
 
         # Sum of kWh for this tier on this day <= cap_kwh_per_day
         cap_kwh = tier.up_to_kwh_per_day
-        export_terms = []
-        for t in slot_list:
-            if t < len(export_tier_vars) and tier_idx < len(export_tier_vars[t]):
-                # Convert watts to kWh: power_W * slot_hours / 1000
-                export_terms.append(export_tier_vars[t][tier_idx] * slot_hours / 1000)
+        # Convert watts to kWh: power_W * slot_hours / 1000
+        kwh_per_w = slot_hours / 1000
+        export_terms = [
+            (export_tier_vars[t][tier_idx], kwh_per_w)
+            for t in slot_list
+            if t < len(export_tier_vars) and tier_idx < len(export_tier_vars[t])
+        ]
 
         if export_terms:
-            prob += (
-                pulp.lpSum(export_terms) <= cap_kwh,
-                f"export_tier_cap_{local_date}_{tier_idx}",
-            )
+            prob.addConstraint(pulp.LpConstraint(
+                pulp.LpAffineExpression(export_terms), pulp.LpConstraintLE,
+                f"export_tier_cap_{local_date}_{tier_idx}", cap_kwh,
+            ))
 
 
 def dampen_price(price_cents: float, threshold_cents: int, factor: float) -> float:
@@ -147,6 +189,28 @@ def dampen_price_weighted(
     return dampen_price(price_cents, threshold_cents, effective_factor)
 
 
+def dampen_prices_weighted(
+    prices_cents: list[float],
+    threshold_cents: int,
+    base_factor: float,
+) -> list[float]:
+    """Horizon-weighted dampening of a whole price series.
+
+    Same result as ``dampen_price_weighted`` applied to every slot, but
+    prices at or below the threshold skip the factor computation.
+    """
+    n = len(prices_cents)
+    if n <= 1:
+        return [dampen_price(p, threshold_cents, base_factor) for p in prices_cents]
+    span = n - 1
+    shrink = 1.0 - base_factor
+    return [
+        p if p <= threshold_cents
+        else threshold_cents + (p - threshold_cents) * (1.0 - shrink * (t / span))
+        for t, p in enumerate(prices_cents)
+    ]
+
+
 @dataclass
 class ExportTier:
     """Per-tier export rate cap and pricing.
@@ -229,6 +293,14 @@ class SolverInputs:
     # If None, no incumbent exists; if set, carries the current slot's mode for mode-switch hysteresis.
     incumbent_mode: SlotMode | None = None
 
+    # Warm start: per-slot charging direction from a previous plan, used as
+    # the initial value of the is_charging binaries (None = cold solve).
+    warm_start_charging: list[bool] | None = None
+
+    # Rolling horizon: previous plan's expected SOC per slot (None where it
+    # has no slot).  Pins the last planning.fix_tail_slots slots.
+    previous_soc: list[float | None] | None = None
+
     @property
     def n_slots(self) -> int:
         return len(self.solar_forecast_w)
@@ -256,7 +328,8 @@ def solve(
 ) -> OptimisationPlan:
     """Run the MILP optimisation and return a plan.
 
-    Uses PuLP with CBC solver. Timeout configurable via config.planning.solver_timeout_seconds.
+    Uses PuLP with the backend chosen by config.planning.solver (CBC by
+    default). Timeout configurable via config.planning.solver_timeout_seconds.
     """
     start_time = time.monotonic()
     n = inputs.n_slots
@@ -265,19 +338,20 @@ def solve(
     cap = config.battery.capacity_wh
     eff = config.battery.round_trip_efficiency ** 0.5  # Split efficiency between charge/discharge
     planner_tz = _resolve_planner_timezone(config)
+    # Per-slot input columns, bound once for the loops below
+    solar_w = inputs.solar_forecast_w
+    load_w = inputs.load_forecast_w
+    import_rates = inputs.import_rate_cents
+    export_rates = inputs.export_rate_cents
+    is_spike = inputs.is_spike
 
     # ── Apply price dampening to import rates ──
     arb = config.arbitrage
-    dampened_import = [
-        dampen_price_weighted(
-            price_cents=p,
-            threshold_cents=arb.price_dampen_threshold_cents,
-            base_factor=arb.price_dampen_factor,
-            slot_index=t,
-            n_slots=n,
-        )
-        for t, p in enumerate(inputs.import_rate_cents)
-    ]
+    dampened_import = dampen_prices_weighted(
+        import_rates,
+        arb.price_dampen_threshold_cents,
+        arb.price_dampen_factor,
+    )
 
     # ── Create problem ──
     prob = pulp.LpProblem("PowerMaster", pulp.LpMinimize)
@@ -286,6 +360,10 @@ def solve(
     charge = [pulp.LpVariable(f"charge_{t}", 0, config.battery.max_charge_rate_w) for t in range(n)]
     discharge = [pulp.LpVariable(f"discharge_{t}", 0, config.battery.max_discharge_rate_w) for t in range(n)]
     is_charging = [pulp.LpVariable(f"is_charging_{t}", cat="Binary") for t in range(n)]
+    warm_start = inputs.warm_start_charging
+    if warm_start:
+        for t, charging in enumerate(warm_start[:n]):
+            is_charging[t].setInitialValue(1 if charging else 0)
     # Grid bounded by inverter capacity + load headroom
     max_grid = config.battery.max_charge_rate_w + config.battery.max_discharge_rate_w
     grid_import = [pulp.LpVariable(f"grid_import_{t}", 0, max_grid) for t in range(n)]
@@ -315,8 +393,7 @@ def solve(
     credit_daily_import: dict[tuple[str, "date"], list[int]] = {}  # (credit_name, date) -> list of slot indices
     if inputs.has_credit_windows:
         # First pass: identify (credit_name, local_date) pairs and collect slot indices
-        from datetime import date as dt_date
-        credit_slots: dict[tuple[str, dt_date], list[int]] = {}
+        credit_slots: dict[tuple[str, date], list[int]] = {}
         for t in range(n):
             cw = inputs.credit_windows[t] if inputs.credit_windows else None
             if cw and cw.in_window:
@@ -353,7 +430,7 @@ def solve(
         config.battery.soc_max_hard,
     )
     is_free_slot = [
-        float(inputs.import_rate_cents[t]) <= FREE_RATE_THRESHOLD_CENTS
+        float(import_rates[t]) <= FREE_RATE_THRESHOLD_CENTS
         for t in range(n)
     ]
     free_block_end = [
@@ -361,11 +438,36 @@ def solve(
         for t in range(n)
     ]
 
+    # ── Rolling-horizon tail commitment ──
+    # Far-horizon slots keep the previous plan's SOC so only the near term
+    # is re-optimised; slots the previous plan did not reach stay free.
+    fix_tail = min(config.planning.fix_tail_slots, n)
+    tail_fixed = False
+    if fix_tail and inputs.previous_soc:
+        for t in range(n - fix_tail, n):
+            prev = inputs.previous_soc[t] if t < len(inputs.previous_soc) else None
+            if prev is not None:
+                soc[t].lowBound = max(soc[t].lowBound, prev - _TAIL_SOC_TOLERANCE)
+                soc[t].upBound = min(soc[t].upBound, prev + _TAIL_SOC_TOLERANCE)
+                tail_fixed = True
+
     # Taper zone binary variables (1 = SOC is above taper threshold)
     taper_start = config.battery.taper_start_soc
     taper_factor = config.battery.taper_factor
     in_taper = [pulp.LpVariable(f"in_taper_{t}", cat="Binary") for t in range(n)]
 
+    # Planner-local hour of each slot for the time-based soft targets
+    local_hours = (
+        [dt.astimezone(planner_tz).hour for dt in inputs.slot_start_times]
+        if inputs.slot_start_times else None
+    )
+    targets = config.battery_targets
+    evening_hour = targets.evening_target_hour
+    morning_hour = targets.morning_minimum_hour
+    reserve_start = targets.daytime_reserve_start_hour
+    reserve_end = targets.daytime_reserve_end_hour
+    reserve_target = targets.daytime_reserve_soc_target
+
     # ── Constraints per slot ──
     for t in range(n):
         # SOC dynamics
@@ -389,7 +491,7 @@ def solve(
 
         # Energy balance
         add_energy_balance(
-            prob, t, inputs.solar_forecast_w[t], inputs.load_forecast_w[t],
+            prob, t, solar_w[t], load_w[t],
             grid_import[t], grid_export[t], charge[t], discharge[t],
             self_consumed[t], curtail[t],
         )
@@ -405,7 +507,7 @@ def solve(
         # Arbitrage gate (provider-aware, §R2)
         add_arbitrage_gate(
             prob, t, grid_export[t],
-            inputs.export_rate_cents[t], inputs.wacb_cents,
+            export_rates[t], inputs.wacb_cents,
             config.arbitrage.break_even_delta_cents,
             gate_policy=config.arbitrage.gate_policy,
         )
@@ -413,13 +515,13 @@ def solve(
         # Grid-charge policy: free-window + solar only (or allow arbitrage)
         add_grid_charge_policy(
             prob, t, grid_import[t], charge[t],
-            inputs.import_rate_cents[t],
+            import_rates[t],
             policy=config.providers.tariff.grid_charge_policy,
             free_rate_threshold_cents=1.0,  # ~0c: allow charging in free/0c windows
         )
 
         # Spike constraints
-        add_spike_constraints(prob, t, charge[t], inputs.is_spike[t])
+        add_spike_constraints(prob, t, charge[t], is_spike[t])
 
         # Free-window fill: aim for a high SOC by the end of each free block
         if free_window_target > 0 and free_block_end[t]:
@@ -434,21 +536,18 @@ def solve(
             add_storm_reserve(prob, t, soc[t], inputs.storm_reserve_soc, ss)
 
         # Time-based soft targets
-        if inputs.slot_start_times:
-            hour = inputs.slot_start_times[t].astimezone(planner_tz).hour
+        if local_hours:
+            hour = local_hours[t]
             # Evening SOC target (at peak start hour)
-            if hour == config.battery_targets.evening_target_hour:
+            if hour == evening_hour:
                 es = pulp.LpVariable(f"evening_slack_{t}", 0)
                 evening_slack.append(es)
-                add_evening_soc_target(prob, t, soc[t], config.battery_targets.evening_soc_target, es)
+                add_evening_soc_target(prob, t, soc[t], targets.evening_soc_target, es)
             # Morning minimum
-            if hour == config.battery_targets.morning_minimum_hour:
+            if hour == morning_hour:
                 ms = pulp.LpVariable(f"morning_slack_{t}", 0)
                 morning_slack.append(ms)
-                add_morning_soc_minimum(prob, t, soc[t], config.battery_targets.morning_soc_minimum, ms)
-            reserve_start = config.battery_targets.daytime_reserve_start_hour
-            reserve_end = config.battery_targets.daytime_reserve_end_hour
-            reserve_target = config.battery_targets.daytime_reserve_soc_target
+                add_morning_soc_minimum(prob, t, soc[t], targets.morning_soc_minimum, ms)
             if reserve_start <= hour < reserve_end and reserve_target > 0:
                 ds = pulp.LpVariable(f"daytime_slack_{t}", 0)
                 daytime_slack.append(ds)
@@ -461,7 +560,10 @@ def solve(
                 # Hard enforcement: grid_import[t] == 0 with penalised slack
                 cs = pulp.LpVariable(f"credit_slack_{t}", 0)
                 credit_slack.append(cs)
-                prob += grid_import[t] <= cs, f"credit_hard_constraint_{cw.credit_name}_{t}"
+                prob.addConstraint(pulp.LpConstraint(
+                    pulp.LpAffineExpression([(grid_import[t], 1), (cs, -1)]),
+                    pulp.LpConstraintLE, f"credit_hard_constraint_{cw.credit_name}_{t}",
+                ))
 
     # ── Per-day cumulative tier cap constraints (Phase 2) ──
     if inputs.has_tiered_export and export_tier_vars:
@@ -480,11 +582,16 @@ def solve(
             if cw and cw.enforcement == "soft" and (credit_name, local_date) in credit_missed_vars:
                 missed_var = credit_missed_vars[(credit_name, local_date)]
                 threshold_kwh = cw.max_import_kwh_per_hour * len(slot_list) * slot_hours
-                # Sum of in-window import in kWh
-                import_sum = pulp.lpSum([grid_import[t] * slot_hours / 1000.0 for t in slot_list])
-                # If import_sum > threshold: missed[d] must be 1; else can be 0
-                prob += import_sum <= threshold_kwh + BIG_M * missed_var, \
-                    f"credit_soft_threshold_{credit_name}_{local_date}"
+                # Sum of in-window import in kWh.  If it exceeds the
+                # threshold, missed[d] must be 1; else it can be 0:
+                #   import_sum - BIG_M * missed <= threshold
+                kwh_per_w = slot_hours / 1000.0
+                terms = [(grid_import[t], kwh_per_w) for t in slot_list]
+                terms.append((missed_var, -BIG_M))
+                prob.addConstraint(pulp.LpConstraint(
+                    pulp.LpAffineExpression(terms), pulp.LpConstraintLE,
+                    f"credit_soft_threshold_{credit_name}_{local_date}", threshold_kwh,
+                ))
 
     # ── Hysteresis bias for slot-0 mode stability (status-quo tie-break) ──
     # If incumbent_mode is set and hysteresis is enabled, compute a signed bias to reward
@@ -508,7 +615,7 @@ def solve(
     # ── Objective ── (uses dampened import prices to avoid overreaction to spikes)
     build_objective(
         prob, n, slot_hours,
-        dampened_import, inputs.export_rate_cents,
+        dampened_import, export_rates,
         config.fixed_costs.hedging_per_kwh_cents,
         grid_import, grid_export, self_consumed,
         safety_slack, storm_slack, evening_slack, free_window_slack, morning_slack, daytime_slack,
@@ -520,9 +627,10 @@ def solve(
     )
 
     # ── Solve ──
-    solver = pulp.PULP_CBC_CMD(
-        msg=0,
-        timeLimit=config.planning.solver_timeout_seconds,
+    solver = _make_solver(
+        config.planning.solver,
+        config.planning.solver_timeout_seconds,
+        bool(warm_start),
     )
     prob.solve(solver)
 
@@ -530,6 +638,12 @@ def solve(
     status = pulp.LpStatus[prob.status]
 
     if status not in ("Optimal", "Not Solved"):
+        if tail_fixed:
+            # Forecasts moved too far for the old tail: re-plan it freely
+            logger.info("Pinned tail infeasible (%s); re-solving full horizon", status)
+            return solve(
+                config, replace(inputs, previous_soc=None), trigger_reason, plan_version,
+            )
         logger.warning("Solver status: %s (time: %dms)", status, solver_time_ms)
 
     # ── Build plan from solution ──
@@ -545,23 +659,30 @@ def solve(
     force_charge_threshold = config.battery_targets.force_charge_below_price_cents
     grid_charge_policy = config.providers.tariff.grid_charge_policy
 
+    force_charge_power = _force_charge_target_powers(config, inputs)
+
+    # Read the solution once per variable list (unsolved variables read as 0)
+    charge_vals = [v.varValue or 0 for v in charge]
+    discharge_vals = [v.varValue or 0 for v in discharge]
+    soc_vals = [v.varValue or 0 for v in soc]
+    export_vals = [v.varValue or 0 for v in grid_export]
+    import_vals = [v.varValue or 0 for v in grid_import]
+
     for t in range(n):
-        charge_val = pulp.value(charge[t]) or 0
-        discharge_val = pulp.value(discharge[t]) or 0
-        soc_val = pulp.value(soc[t]) or 0
+        charge_val = charge_vals[t]
+        discharge_val = discharge_vals[t]
+        soc_val = soc_vals[t]
 
         # Determine mode from solution
-        export_val = pulp.value(grid_export[t]) or 0
-        import_val = pulp.value(grid_import[t]) or 0
-        mode = _determine_mode(
-            charge_val, discharge_val, export_val, import_val, inputs.is_spike[t],
-        )
+        export_val = export_vals[t]
+        import_val = import_vals[t]
+        mode = _determine_mode(charge_val, discharge_val, export_val, import_val)
         # Cheap-price override: force grid charging whenever buy price is at or
         # below the configured threshold, regardless of solver decision.
         # Under "free_window_and_solar_only" policy: only allow force-charge at ~0c
         # (the free window), not at paid rates. This prevents panic-import.
         if force_charge_threshold > 0:
-            slot_import_rate = float(inputs.import_rate_cents[t])
+            slot_import_rate = float(import_rates[t])
             allow_force_charge = False
 
             if grid_charge_policy == "free_window_and_solar_only":
@@ -586,7 +707,7 @@ def solve(
         force_charge_free_window = (
             free_window_target > 0
             and is_free_slot[t]
-            and not inputs.is_spike[t]
+            and not is_spike[t]
             and mode in (SlotMode.SELF_USE, SlotMode.FORCE_CHARGE)
         )
         if force_charge_free_window:
@@ -595,16 +716,14 @@ def solve(
         power = _determine_target_power(
             mode=mode,
             discharge_w=discharge_val,
-            config=config,
-            inputs=inputs,
-            slot_index=t,
+            force_charge_w=force_charge_power[t],
         )
 
         slot_start = horizon_start + timedelta(minutes=t * slot_minutes)
         slot_end = slot_start + timedelta(minutes=slot_minutes)
 
         flags = []
-        if inputs.is_spike[t]:
+        if is_spike[t]:
             flags.append("spike")
         if inputs.storm_active:
             flags.append("storm_reserve")
@@ -616,15 +735,15 @@ def solve(
             mode=mode,
             target_power_w=power,
             expected_soc=round(soc_val, 4),
-            import_rate_cents=inputs.import_rate_cents[t],
-            export_rate_cents=inputs.export_rate_cents[t],
-            solar_forecast_w=inputs.solar_forecast_w[t],
-            load_forecast_w=inputs.load_forecast_w[t],
+            import_rate_cents=import_rates[t],
+            export_rate_cents=export_rates[t],
+            solar_forecast_w=solar_w[t],
+            load_forecast_w=load_w[t],
             constraint_flags=flags if flags else None,
             allow_charge_at_max_soc=force_charge_free_window,
         ))
 
-    objective_val = pulp.value(prob.objective) or 0.0
+    objective_val = prob.objective.value() or 0.0
 
     plan = OptimisationPlan(
         version=plan_version,
@@ -653,6 +772,50 @@ def solve(
     return plan
 
 
+def warm_start_from_plan(
+    plan: OptimisationPlan,
+    slot_start_times: list[datetime],
+    current_soc: float,
+    offset: int | None = None,
+) -> list[bool] | None:
+    """Charging direction per new slot, read from the previous plan.
+
+    Each slot time is looked up in *plan*, so a horizon that has moved on
+    by a few slots picks up the matching tail of the old plan.  With
+    *offset* the plan is read positionally from that slot instead, for
+    plans reused on a horizon whose times differ.  Slots the old plan does
+    not cover repeat the last known direction.  Returns None when the
+    plans do not overlap at all.
+    """
+    if offset is None:
+        slots = [plan.get_slot_at(start) for start in slot_start_times]
+    else:
+        slots = plan.slots[offset:offset + len(slot_start_times)]
+    hint: list[bool] = []
+    prev_soc = current_soc
+    charging: bool | None = None
+    for j in range(len(slot_start_times)):
+        slot = slots[j] if j < len(slots) else None
+        if slot is not None:
+            charging = slot.expected_soc > prev_soc
+            prev_soc = slot.expected_soc
+        hint.append(bool(charging))
+    if charging is None:
+        return None
+    return hint
+
+
+def previous_soc_from_plan(
+    plan: OptimisationPlan, slot_start_times: list[datetime],
+) -> list[float | None]:
+    """Expected SOC the previous plan holds for each new slot time."""
+    soc: list[float | None] = []
+    for start in slot_start_times:
+        slot = plan.get_slot_at(start)
+        soc.append(slot.expected_soc if slot is not None else None)
+    return soc
+
+
 def _resolve_planner_timezone(config: AppConfig):
     """Resolve planner local timezone from config."""
     tz_name = getattr(config.load_profile, "timezone", "UTC")
@@ -660,7 +823,7 @@ def _resolve_planner_timezone(config: AppConfig):
 
 
 def _determine_mode(
-    charge_w: float, discharge_w: float, grid_export_w: float, grid_import_w: float, is_spike: bool,
+    charge_w: float, discharge_w: float, grid_export_w: float, grid_import_w: float,
 ) -> SlotMode:
     """Determine the operating mode from solver decision variables.
 
@@ -676,8 +839,6 @@ def _determine_mode(
     elif discharge_w > threshold and grid_export_w > threshold:
         # Arbitrage: actively exporting to grid for profit
         return SlotMode.FORCE_DISCHARGE
-    elif is_spike:
-        return SlotMode.SELF_USE
     else:
         # Self-use covers both idle and load-serving discharge
         return SlotMode.SELF_USE
@@ -686,27 +847,26 @@ def _determine_mode(
 def _determine_target_power(
     mode: SlotMode,
     discharge_w: float,
-    config: AppConfig,
-    inputs: SolverInputs,
-    slot_index: int,
+    force_charge_w: int,
 ) -> int:
     """Map solver flows to inverter command power for the selected mode."""
     if mode == SlotMode.FORCE_CHARGE:
-        return _force_charge_target_power(config, inputs, slot_index)
-    if mode == SlotMode.FORCE_DISCHARGE:
-        return max(0, int(discharge_w))
+        return force_charge_w
+    # FORCE_DISCHARGE and SELF_USE both command the planned discharge
     return max(0, int(discharge_w))
 
 
-def _force_charge_target_power(config: AppConfig, inputs: SolverInputs, slot_index: int) -> int:
-    """Use full force-charge power unless total grid import is capped."""
+def _force_charge_target_powers(config: AppConfig, inputs: SolverInputs) -> list[int]:
+    """Force-charge power per slot: full power unless total grid import is capped."""
     full_power = max(0, int(config.battery.max_charge_rate_w))
     import_cap = int(config.battery.max_grid_import_w)
     if import_cap <= 0:
-        return full_power
-
-    load_w = max(0.0, float(inputs.load_forecast_w[slot_index]))
-    solar_w = max(0.0, float(inputs.solar_forecast_w[slot_index]))
-    base_grid_import_w = max(0.0, load_w - solar_w)
-    headroom_w = max(0.0, float(import_cap) - base_grid_import_w)
-    return min(full_power, int(headroom_w))
+        return [full_power] * inputs.n_slots
+
+    cap_w = float(import_cap)
+    powers = []
+    for load_w, solar_w in zip(inputs.load_forecast_w, inputs.solar_forecast_w):
+        base_grid_import_w = max(0.0, max(0.0, float(load_w)) - max(0.0, float(solar_w)))
+        headroom_w = max(0.0, cap_w - base_grid_import_w)
+        powers.append(min(full_power, int(headroom_w)))
+    return powers
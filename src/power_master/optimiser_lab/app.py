@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -17,6 +18,19 @@ TEMPLATES_DIR = Path(__file__).parent.parent / "dashboard" / "templates"
 STATIC_DIR = Path(__file__).parent.parent / "dashboard" / "static"
 
 
+@functools.lru_cache(maxsize=1)
+def _templates() -> Jinja2Templates:
+    """Template loader shared by every lab app in the process."""
+    return Jinja2Templates(directory=str(TEMPLATES_DIR))
+
+
+@functools.lru_cache(maxsize=1)
+def _static_files() -> StaticFiles:
+    """Static file app shared by every lab app in the process."""
+    STATIC_DIR.mkdir(parents=True, exist_ok=True)
+    return StaticFiles(directory=str(STATIC_DIR))
+
+
 def create_lab_app(
     config: AppConfig,
     repo: Repository,
@@ -31,11 +45,8 @@ def create_lab_app(
     app.state.repo = repo
     app.state.config_manager = config_manager
 
-    templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
-    app.state.templates = templates
-
-    STATIC_DIR.mkdir(parents=True, exist_ok=True)
-    app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+    app.state.templates = _templates()
+    app.mount("/static", _static_files(), name="static")
 
     from power_master.dashboard.routes.optimiser_lab import router as optimiser_lab_router
 
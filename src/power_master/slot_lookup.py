@@ -0,0 +1,72 @@
+"""Bulk time → slot lookup for forecast and tariff slot lists."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from typing import Protocol, TypeVar
+
+
+class _Slot(Protocol):
+    start: datetime
+    end: datetime
+
+
+S = TypeVar("S", bound=_Slot)
+
+
+def slot_epoch(dt: datetime) -> float:
+    """Epoch seconds for *dt*, treating naive datetimes as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def match_slots(
+    slots: Sequence[S],
+    times: Sequence[datetime],
+    epochs: Sequence[float] | None = None,
+) -> list[S | None]:
+    """Return the slot covering each time (``start <= t < end``), or None.
+
+    Equivalent to a first-match linear scan of *slots* per time, but the
+    slots are sorted once and each time is located by bisection, so the
+    cost is O((n + m) log m) instead of O(n * m).  If slots overlap the
+    linear scan is used so first-match-in-list semantics are preserved.
+
+    *epochs*, when given, are the precomputed ``slot_epoch`` values of
+    *times* so callers matching one horizon against several slot lists
+    convert it only once.
+    """
+    if not slots:
+        return [None] * len(times)
+
+    query = list(epochs) if epochs is not None else [slot_epoch(t) for t in times]
+    bounds = sorted(
+        (slot_epoch(s.start), slot_epoch(s.end), k) for k, s in enumerate(slots)
+    )
+
+    max_end = float("-inf")
+    for start, end, _ in bounds:
+        if start < max_end:
+            return _match_linear(slots, query)
+        max_end = max(max_end, end)
+
+    starts = [b[0] for b in bounds]
+    result: list[S | None] = []
+    for ts in query:
+        j = bisect_right(starts, ts) - 1
+        if j >= 0 and ts < bounds[j][1]:
+            result.append(slots[bounds[j][2]])
+        else:
+            result.append(None)
+    return result
+
+
+def _match_linear(slots: Sequence[S], query: list[float]) -> list[S | None]:
+    spans = [(slot_epoch(s.start), slot_epoch(s.end), s) for s in slots]
+    result: list[S | None] = []
+    for ts in query:
+        result.append(next((s for start, end, s in spans if start <= ts < end), None))
+    return result
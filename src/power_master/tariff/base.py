@@ -51,6 +51,14 @@ class TariffSchedule:
                 return slot
         return None
 
+    def get_slots_at(
+        self, times: list[datetime], epochs: list[float] | None = None,
+    ) -> list[TariffSlot | None]:
+        """Bulk get_slot_at: the slot covering each time, in one sorted pass."""
+        from power_master.slot_lookup import match_slots
+
+        return match_slots(self.slots, times, epochs)
+
     def get_current_import_price(self) -> float | None:
         """Get the current import price in cents/kWh."""
         slot = self.get_slot_at(datetime.now(timezone.utc))
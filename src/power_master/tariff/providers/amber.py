@@ -22,14 +22,15 @@ BASE_URL = "https://api.amber.com.au/v1"
 class AmberProvider(TariffProvider):
     """Amber Electric API tariff provider."""
 
-    def __init__(self, config: TariffProviderConfig) -> None:
+    def __init__(
+        self, config: TariffProviderConfig, client: httpx.AsyncClient | None = None,
+    ) -> None:
         self._config = config
         self._resolved_site_id: str | None = None
-        self._client = httpx.AsyncClient(
-            base_url=BASE_URL,
-            headers={"Authorization": f"Bearer {config.api_key}"},
-            timeout=30.0,
-        )
+        # Auth is sent per request so a shared client never carries the key
+        self._headers = {"Authorization": f"Bearer {config.api_key}"}
+        self._client = client or httpx.AsyncClient(timeout=30.0)
+        self._owns_client = client is None
 
     async def _resolve_site_id(self) -> str:
         """Return configured site_id, or auto-discover from account."""
@@ -58,7 +59,8 @@ class AmberProvider(TariffProvider):
 
         # Fetch current + 48h forecast (96 x 30-min intervals)
         resp = await self._client.get(
-            f"/sites/{site_id}/prices/current",
+            f"{BASE_URL}/sites/{site_id}/prices/current",
+            headers=self._headers,
             params={"resolution": 30, "next": 144, "previous": 144},
         )
         resp.raise_for_status()
@@ -90,7 +92,8 @@ class AmberProvider(TariffProvider):
 
         # Amber API accepts date range
         resp = await self._client.get(
-            f"/sites/{site_id}/prices",
+            f"{BASE_URL}/sites/{site_id}/prices",
+            headers=self._headers,
             params={
                 "startDate": start.strftime("%Y-%m-%d"),
                 "endDate": end.strftime("%Y-%m-%d"),
@@ -116,7 +119,7 @@ class AmberProvider(TariffProvider):
 
     async def get_site_id(self) -> str | None:
         """Auto-discover the site ID from Amber account."""
-        resp = await self._client.get("/sites")
+        resp = await self._client.get(f"{BASE_URL}/sites", headers=self._headers)
         resp.raise_for_status()
         sites = resp.json()
         if sites:
@@ -125,13 +128,14 @@ class AmberProvider(TariffProvider):
 
     async def is_healthy(self) -> bool:
         try:
-            resp = await self._client.get("/sites")
+            resp = await self._client.get(f"{BASE_URL}/sites", headers=self._headers)
             return resp.status_code == 200
         except Exception:
             return False
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     @staticmethod
     def _parse_prices(data: list[dict]) -> list[TariffSlot]:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from datetime import datetime, timedelta, timezone, tzinfo
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
@@ -12,6 +13,7 @@ _FIXED_FALLBACKS: dict[str, tzinfo] = {
 }
 
 
+@functools.lru_cache(maxsize=32)
 def resolve_timezone(tz_name: str) -> tzinfo:
     """Resolve an IANA timezone name with safe fallbacks.
 
@@ -20,6 +22,9 @@ def resolve_timezone(tz_name: str) -> tzinfo:
     2. Known fixed-offset fallback map.
     3. Host local timezone.
     4. UTC.
+
+    Results are memoised: ZoneInfo caches found zones itself, but a name
+    missing from tzdata would otherwise be searched for on every call.
     """
     try:
         return ZoneInfo(tz_name)
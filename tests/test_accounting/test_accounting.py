@@ -8,6 +8,7 @@ import pytest
 
 from power_master.accounting.billing_cycle import BillingCycleManager
 from power_master.accounting.cost_basis import CostBasisTracker
+from power_master.accounting.energy_flows import TickEnergy, split_tick_energy
 from power_master.accounting.engine import AccountingEngine
 from power_master.accounting.events import (
     create_export_event,
@@ -310,3 +311,77 @@ class TestAccountingEngine:
 
         engine = AccountingEngine(amber_config)
         assert engine.get_tou_supply_charge_cents() == 0.0
+
+
+# ── Per-tick Energy Flow Split ───────────────────────────────
+
+
+class TestSplitTickEnergy:
+    TICK_HOURS = 300 / 3600.0  # 5-minute tick
+
+    def test_import_with_grid_charge(self) -> None:
+        flows = split_tick_energy(4000, 0, 3000, 1000, self.TICK_HOURS)
+        assert flows == TickEnergy(grid_import_wh=333, grid_charge_wh=250)
+
+    def test_grid_charge_capped_by_import(self) -> None:
+        flows = split_tick_energy(1200, 0, 3000, 0, self.TICK_HOURS)
+        assert flows.grid_charge_wh == 100
+
+    def test_export_with_solar_charge_and_self_consumption(self) -> None:
+        flows = split_tick_energy(-2400, 5000, 1200, 1400, self.TICK_HOURS)
+        assert flows == TickEnergy(
+            grid_export_wh=200, solar_charge_wh=100, self_consumption_wh=117,
+        )
+
+    def test_battery_discharge_counts_toward_self_consumption(self) -> None:
+        flows = split_tick_energy(0, 0, -2000, 1500, self.TICK_HOURS)
+        assert flows == TickEnergy(self_consumption_wh=125)
+
+    def test_idle_tick_is_empty(self) -> None:
+        assert split_tick_energy(0, 0, 0, 0, self.TICK_HOURS) == TickEnergy()
+
+
+# ── Batched Persistence ──────────────────────────────────────
+
+
+@pytest.mark.asyncio
+class TestBatchedPersistence:
+    async def test_records_are_staged_until_flushed(self, repo) -> None:
+        engine = AccountingEngine(AppConfig())
+        await engine.init_persistence(repo, batched=True)
+
+        await engine.record_grid_import(1000, 30.0)
+        await engine.record_grid_export(500, 10.0)
+        assert await repo.get_accounting_events_since("1970-01-01") == []
+
+        events, kv = engine.drain_staged()
+        assert [e["event_type"] for e in events] == ["grid_import", "grid_export"]
+        assert "billing_cycle_state" in kv
+
+        await repo.store_write_batch(accounting_events=events, kv_items=kv)
+        stored = await repo.get_accounting_events_since("1970-01-01")
+        assert sorted(r["event_type"] for r in stored) == ["grid_export", "grid_import"]
+        billing = await repo.kv_get("billing_cycle_state")
+        assert billing["total_import_cost_cents"] == 30
+        assert engine.drain_staged() == ([], {})
+
+    async def test_restore_keeps_newer_kv_state(self, repo) -> None:
+        engine = AccountingEngine(AppConfig())
+        await engine.init_persistence(repo, batched=True)
+
+        await engine.record_grid_import(1000, 30.0)
+        events, kv = engine.drain_staged()
+        await engine.record_grid_import(1000, 30.0)
+        engine.restore_staged(events, kv)
+
+        pending, pending_kv = engine.drain_staged()
+        assert len(pending) == 2
+        assert pending_kv["billing_cycle_state"]["total_import_cost_cents"] == 60
+
+    async def test_unbatched_engine_persists_immediately(self, repo) -> None:
+        engine = AccountingEngine(AppConfig())
+        await engine.init_persistence(repo)
+
+        await engine.record_self_consumption(2000, 25.0)
+        stored = await repo.get_accounting_events_since("1970-01-01")
+        assert [r["event_type"] for r in stored] == ["self_consumption"]
@@ -30,6 +30,12 @@ async def lab_client(repo, lab_config_manager):
 
 
 class TestOptimiserLabStandalone:
+    def test_apps_share_template_loader(self, repo, lab_config_manager) -> None:
+        first = create_lab_app(lab_config_manager.config, repo, config_manager=lab_config_manager)
+        second = create_lab_app(lab_config_manager.config, repo, config_manager=lab_config_manager)
+
+        assert first.state.templates is second.state.templates
+
     @pytest.mark.asyncio
     async def test_page_loads(self, lab_client) -> None:
         resp = await lab_client.get("/optimiser-lab")
@@ -25,6 +25,28 @@ class TestRepository:
         assert latest["battery_power_w"] == -2500
         assert latest["solar_power_w"] == 4200
 
+    async def test_store_telemetry_row_positional(self, repo: Repository) -> None:
+        row_id = await repo.store_telemetry_row(
+            (0.55, 1200, 3000, -400, 1400, 52.1, 24.5, "self_use", False, {"k": 1}),
+        )
+        assert row_id > 0
+
+        latest = await repo.get_latest_telemetry()
+        assert latest["soc"] == 0.55
+        assert latest["grid_power_w"] == -400
+        assert latest["inverter_mode"] == "self_use"
+        assert latest["grid_available"] == 0
+        assert latest["raw_data_json"] == '{"k": 1}'
+
+    async def test_store_telemetry_rows_batch(self, repo: Repository) -> None:
+        await repo.store_telemetry_rows([
+            (0.40, 0, 0, 500, 500, None, None, None, True, None),
+            (0.41, 100, 0, 600, 500, None, None, None, True, None),
+        ])
+        rows = await repo.get_telemetry_since("1970-01-01T00:00:00")
+        assert [r["soc"] for r in rows] == [0.40, 0.41]
+        assert all(r["raw_data_json"] is None for r in rows)
+
     async def test_store_and_get_plan(self, repo: Repository) -> None:
         version = await repo.get_next_plan_version()
         assert version == 1
@@ -46,6 +68,40 @@ class TestRepository:
         assert active["version"] == 1
         assert active["trigger_reason"] == "startup"
 
+    async def test_store_plan_with_slots(self, repo: Repository) -> None:
+        slots = [
+            {
+                "slot_index": i,
+                "slot_start": f"2026-02-23T0{i}:00:00+00:00",
+                "slot_end": f"2026-02-23T0{i}:30:00+00:00",
+                "operating_mode": 1,
+                "target_power_w": 0,
+                "expected_soc": 0.5,
+                "import_rate_cents": 20.0,
+                "export_rate_cents": 5.0,
+                "solar_forecast_w": 0.0,
+                "load_forecast_w": 400.0,
+                "scheduled_loads": None,
+                "constraint_flags": ["spike"] if i == 1 else None,
+            }
+            for i in range(3)
+        ]
+        plan_id = await repo.store_plan(
+            version=1,
+            trigger_reason="startup",
+            horizon_start="2026-02-23T00:00:00Z",
+            horizon_end="2026-02-25T00:00:00Z",
+            objective_score=1.0,
+            solver_time_ms=10,
+            metrics={},
+            active_constraints=[],
+            slots=slots,
+        )
+
+        stored = await repo.get_plan_slots(plan_id)
+        assert [r["slot_index"] for r in stored] == [0, 1, 2]
+        assert [r["constraint_flags"] for r in stored] == [None, '["spike"]', None]
+
     async def test_log_command_audit(self, repo: Repository) -> None:
         """Test that command audit logging works with proper kwargs."""
         row_id = await repo.log_command_audit(
@@ -165,6 +221,21 @@ class TestRepository:
         )
         assert len(data) == 2
 
+    async def test_get_historical_values(self, repo: Repository) -> None:
+        await repo.store_historical("load", 1600.0, "t", "2025-01-01T00:30:00+00:00")
+        await repo.store_historical("load", 1500.0, "t", "2025-01-01T00:00:00+00:00")
+        await repo.store_historical("solar", 200.0, "t", "2025-01-01T00:00:00+00:00")
+        await repo.store_historical("other", 1.0, "t", "2025-01-01T00:00:00+00:00")
+
+        data = await repo.get_historical_values(
+            ["load", "solar", "missing"], "2025-01-01T00:00:00+00:00", "2025-01-02T00:00:00+00:00",
+        )
+        assert data == {
+            "load": [("2025-01-01T00:00:00+00:00", 1500.0), ("2025-01-01T00:30:00+00:00", 1600.0)],
+            "solar": [("2025-01-01T00:00:00+00:00", 200.0)],
+            "missing": [],
+        }
+
     async def test_spike_events(self, repo: Repository) -> None:
         spike_id = await repo.store_spike_event(
             peak_price_cents=350,
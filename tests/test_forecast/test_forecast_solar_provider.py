@@ -48,7 +48,7 @@ async def test_forecast_solar_request_and_parsing() -> None:
 
     assert (
         captured["path"]
-        == "/estimate/-33.856784/151.215297/20.0/180.0/8.5"
+        == "https://api.forecast.solar/estimate/-33.856784/151.215297/20.0/180.0/8.5"
     )
     assert forecast.provider == "forecast_solar"
     assert len(forecast.slots) == 2
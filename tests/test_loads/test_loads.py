@@ -894,3 +894,42 @@ class TestLoadScheduler:
 
         result = schedule_loads(plan, loads, actual_runtime_minutes={})
         assert len(result) == 1, "Empty runtime dict must not block scheduling"
+
+    def test_loads_sharing_timezone_use_local_windows(self) -> None:
+        # 02:00 UTC start = 12:00 Brisbane; 16 slots span Brisbane 12:00–20:00
+        plan = _make_plan(n_slots=16)
+        loads = [
+            {
+                "id": load_id, "name": load_id, "power_w": 500, "priority_class": 5,
+                "min_runtime_minutes": 60, "prefer_solar": False,
+                "timezone": "Australia/Brisbane",
+                "earliest_start": "17:00", "latest_end": "19:00",
+            }
+            for load_id in ("pump", "heater")
+        ]
+
+        result = schedule_loads(plan, loads)
+        assert [s.load_id for s in result] == ["pump", "heater"]
+        for scheduled in result:
+            # Brisbane 17:00–19:00 = slots 10..13
+            assert all(10 <= idx < 14 for idx in scheduled.assigned_slots)
+
+
+class TestAssignConsecutive:
+    def test_best_run_skips_gaps(self) -> None:
+        from power_master.optimisation.load_scheduler import _assign_consecutive
+
+        # 3 is missing, so the cheap 2 and 4 never share a run; 4..6 wins
+        scores = {0: 9.0, 1: 9.0, 2: 1.0, 4: 1.0, 5: 2.0, 6: 2.0, 7: 2.0}
+        assert _assign_consecutive(sorted(scores), scores, 3) == [4, 5, 6]
+
+    def test_ties_keep_earliest_run(self) -> None:
+        from power_master.optimisation.load_scheduler import _assign_consecutive
+
+        scores = {i: 23.45 for i in range(12)}
+        assert _assign_consecutive(sorted(scores), scores, 2) == [0, 1]
+
+    def test_no_run_long_enough(self) -> None:
+        from power_master.optimisation.load_scheduler import _assign_consecutive
+
+        assert _assign_consecutive([0, 2, 4], {0: 1.0, 2: 1.0, 4: 1.0}, 2) == []
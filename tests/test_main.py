@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-from pathlib import Path
 from datetime import datetime, timezone
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -45,6 +45,22 @@ class TestApplicationConstruction:
         assert app._control_loop is None
         assert app._providers == []
 
+    def test_event_loop_selection(self) -> None:
+        from power_master.main import _new_event_loop
+
+        loop = _new_event_loop(use_uvloop=False)
+        try:
+            assert type(loop).__module__.startswith("asyncio")
+        finally:
+            loop.close()
+
+        uvloop = pytest.importorskip("uvloop")
+        loop = _new_event_loop(use_uvloop=True)
+        try:
+            assert isinstance(loop, uvloop.Loop)
+        finally:
+            loop.close()
+
 
 class TestProviderCreation:
     def test_creates_weather_provider_always(self, config, config_manager) -> None:
@@ -97,11 +113,12 @@ class TestProviderCreation:
     def test_creates_tou_tariff_provider_when_type_is_tou(self, config_manager) -> None:
         """Test that type='tou' with valid plan config creates StaticTariffProvider."""
         from datetime import date
+
         from power_master.config.schema import (
-            TariffPlanConfig,
-            TariffVersion,
             BandBase,
             BillingCycleConfig,
+            TariffPlanConfig,
+            TariffVersion,
             VPPConfig,
         )
 
@@ -199,6 +216,25 @@ class TestProviderCreation:
         solar, weather, storm, tariff = app._create_providers()
         assert storm is None
 
+    @pytest.mark.asyncio
+    async def test_providers_share_one_http_client(self, config_manager) -> None:
+        config = AppConfig(
+            storm={"enabled": True},
+            providers={
+                "storm": {"location_aac": "QLD_PT001"},
+                "tariff": {"api_key": "test-key", "site_id": "test-site"},
+            },
+        )
+        app = Application(config, config_manager)
+        providers = app._create_providers()
+
+        assert all(p._client is app._http for p in providers)
+        # Providers must not close the shared client out from under each other
+        for provider in providers:
+            await provider.close()
+        assert not app._http.is_closed
+        await app._http.aclose()
+
 
 class TestLoadRegistration:
     def test_register_shelly_loads(self, config_manager) -> None:
@@ -324,6 +360,256 @@ class TestSolverInputBuilding:
 
         await db.close()
 
+    @pytest.mark.asyncio
+    async def test_solver_runs_on_dedicated_thread(self, config, config_manager, tmp_path) -> None:
+        import threading
+        from datetime import timedelta
+
+        from power_master.accounting.engine import AccountingEngine
+        from power_master.control.loop import ControlLoop
+        from power_master.db.engine import init_db
+        from power_master.db.repository import Repository
+        from power_master.forecast.aggregator import ForecastAggregator
+        from power_master.optimisation import solver as solver_module
+        from power_master.optimisation.rebuild_evaluator import RebuildEvaluator
+        from power_master.storm.monitor import StormMonitor
+        from power_master.tariff.base import TariffSchedule, TariffSlot
+
+        now = datetime.now(timezone.utc)
+        aggregator = ForecastAggregator()
+        aggregator._state.tariff = TariffSchedule(slots=[
+            TariffSlot(
+                start=now, end=now + timedelta(hours=48),
+                import_price_cents=15.0, export_price_cents=5.0,
+            ),
+        ])
+        threads: list[str] = []
+        real_solve = solver_module.solve
+
+        def recording_solve(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return real_solve(*args, **kwargs)
+
+        db = await init_db(tmp_path / "solver_thread.db")
+        app = Application(config, config_manager)
+        try:
+            with patch("power_master.main.solve", recording_solve):
+                await app._run_solver(
+                    aggregator, StormMonitor(config.storm), AccountingEngine(config),
+                    RebuildEvaluator(config), ControlLoop(config=config, adapter=AsyncMock()),
+                    Repository(db), trigger="test",
+                )
+        finally:
+            await db.close()
+
+        assert len(threads) == 1
+        assert threads[0].startswith("solver")
+
+    @pytest.mark.asyncio
+    async def test_restore_plan_skips_initial_solve(self, config, config_manager, tmp_path) -> None:
+        """A recent plan built from the same config is reused at startup."""
+        from datetime import datetime, timedelta, timezone
+
+        from power_master.accounting.engine import AccountingEngine
+        from power_master.control.loop import ControlLoop
+        from power_master.db.engine import init_db
+        from power_master.db.repository import Repository
+        from power_master.forecast.aggregator import ForecastAggregator
+        from power_master.optimisation.rebuild_evaluator import RebuildEvaluator
+        from power_master.storm.monitor import StormMonitor
+        from power_master.tariff.base import TariffSchedule, TariffSlot
+
+        db = await init_db(tmp_path / "restore_test.db")
+        repo = Repository(db)
+
+        now = datetime.now(timezone.utc)
+        aggregator = ForecastAggregator()
+        aggregator._state.tariff = TariffSchedule(slots=[
+            TariffSlot(
+                start=now + timedelta(minutes=i * 30),
+                end=now + timedelta(minutes=(i + 1) * 30),
+                import_price_cents=15.0,
+                export_price_cents=5.0,
+            )
+            for i in range(96)
+        ])
+
+        app = Application(config, config_manager)
+        plan = await app._run_solver(
+            aggregator, StormMonitor(config.storm), AccountingEngine(config),
+            RebuildEvaluator(config), ControlLoop(config=config, adapter=AsyncMock()),
+            repo, trigger="test",
+        )
+
+        # Fresh process, same config → persisted plan is installed
+        control_loop = ControlLoop(config=config, adapter=AsyncMock())
+        app = Application(config, config_manager)
+        assert await app._restore_plan(repo, control_loop, RebuildEvaluator(config)) is True
+        restored = control_loop.state.current_plan
+        assert restored.version == plan.version
+        assert [s.mode for s in restored.slots] == [s.mode for s in plan.slots]
+
+        # Changed config → re-solve required
+        changed = config.model_copy(deep=True)
+        changed.battery.capacity_wh += 1000
+        control_loop = ControlLoop(config=changed, adapter=AsyncMock())
+        app = Application(changed, config_manager)
+        assert await app._restore_plan(repo, control_loop, RebuildEvaluator(changed)) is False
+        assert control_loop.state.current_plan is None
+
+        await db.close()
+
+
+def _polling_app(config, config_manager) -> tuple[Application, AsyncMock]:
+    """Application whose inverter adapter is connected and returns a fixed reading."""
+    from power_master.hardware.telemetry import Telemetry
+
+    app = Application(config, config_manager)
+    adapter = AsyncMock()
+    adapter.is_connected.return_value = True
+    adapter.get_telemetry.return_value = Telemetry(
+        soc=0.5, battery_power_w=0, solar_power_w=0, grid_power_w=0, load_power_w=0,
+    )
+    app._adapter = adapter
+    return app, adapter
+
+
+class TestTelemetryPollStore:
+    @pytest.mark.asyncio
+    async def test_slow_store_is_not_stacked(self, config, config_manager) -> None:
+        app, adapter = _polling_app(config, config_manager)
+
+        release = asyncio.Event()
+        repo = MagicMock()
+
+        async def slow_store(row) -> None:
+            await release.wait()
+
+        repo.store_telemetry_row = AsyncMock(side_effect=slow_store)
+        polls = 0
+
+        async def fast_sleep(seconds, wake=()) -> bool:
+            nonlocal polls
+            polls += 1
+            await asyncio.sleep(0)
+            if polls == 5:
+                release.set()
+            return polls >= 5
+
+        app._sleep_or_stop = fast_sleep
+        with patch("power_master.main.DB_STORE_INTERVAL_SECONDS", 0):
+            await asyncio.wait_for(
+                app._telemetry_poll_loop(adapter, MagicMock(), repo=repo), timeout=2,
+            )
+
+        # Polling kept going while the first write was blocked, and no
+        # further writes were queued behind it
+        assert adapter.get_telemetry.await_count == 5
+        assert repo.store_telemetry_row.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_poller_waits_for_store(self, config, config_manager) -> None:
+        app, adapter = _polling_app(config, config_manager)
+
+        release = asyncio.Event()
+        stored = asyncio.Event()
+        repo = MagicMock()
+
+        async def slow_store(row) -> None:
+            await release.wait()
+            stored.set()
+
+        repo.store_telemetry_row = AsyncMock(side_effect=slow_store)
+
+        async def idle_sleep(seconds, wake=()) -> bool:
+            await asyncio.sleep(3600)
+            return True
+
+        app._sleep_or_stop = idle_sleep
+        poller = asyncio.create_task(
+            app._telemetry_poll_loop(adapter, MagicMock(), repo=repo),
+        )
+        while repo.store_telemetry_row.await_count == 0:
+            await asyncio.sleep(0)
+
+        poller.cancel()
+        await asyncio.sleep(0)
+        assert not poller.done()  # Held open by the in-flight write
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(poller, timeout=2)
+        assert stored.is_set()
+
+
+class TestBackgroundLoopFailures:
+    @pytest.mark.asyncio
+    async def test_history_flush_failure_keeps_loop_running(self, config, config_manager) -> None:
+        app = Application(config, config_manager)
+        history = MagicMock()
+        history.flush_telemetry = AsyncMock(side_effect=[RuntimeError("database is locked"), None])
+        sleeps = 0
+
+        async def fast_sleep(seconds, wake=()) -> bool:
+            nonlocal sleeps
+            sleeps += 1
+            await asyncio.sleep(0)
+            return sleeps > 2
+
+        app._sleep_or_stop = fast_sleep
+        with patch("power_master.main.checkpoint_wal", AsyncMock()) as checkpoint:
+            await asyncio.wait_for(app._history_flush_loop(history), timeout=2)
+
+        assert history.flush_telemetry.await_count == 2
+        assert checkpoint.await_count == 1
+
+
+class TestTariffGapFill:
+    def test_nearest_matched_equals_outward_scan(self) -> None:
+        import random
+
+        from power_master.main import _nearest_matched
+
+        def outward_scan(matched):
+            n = len(matched)
+            result = []
+            for i in range(n):
+                if matched[i]:
+                    result.append(i)
+                    continue
+                nearest = None
+                for offset in range(1, n):
+                    if i - offset >= 0 and matched[i - offset]:
+                        nearest = i - offset
+                        break
+                    if i + offset < n and matched[i + offset]:
+                        nearest = i + offset
+                        break
+                result.append(nearest)
+            return result
+
+        rng = random.Random(7)
+        cases = [[], [False] * 5, [True] * 5, [False, True, False, False, True, False]]
+        cases += [[rng.random() < 0.2 for _ in range(48)] for _ in range(50)]
+        for matched in cases:
+            assert _nearest_matched(matched) == outward_scan(matched)
+
+
+class TestSlotGrid:
+    def test_shifted_grid_matches_fresh_build(self, config, config_manager) -> None:
+        from datetime import timedelta
+
+        app = Application(config, config_manager)
+        start = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+        first, _ = app._slot_grid(start, 30, 96)
+
+        for later in (start, start + timedelta(hours=2), start + timedelta(days=3)):
+            times, epochs = app._slot_grid(later, 30, 96)
+            assert times == [later + timedelta(minutes=30 * i) for i in range(96)]
+            assert epochs == [t.timestamp() for t in times]
+        # Callers get copies, never the cached lists
+        first.clear()
+        assert len(app._slot_grid(start + timedelta(days=3), 30, 96)[0]) == 96
+
 
 class TestStopLifecycle:
     @pytest.mark.asyncio
@@ -349,6 +635,75 @@ class TestStopLifecycle:
         # After stop, the task should be done (cancelled or finished with CancelledError)
         assert task.done()
 
+    @pytest.mark.asyncio
+    async def test_stop_wakes_sleeping_loops(self, config, config_manager) -> None:
+        app = Application(config, config_manager)
+        assert await app._sleep_or_stop(0.01) is False
+
+        app._running = True
+        sleeper = asyncio.create_task(app._sleep_or_stop(3600))
+        await asyncio.sleep(0)
+
+        await app.stop()
+        # Stop event wakes the sleeper immediately rather than cancelling it
+        assert await asyncio.wait_for(sleeper, timeout=1) is True
+
+    @pytest.mark.asyncio
+    async def test_wake_event_ends_sleep_early(self, config, config_manager) -> None:
+        app = Application(config, config_manager)
+        wake = asyncio.Event()
+
+        sleeper = asyncio.create_task(app._sleep_or_stop(3600, wake=(wake,)))
+        await asyncio.sleep(0)
+        wake.set()
+        # Woken (not stopping) and the event is left for the loop to clear
+        assert await asyncio.wait_for(sleeper, timeout=1) is False
+        assert wake.is_set()
+
+
+class TestLoopLagMonitor:
+    @pytest.mark.asyncio
+    async def test_blocking_callback_is_reported(self, config, config_manager) -> None:
+        import time
+
+        app = Application(config, config_manager)
+        publisher = MagicMock()
+        publisher.publish_loop_lag = AsyncMock()
+
+        with patch("power_master.main.LOOP_LAG_PROBE_SECONDS", 0.01), \
+             patch("power_master.main.LOOP_LAG_REPORT_SECONDS", 0.05):
+            monitor = asyncio.create_task(app._loop_lag_monitor(publisher))
+            await asyncio.sleep(0)
+            time.sleep(0.1)  # hold the loop
+            await asyncio.sleep(0.1)
+            app._stop_event.set()
+            await asyncio.wait_for(monitor, timeout=1)
+
+        lag_ms = publisher.publish_loop_lag.await_args_list[0].args[0]
+        assert lag_ms >= 50
+
+
+class TestTickConfigSnapshot:
+    def test_snapshot_flattens_tick_values(self, config_manager) -> None:
+        config = AppConfig(
+            planning={"evaluation_interval_seconds": 60},
+            battery={"max_grid_import_w": 9000},
+        )
+        app = Application(config, config_manager)
+        assert app._tick_cfg.tick_hours == pytest.approx(60 / 3600)
+        assert app._tick_cfg.max_grid_import_w == 9000
+
+    @pytest.mark.asyncio
+    async def test_reload_config_refreshes_snapshot(self, config_manager) -> None:
+        from types import SimpleNamespace
+
+        app = Application(config_manager.load(), config_manager)
+        web_app = SimpleNamespace(state=SimpleNamespace())
+
+        await app.reload_config({"battery": {"max_grid_import_w": 4321}}, web_app)
+
+        assert app._tick_cfg.max_grid_import_w == 4321
+
 
 class TestLoadProfileTimezone:
     @pytest.mark.asyncio
@@ -385,3 +740,43 @@ class TestLoadProfileTimezone:
 
         # 14:00 UTC == 00:00 local (Australia/Brisbane) => 00-04 block.
         assert forecast == [111.0]
+
+    @pytest.mark.asyncio
+    async def test_load_predictor_cached_until_timezone_changes(
+        self, config, config_manager
+    ) -> None:
+        builds: list[str] = []
+
+        class CountingPredictor:
+            def __init__(self, repo, timezone_name: str = "UTC") -> None:
+                self._profile = None
+                self._timezone_name = timezone_name
+
+            async def rebuild_profile(self, lookback_days: int = 28) -> None:
+                builds.append(self._timezone_name)
+
+        app = Application(config, config_manager)
+        slot_start_times = [datetime(2025, 6, 15, 14, 0, tzinfo=timezone.utc)]
+
+        with patch("power_master.history.prediction.LoadPredictor", CountingPredictor):
+            for _ in range(3):
+                await app._build_load_forecast(MagicMock(), slot_start_times, 1)
+            assert builds == ["Australia/Brisbane"]
+
+            config.load_profile.timezone = "UTC"
+            await app._build_load_forecast(MagicMock(), slot_start_times, 1)
+            assert builds == ["Australia/Brisbane", "UTC"]
+
+    def test_local_weekday_hours_matches_astimezone(self) -> None:
+        from datetime import timedelta
+
+        from power_master.main import _local_weekday_hours
+        from power_master.timezone_utils import resolve_timezone
+
+        for tz_name in ("Australia/Brisbane", "Australia/Adelaide", "Australia/Sydney"):
+            tz = resolve_timezone(tz_name)
+            # 2025-04-05 16:00 UTC is the Sydney/Adelaide DST end
+            start = datetime(2025, 4, 4, 10, 30, tzinfo=timezone.utc)
+            times = [start + timedelta(minutes=30 * i) for i in range(96)]
+            expected = [(t.astimezone(tz).weekday(), t.astimezone(tz).hour) for t in times]
+            assert _local_weekday_hours(times, tz) == expected
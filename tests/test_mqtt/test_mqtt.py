@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 from unittest.mock import AsyncMock
 
 import pytest
 
+from power_master.config.schema import MQTTConfig
 from power_master.hardware.telemetry import Telemetry
+from power_master.mqtt.client import MQTTClient
 from power_master.mqtt.discovery import build_discovery_configs, publish_discovery
 from power_master.mqtt.publisher import MQTTPublisher
 from power_master.mqtt.subscriber import LoadCommandSubscriber
@@ -29,6 +33,12 @@ class TestTopics:
         assert topics["battery_soc"] == "solar_system/battery/soc"
         assert topics["grid_power"] == "solar_system/grid/power"
 
+    def test_topics_cached_and_read_only(self) -> None:
+        topics = build_topics("cached")
+        assert build_topics("cached") is topics
+        with pytest.raises(TypeError):
+            topics["status"] = "other"  # type: ignore[index]
+
     def test_load_command_topic(self) -> None:
         topic = load_command_topic("power_master", "pool_pump")
         assert topic == "power_master/load/pool_pump/command"
@@ -77,6 +87,148 @@ class TestPublisher:
         assert soc_call[0][0][1] == "72.0"
         assert soc_call[0][0][2] is True  # Retained
 
+    @pytest.mark.asyncio
+    async def test_publish_telemetry_skips_unchanged(self) -> None:
+        publish_fn = AsyncMock()
+        publisher = MQTTPublisher(publish_fn)
+
+        telemetry = Telemetry(
+            soc=0.72, battery_power_w=-1500, solar_power_w=4200,
+            grid_power_w=-1100, load_power_w=2500,
+        )
+        await publisher.publish_telemetry(telemetry)
+        publish_fn.reset_mock()
+
+        # Identical reading → nothing re-sent
+        await publisher.publish_telemetry(telemetry)
+        assert publish_fn.call_count == 0
+
+        # Only the changed value goes out
+        telemetry.solar_power_w = 4300
+        await publisher.publish_telemetry(telemetry)
+        assert publish_fn.call_count == 1
+        assert publish_fn.call_args[0][1] == "4300"
+
+        # After a cache reset everything is re-sent
+        publisher.reset_cache()
+        publish_fn.reset_mock()
+        await publisher.publish_telemetry(telemetry)
+        assert publish_fn.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_retained_state_skips_unchanged(self) -> None:
+        publish_fn = AsyncMock()
+        publisher = MQTTPublisher(publish_fn)
+
+        for _ in range(3):
+            await publisher.publish_storm(active=False)
+            await publisher.publish_spike(active=False)
+            await publisher.publish_wacb(12.34)
+            await publisher.publish_mode("self_use")
+            await publisher.publish_tariff(20.0, 5.0)
+        assert publish_fn.call_count == 6
+
+        await publisher.publish_tariff(20.0, 7.5)
+        assert publish_fn.call_count == 7
+        assert publish_fn.call_args[0][1:] == ("7.5", True)
+
+        # Status is always sent
+        await publisher.publish_status(online=True)
+        await publisher.publish_status(online=True)
+        assert publish_fn.call_count == 9
+
+    @pytest.mark.asyncio
+    async def test_flush_interval_coalesces_to_latest(self) -> None:
+        publish_fn = AsyncMock()
+        publish_many_fn = AsyncMock()
+        publisher = MQTTPublisher(
+            publish_fn, publish_many_fn=publish_many_fn, flush_interval=0.01,
+        )
+
+        for cents in (10.0, 11.0, 12.0):
+            await publisher.publish_wacb(cents)
+        await publisher.publish_storm(active=True)
+        await publisher.publish_status(online=True)
+
+        publish_fn.assert_not_called()
+        publish_many_fn.assert_not_called()
+
+        await asyncio.sleep(0.05)
+        publish_many_fn.assert_called_once()
+        assert sorted(publish_many_fn.call_args[0][0]) == [
+            ("power_master/battery/wacb", "12.0", True),
+            ("power_master/status", "online", True),
+            ("power_master/storm/active", "true", True),
+        ]
+        assert publisher._flusher.done()  # Idle flusher exits
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_pending_immediately(self) -> None:
+        publish_fn = AsyncMock()
+        publisher = MQTTPublisher(publish_fn, flush_interval=3600)
+
+        await publisher.publish_spike(active=True)
+        publish_fn.assert_not_called()
+
+        await publisher.flush()
+        publish_fn.assert_called_once_with("power_master/spike/active", "true", True)
+        assert publisher._flusher is None
+
+    @pytest.mark.asyncio
+    async def test_coalesced_value_reverted_before_flush_is_sent(self) -> None:
+        publish_fn = AsyncMock()
+        publisher = MQTTPublisher(publish_fn, flush_interval=3600)
+        await publisher.publish_storm(active=False)
+        await publisher.flush()
+
+        await publisher.publish_storm(active=True)
+        await publisher.publish_storm(active=False)  # Back to the sent value
+        await publisher.flush()
+
+        assert [c[0][1] for c in publish_fn.call_args_list] == ["false", "false"]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_not_recorded_as_sent(self) -> None:
+        publish_fn = AsyncMock(side_effect=[ConnectionError("broker went away"), None])
+        publisher = MQTTPublisher(publish_fn, flush_interval=0.01)
+
+        await publisher.publish_spike(active=True)
+        await asyncio.sleep(0.05)  # Flush fails and is logged
+        await publisher.publish_spike(active=True)
+        await publisher.flush()
+
+        assert publish_fn.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_sends_one_publish_many(self) -> None:
+        publish_fn = AsyncMock()
+        publish_many_fn = AsyncMock()
+        publisher = MQTTPublisher(publish_fn, publish_many_fn=publish_many_fn)
+
+        async with publisher.batch():
+            await publisher.publish_storm(active=True)
+            await publisher.publish_spike(active=False)
+            await publisher.publish_wacb(12.34)
+            publish_many_fn.assert_not_called()
+
+        publish_fn.assert_not_called()
+        publish_many_fn.assert_called_once()
+        messages = publish_many_fn.call_args[0][0]
+        assert [payload for _, payload, _ in messages] == ["true", "false", "12.3"]
+
+    @pytest.mark.asyncio
+    async def test_publish_telemetry_uses_publish_many(self) -> None:
+        publish_fn = AsyncMock()
+        publish_many_fn = AsyncMock()
+        publisher = MQTTPublisher(publish_fn, publish_many_fn=publish_many_fn)
+
+        await publisher.publish_telemetry(Telemetry(
+            soc=0.5, battery_power_w=0, solar_power_w=0,
+            grid_power_w=0, load_power_w=0,
+        ))
+        publish_fn.assert_not_called()
+        assert len(publish_many_fn.call_args[0][0]) == 5
+
     @pytest.mark.asyncio
     async def test_publish_status(self) -> None:
         publish_fn = AsyncMock()
@@ -124,13 +276,145 @@ class TestPublisher:
         assert publish_fn.call_args[0][1] == "false"
 
 
+# ── Client Tests ───────────────────────────────────────────────
+
+
+class _FakeBrokerClient:
+    """Stand-in for aiomqtt.Client counting connects and publishes."""
+
+    def __init__(self) -> None:
+        self.connects = 0
+        self.disconnects = 0
+        self.published: list[tuple[str, str, bool]] = []
+        self.subscribed: list[str] = []
+        self.fail_next = False
+        # Per-session inbound messages; an Exception entry drops the session
+        self.inbound: list[list[object]] = []
+
+    async def __aenter__(self) -> _FakeBrokerClient:
+        self.connects += 1
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.disconnects += 1
+
+    async def publish(self, topic: str, payload: str, retain: bool = False) -> None:
+        if self.fail_next:
+            self.fail_next = False
+            raise ConnectionError("broker went away")
+        self.published.append((topic, payload, retain))
+
+    async def subscribe(self, topic: str) -> None:
+        self.subscribed.append(topic)
+
+    @property
+    def messages(self):
+        return self._messages(self.inbound.pop(0) if self.inbound else [])
+
+    async def _messages(self, items: list[object]):
+        for item in items:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+def _client_with_fake() -> tuple[MQTTClient, _FakeBrokerClient]:
+    client = MQTTClient(MQTTConfig())
+    fake = _FakeBrokerClient()
+    client._client = fake
+    client._connected = True
+    return client, fake
+
+
+class TestClient:
+    @pytest.mark.asyncio
+    async def test_publishes_share_one_session(self) -> None:
+        client, fake = _client_with_fake()
+
+        await client.publish("a", "1")
+        await client.publish("b", "2", retain=True)
+        await client.publish_many([("c", "3", False), ("d", "4", True)])
+
+        assert fake.connects == 1
+        assert [t for t, _, _ in fake.published] == ["a", "b", "c", "d"]
+
+        await client.disconnect()
+        assert fake.disconnects == 1
+
+    @pytest.mark.asyncio
+    async def test_publish_many_failure_does_not_drop_other_messages(self) -> None:
+        client, fake = _client_with_fake()
+
+        fake.fail_next = True
+        await client.publish_many([("a", "1", False), ("b", "2", False), ("c", "3", False)])
+
+        # Only the failing publish is lost; the session is then re-opened
+        assert [t for t, _, _ in fake.published] == ["b", "c"]
+        assert fake.disconnects == 1
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_publish_failure(self) -> None:
+        client, fake = _client_with_fake()
+
+        await client.publish("a", "1")
+        fake.fail_next = True
+        await client.publish("b", "2")  # Fails, session dropped
+        await client.publish("c", "3")  # Re-opens the session
+
+        assert fake.connects == 2
+        assert fake.disconnects == 1
+        assert [t for t, _, _ in fake.published] == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_new_session_resets_publisher_cache(self) -> None:
+        client, fake = _client_with_fake()
+        publisher = MQTTPublisher(client.publish)
+        client.on_session_close(publisher.reset_cache)
+
+        await publisher.publish_storm(active=True)
+        fake.fail_next = True
+        await publisher.publish_storm(active=False)  # Lost with the session
+        await publisher.publish_storm(active=False)  # New session → re-sent
+
+        assert [p for _, p, _ in fake.published] == ["true", "false"]
+
+    @pytest.mark.asyncio
+    async def test_listener_resubscribes_after_session_drop(self, monkeypatch) -> None:
+        monkeypatch.setattr("power_master.mqtt.client._LISTEN_RETRY_SECONDS", 0)
+        client, fake = _client_with_fake()
+        received: list[str] = []
+
+        async def on_message(topic: str, payload: str) -> None:
+            received.append(payload)
+            await client.disconnect()
+
+        client.subscribe("cmd", on_message)
+        message = type("Msg", (), {"topic": "cmd", "payload": b"on"})()
+        fake.inbound = [[ConnectionError("broker went away")], [message]]
+
+        await asyncio.wait_for(client.listen(), timeout=1)
+
+        assert fake.connects == 2
+        assert fake.subscribed == ["cmd", "cmd"]
+        assert received == ["on"]
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_keeps_client_connected(self) -> None:
+        client, fake = _client_with_fake()
+
+        fake.fail_next = True
+        await client.publish("a", "1")
+
+        assert client.is_connected
+
+
 # ── Discovery Tests ────────────────────────────────────────────
 
 
 class TestDiscovery:
     def test_build_configs(self) -> None:
         configs = build_discovery_configs()
-        assert len(configs) == 12  # 12 entities defined
+        assert len(configs) == 13  # 13 entities defined
 
         # Check first config structure
         topic, payload = configs[0]
@@ -156,16 +440,33 @@ class TestDiscovery:
         assert device["identifiers"] == ["power_master"]
         assert device["name"] == "Power Master"
 
+    def test_configs_are_memoised(self) -> None:
+        first = build_discovery_configs("memo", "ha")
+        first.clear()  # Callers get their own list
+        second = build_discovery_configs("memo", "ha")
+        assert len(second) == 13
+        assert second == build_discovery_configs("memo", "ha")
+
     @pytest.mark.asyncio
     async def test_publish_discovery(self) -> None:
         publish_fn = AsyncMock()
         count = await publish_discovery(publish_fn)
-        assert count == 12
-        assert publish_fn.call_count == 12
+        assert count == 13
+        assert publish_fn.call_count == 13
         # All should be retained
         for call in publish_fn.call_args_list:
             assert call[0][2] is True
 
+    @pytest.mark.asyncio
+    async def test_publish_discovery_batched(self) -> None:
+        publish_fn = AsyncMock()
+        publish_many_fn = AsyncMock()
+        count = await publish_discovery(publish_fn, publish_many_fn=publish_many_fn)
+        assert count == 13
+        publish_fn.assert_not_called()
+        (messages,), _ = publish_many_fn.call_args
+        assert messages == [(t, p, True) for t, p in build_discovery_configs()]
+
 
 # ── Subscriber Tests ───────────────────────────────────────────
 
@@ -194,6 +495,23 @@ class TestSubscriber:
         # Should not raise
         await subscriber.handle_message("unknown/topic", "test")
 
+    @pytest.mark.asyncio
+    async def test_unhandled_topic_logged_once(self, caplog) -> None:
+        subscriber = LoadCommandSubscriber()
+        with caplog.at_level(logging.DEBUG, logger="power_master.mqtt.subscriber"):
+            for _ in range(3):
+                await subscriber.handle_message("unknown/topic", "test")
+        assert sum("Unhandled MQTT message" in r.message for r in caplog.records) == 1
+
+    @pytest.mark.asyncio
+    async def test_late_registration_clears_unhandled(self) -> None:
+        subscriber = LoadCommandSubscriber()
+        received = []
+        await subscriber.handle_message("power_master/load/pump/command", "ON")
+        subscriber.register_load("pump", lambda payload: received.append(payload))
+        await subscriber.handle_message("power_master/load/pump/command", "OFF")
+        assert received == ["OFF"]
+
     def test_multiple_loads(self) -> None:
         subscriber = LoadCommandSubscriber()
         subscriber.register_load("pump", lambda p: None)
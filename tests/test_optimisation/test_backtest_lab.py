@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from power_master.config.schema import AppConfig
-from power_master.optimisation.backtest_lab import run_backtest
+from power_master.optimisation.backtest_lab import _horizon_slice, run_backtest
 
 
 @pytest.mark.asyncio
@@ -56,3 +57,125 @@ async def test_backtest_aligns_30min_slots_with_second_offset(repo) -> None:
     row = result.slot_rows[0]
     assert row["load_kw"] > 0
     assert row["solar_kw"] > 0
+
+
+def test_horizon_slice_pads_with_last_value() -> None:
+    values = [1.0, 2.0, 3.0]
+    assert _horizon_slice(values, 0, 2) == [1.0, 2.0]
+    assert _horizon_slice(values, 1, 4) == [2.0, 3.0, 3.0, 3.0]
+    assert _horizon_slice(values, 5, 2) == [3.0, 3.0]
+    assert _horizon_slice([], 0, 2) == [0.0, 0.0]
+    # Caller's list is never aliased
+    _horizon_slice(values, 0, 3).append(9.0)
+    assert values == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_slow_solve_emits_heartbeats_and_completes(repo, monkeypatch) -> None:
+    import time
+
+    from power_master.optimisation import backtest_lab
+
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    await repo.store_historical("load_w", 1200.0, "test", start.isoformat())
+    await repo.store_historical("import_price_cents", 20.0, "test", start.isoformat())
+    await repo.store_historical("export_price_cents", 6.0, "test", start.isoformat())
+
+    real_solve = backtest_lab.solve
+
+    def slow_solve(*args, **kwargs):
+        time.sleep(0.05)
+        return real_solve(*args, **kwargs)
+
+    monkeypatch.setattr(backtest_lab, "solve", slow_solve)
+    monkeypatch.setattr(backtest_lab, "_MIN_HEARTBEAT_SECONDS", 0.01)
+    calls: list[int] = []
+
+    result = await run_backtest(
+        repo=repo,
+        config=AppConfig(),
+        start=start,
+        end=start + timedelta(minutes=1),
+        progress_callback=lambda done, total, ts: calls.append(done),
+        progress_heartbeat_seconds=0.01,
+    )
+
+    # The solve outlived a heartbeat without being cancelled
+    assert result.summary.slots == 1
+    assert len(calls) >= 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_backtest_does_not_leak_solve_task(repo, monkeypatch) -> None:
+    import threading
+
+    from power_master.optimisation import backtest_lab
+
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    await repo.store_historical("load_w", 1200.0, "test", start.isoformat())
+    await repo.store_historical("import_price_cents", 20.0, "test", start.isoformat())
+    await repo.store_historical("export_price_cents", 6.0, "test", start.isoformat())
+
+    started = threading.Event()
+    release = threading.Event()
+    real_solve = backtest_lab.solve
+
+    def blocked_solve(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return real_solve(*args, **kwargs)
+
+    monkeypatch.setattr(backtest_lab, "solve", blocked_solve)
+    monkeypatch.setattr(backtest_lab, "_MIN_HEARTBEAT_SECONDS", 0.01)
+
+    run = asyncio.create_task(run_backtest(
+        repo=repo,
+        config=AppConfig(),
+        start=start,
+        end=start + timedelta(minutes=1),
+        progress_heartbeat_seconds=0.01,
+    ))
+    while not started.is_set():
+        await asyncio.sleep(0.01)
+
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+    release.set()
+
+    leftover = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    assert leftover == []
+
+
+@pytest.mark.asyncio
+async def test_repeated_horizons_reuse_cached_plans(repo, monkeypatch) -> None:
+    from power_master.optimisation import backtest_lab
+
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    # Two identical days with an idle battery: day two repeats day one's horizons
+    for i in range(96):
+        ts = (start + timedelta(minutes=30 * i)).isoformat()
+        await repo.store_historical("load_w", 0.0, "test", ts)
+        await repo.store_historical("import_price_cents", 20.0, "test", ts)
+        await repo.store_historical("export_price_cents", 6.0, "test", ts)
+
+    real_solve = backtest_lab.solve
+    solves: list[int] = []
+
+    def counting_solve(*args, **kwargs):
+        solves.append(1)
+        return real_solve(*args, **kwargs)
+
+    monkeypatch.setattr(backtest_lab, "solve", counting_solve)
+    config = AppConfig()
+    config.planning.horizon_hours = 2
+
+    result = await run_backtest(
+        repo=repo,
+        config=config,
+        start=start,
+        end=start + timedelta(minutes=30 * 95),
+    )
+
+    assert result.summary.slots == 96
+    assert len(solves) < 96
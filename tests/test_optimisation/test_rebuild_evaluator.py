@@ -448,3 +448,64 @@ class TestMixedBehaviours:
         # Should NOT rebuild (deviation below threshold)
         assert result.should_rebuild is False
         assert result.trigger != "actuals_deviation"
+
+
+# ═══════════════════════════════════════════════════════════════
+# Expected-SOC interpolation
+# ═══════════════════════════════════════════════════════════════
+
+
+class TestInterpolatedExpectedSoc:
+    def test_new_plan_replaces_cached_slot_start(self) -> None:
+        evaluator = RebuildEvaluator(_make_tou_config())
+        low = _make_plan()
+        low.metrics = {"current_soc": 0.1}
+        high = _make_plan()
+        high.metrics = {"current_soc": 0.9}
+        slot_low = low.get_current_slot()
+        slot_high = high.get_current_slot()
+        assert slot_low is not None and slot_high is not None
+
+        first = evaluator._interpolated_expected_soc(low, slot_low)
+        again = evaluator._interpolated_expected_soc(low, slot_low)
+        other = evaluator._interpolated_expected_soc(high, slot_high)
+
+        assert first == pytest.approx(again, abs=1e-3)
+        assert 0.1 <= first <= slot_low.expected_soc
+        assert slot_high.expected_soc <= other <= 0.9
+
+
+# ═══════════════════════════════════════════════════════════════
+# Idle verdict reuse
+# ═══════════════════════════════════════════════════════════════
+
+
+class TestIdleVerdictReuse:
+    def _idle_evaluator(self) -> tuple[RebuildEvaluator, OptimisationPlan, Mock]:
+        evaluator = RebuildEvaluator(_make_amber_config())
+        evaluator.mark_rebuilt("periodic")
+        plan = _make_plan()
+        aggregator = _make_aggregator(stale=False)
+        assert evaluator.evaluate(plan, 0.5, aggregator).should_rebuild is False
+        # Staleness is only re-checked once the inputs change
+        aggregator.is_stale.return_value = True
+        return evaluator, plan, aggregator
+
+    def test_unchanged_inputs_reuse_verdict(self) -> None:
+        evaluator, plan, aggregator = self._idle_evaluator()
+        assert evaluator.evaluate(plan, 0.501, aggregator).should_rebuild is False
+
+    def test_changed_soc_reevaluates(self) -> None:
+        evaluator, plan, aggregator = self._idle_evaluator()
+        result = evaluator.evaluate(plan, 0.51, aggregator)
+        assert result.should_rebuild is True
+        assert result.trigger == "forecast_delta"
+
+    def test_new_plan_reevaluates(self) -> None:
+        evaluator, _, aggregator = self._idle_evaluator()
+        assert evaluator.evaluate(_make_plan(), 0.5, aggregator).should_rebuild is True
+
+    def test_mark_rebuilt_clears_verdict(self) -> None:
+        evaluator, plan, aggregator = self._idle_evaluator()
+        evaluator.mark_rebuilt("forecast_delta")
+        assert evaluator.evaluate(plan, 0.5, aggregator).should_rebuild is True
@@ -4,11 +4,20 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
+import pulp
 import pytest
 
 from power_master.config.schema import AppConfig
-from power_master.optimisation.plan import SlotMode
-from power_master.optimisation.solver import SolverInputs, dampen_price_weighted, solve
+from power_master.optimisation import solver as solver_module
+from power_master.optimisation.plan import OptimisationPlan, PlanSlot, SlotMode
+from power_master.optimisation.solver import (
+    SolverInputs,
+    dampen_price_weighted,
+    dampen_prices_weighted,
+    previous_soc_from_plan,
+    solve,
+    warm_start_from_plan,
+)
 
 
 def _make_inputs(
@@ -56,6 +65,108 @@ class TestSolverBasic:
         assert plan.solver_time_ms >= 0
         assert plan.metrics["status"] in ("Optimal", "Not Solved")
 
+    def test_warm_start_reaches_cold_objective(self) -> None:
+        config = AppConfig()
+        inputs = _make_inputs(n_slots=16, solar=3000.0, import_price=30.0)
+        cold = solve(config, inputs)
+
+        inputs.warm_start_charging = [True] * 8 + [False] * 8
+        warm = solve(config, inputs)
+
+        assert warm.metrics["status"] == "Optimal"
+        assert warm.objective_score == pytest.approx(cold.objective_score, abs=0.01)
+
+    def test_warm_start_from_shifted_plan(self) -> None:
+        config = AppConfig()
+        inputs = _make_inputs(n_slots=8, import_price=30.0)
+        previous = solve(config, inputs)
+        socs = [s.expected_soc for s in previous.slots]
+
+        # Horizon moved on by two slots and extends past the old plan
+        shifted = inputs.slot_start_times[2:] + [
+            inputs.slot_start_times[-1] + timedelta(minutes=30 * k) for k in (1, 2)
+        ]
+        hint = warm_start_from_plan(previous, shifted, socs[1])
+
+        expected = [socs[t] > socs[t - 1] for t in range(2, 8)]
+        assert hint == expected + [expected[-1]] * 2
+
+    def test_warm_start_from_plan_without_overlap(self) -> None:
+        config = AppConfig()
+        inputs = _make_inputs(n_slots=4)
+        previous = solve(config, inputs)
+        later = [s + timedelta(days=1) for s in inputs.slot_start_times]
+
+        assert warm_start_from_plan(previous, later, 0.5) is None
+
+    def test_warm_start_from_plan_by_offset(self) -> None:
+        config = AppConfig()
+        inputs = _make_inputs(n_slots=8, import_price=30.0)
+        previous = solve(config, inputs)
+        socs = [s.expected_soc for s in previous.slots]
+
+        # A plan reused on another day: times do not match, offsets do
+        later = [s + timedelta(days=1) for s in inputs.slot_start_times]
+        hint = warm_start_from_plan(previous, later, socs[5], offset=6)
+
+        expected = [socs[6] > socs[5], socs[7] > socs[6]]
+        assert hint == expected + [expected[-1]] * 6
+
+    def test_fix_tail_slots_pins_previous_soc(self) -> None:
+        config = AppConfig()
+        inputs = _make_inputs(n_slots=8, import_price=30.0)
+        previous = solve(config, inputs)
+
+        # Horizon moved on by two slots; the last one is beyond the old plan
+        shifted = inputs.slot_start_times[2:] + [
+            inputs.slot_start_times[-1] + timedelta(minutes=30 * k) for k in (1, 2)
+        ]
+        prev_soc = previous_soc_from_plan(previous, shifted)
+        assert prev_soc[-2:] == [None, None]
+
+        config.planning.fix_tail_slots = 4
+        rolled = _make_inputs(n_slots=8, import_price=30.0, start=shifted[0])
+        rolled.current_soc = previous.slots[1].expected_soc
+        rolled.previous_soc = prev_soc
+        plan = solve(config, rolled)
+
+        assert plan.metrics["status"] == "Optimal"
+        for t in (4, 5):
+            assert plan.slots[t].expected_soc == pytest.approx(prev_soc[t], abs=0.006)
+
+    def test_highs_backend_matches_cbc_objective(self) -> None:
+        pytest.importorskip("highspy")
+        config = AppConfig()
+        inputs = _make_inputs(n_slots=8, import_price=30.0)
+        cbc = solve(config, inputs)
+
+        config.planning.solver = "highs"
+        plan = solve(config, inputs)
+
+        assert plan.metrics["status"] == "Optimal"
+        assert plan.objective_score == pytest.approx(cbc.objective_score, abs=0.01)
+
+    def test_unavailable_backend_falls_back_to_cbc(self, monkeypatch, caplog) -> None:
+        class _Missing:
+            def __init__(self, *args) -> None:
+                pass
+
+            def available(self) -> bool:
+                return False
+
+        monkeypatch.setitem(solver_module.SOLVER_REGISTRY, "highs", _Missing)
+        solver_module._solver_available.cache_clear()
+        try:
+            with caplog.at_level("WARNING", logger="power_master.optimisation.solver"):
+                first = solver_module._make_solver("highs", 10, False)
+                second = solver_module._make_solver("highs", 10, False)
+        finally:
+            solver_module._solver_available.cache_clear()
+
+        assert isinstance(first, pulp.PULP_CBC_CMD)
+        assert isinstance(second, pulp.PULP_CBC_CMD)
+        assert sum("falling back to CBC" in r.message for r in caplog.records) == 1
+
     def test_solver_respects_soc_limits(self) -> None:
         config = AppConfig()
         inputs = _make_inputs(soc=0.5)
@@ -583,6 +694,17 @@ class TestPriceDampening:
         assert near > far
         assert near == pytest.approx(price)
 
+    @pytest.mark.parametrize("n_slots", [0, 1, 2, 7, 96])
+    def test_series_matches_per_slot_dampening(self, n_slots: int) -> None:
+        prices = [(37.0 * t) % 450.0 for t in range(n_slots)]
+
+        series = dampen_prices_weighted(prices, 100, 0.3)
+
+        assert series == [
+            dampen_price_weighted(p, 100, 0.3, slot_index=t, n_slots=n_slots)
+            for t, p in enumerate(prices)
+        ]
+
 
 class TestSolverSpike:
     def test_spike_blocks_charging(self) -> None:
@@ -636,6 +758,29 @@ class TestPlanModel:
         assert current is not None
         assert 0 <= current.index <= 1  # Could be 0 or 1 depending on timing
 
+    def test_get_slot_at_boundaries_and_gaps(self) -> None:
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        slots = [
+            PlanSlot(index=i, start=base + timedelta(minutes=30 * k),
+                     end=base + timedelta(minutes=30 * (k + 1)), mode=SlotMode.SELF_USE)
+            for i, k in enumerate([0, 1, 3])  # gap at 01:00–01:30
+        ]
+        plan = OptimisationPlan(
+            version=1, created_at=base, trigger_reason="test", horizon_start=base,
+            horizon_end=base + timedelta(hours=2), slots=slots, objective_score=0.0, solver_time_ms=0,
+        )
+
+        assert plan.get_slot_at(base) is slots[0]
+        assert plan.get_slot_at(base + timedelta(minutes=30)) is slots[1]
+        assert plan.get_slot_at(base + timedelta(minutes=70)) is None
+        assert plan.get_slot_at(base + timedelta(minutes=100)) is slots[2]
+        assert plan.get_slot_at(base + timedelta(hours=2)) is None
+        assert plan.get_slot_at(base - timedelta(seconds=1)) is None
+
+        # Replacing the slot list re-indexes it
+        plan.slots = slots[:1]
+        assert plan.get_slot_at(base + timedelta(minutes=30)) is None
+
     def test_to_db_dict(self) -> None:
         config = AppConfig()
         inputs = _make_inputs(n_slots=4)
@@ -656,6 +801,43 @@ class TestPlanModel:
         assert all("slot_index" in s for s in slot_dicts)
         assert all("operating_mode" in s for s in slot_dicts)
 
+    def test_from_db_round_trip(self) -> None:
+        import json
+
+        config = AppConfig()
+        inputs = _make_inputs(n_slots=4, spike_slots=[1])
+        plan = solve(config, inputs)
+        plan.slots[2].allow_charge_at_max_soc = True
+
+        row = {
+            **plan.to_db_dict(),
+            "created_at": plan.created_at.isoformat(),
+            "metrics_json": json.dumps(plan.metrics),
+            "active_constraints_json": json.dumps(plan.active_constraints),
+            "reserve_state_json": None,
+        }
+        slot_rows = []
+        for d in plan.slots_to_db_dicts():
+            flags = d.pop("constraint_flags")
+            d.pop("scheduled_loads")
+            slot_rows.append({
+                **d,
+                "constraint_flags": json.dumps(flags) if flags else None,
+                "scheduled_loads_json": None,
+            })
+
+        restored = OptimisationPlan.from_db(row, slot_rows)
+        assert restored.version == plan.version
+        assert restored.horizon_start == plan.horizon_start
+        assert restored.metrics == plan.metrics
+        assert [s.mode for s in restored.slots] == [s.mode for s in plan.slots]
+        assert [s.constraint_flags for s in restored.slots] == [
+            s.constraint_flags for s in plan.slots
+        ]
+        assert [s.allow_charge_at_max_soc for s in restored.slots] == [
+            False, False, True, False,
+        ]
+
 
 class TestGridChargePolicy:
     """Tests for the grid-charge policy (free-window + solar only vs allow arbitrage)."""
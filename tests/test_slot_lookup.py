@@ -0,0 +1,52 @@
+"""Tests for bulk time → slot lookup."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from power_master.slot_lookup import match_slots
+
+BASE = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class _Slot:
+    start: datetime
+    end: datetime
+    name: str = ""
+
+
+def _slot(start_min: int, end_min: int, name: str = "") -> _Slot:
+    return _Slot(BASE + timedelta(minutes=start_min), BASE + timedelta(minutes=end_min), name)
+
+
+def _linear(slots, times):
+    return [next((s for s in slots if s.start <= t < s.end), None) for t in times]
+
+
+class TestMatchSlots:
+    def test_empty_slots(self) -> None:
+        assert match_slots([], [BASE, BASE]) == [None, None]
+
+    def test_half_open_bounds_and_gaps(self) -> None:
+        slots = [_slot(60, 90, "b"), _slot(0, 30, "a")]
+        times = [BASE + timedelta(minutes=m) for m in (0, 29, 30, 59, 60, 89, 90)]
+        names = [s.name if s else None for s in match_slots(slots, times)]
+        assert names == ["a", "a", None, None, "b", "b", None]
+
+    def test_overlap_keeps_first_match_in_list(self) -> None:
+        slots = [_slot(30, 90, "wide"), _slot(0, 60, "early")]
+        times = [BASE + timedelta(minutes=m) for m in range(0, 100, 10)]
+        assert match_slots(slots, times) == _linear(slots, times)
+
+    def test_naive_times_are_utc(self) -> None:
+        slots = [_slot(0, 30, "a")]
+        naive = (BASE + timedelta(minutes=10)).replace(tzinfo=None)
+        assert match_slots(slots, [naive])[0] is slots[0]
+
+    def test_precomputed_epochs_match_times(self) -> None:
+        slots = [_slot(60, 90, "b"), _slot(0, 30, "a")]
+        times = [BASE + timedelta(minutes=m) for m in range(0, 100, 5)]
+        epochs = [t.timestamp() for t in times]
+        assert match_slots(slots, times, epochs) == match_slots(slots, times)
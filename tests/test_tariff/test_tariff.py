@@ -95,6 +95,21 @@ class TestTariffSchedule:
         )
         assert schedule.get_slot_at(_now()) is None
 
+    def test_get_slots_at_matches_get_slot_at(self) -> None:
+        base = _now().replace(minute=0, second=0, microsecond=0)
+        slots = [
+            TariffSlot(
+                start=base + timedelta(minutes=30 * k),
+                end=base + timedelta(minutes=30 * (k + 1)),
+                import_price_cents=float(k),
+                export_price_cents=1.0,
+            )
+            for k in (3, 0, 2, 5)  # Unsorted, with a gap at k=1 and k=4
+        ]
+        schedule = TariffSchedule(slots=slots)
+        times = [base + timedelta(minutes=15 + 30 * k) for k in range(-1, 7)]
+        assert schedule.get_slots_at(times) == [schedule.get_slot_at(t) for t in times]
+
 
 class TestTariffScheduleTimezones:
     """Test get_slot_at() with different timezone inputs."""